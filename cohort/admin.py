@@ -19,7 +19,7 @@ Cohort app admin site.
 
 from django.contrib import admin
 from faculty.models import Assignment
-from cohort.models import Cohort, Course, Capstone, CalendarEvent
+from cohort.models import Semester, Cohort, Course, Capstone, CalendarEvent
 
 
 ##########################################################################
@@ -43,6 +43,7 @@ class CourseAdmin(admin.ModelAdmin):
 ## Register your models here
 ##########################################################################
 
+admin.site.register(Semester)
 admin.site.register(Cohort)
 admin.site.register(Capstone)
 admin.site.register(CalendarEvent)
@@ -0,0 +1,241 @@
+# cohort.availability
+# Saturday-indexed free/busy bitsets for faculty, cohorts, and holidays.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Mon Oct 19 11:02:36 2026 -0400
+#
+# Copyright (C) 2026 Georgetown University
+# For license information, see LICENSE.txt
+#
+# ID: availability.py [] benjamin@bengfort.com $
+
+"""
+Saturday-indexed free/busy bitsets for faculty, cohorts, and holidays.
+
+Courses are scheduled around Saturdays, so the availability of a faculty member or a
+cohort in a year can be stored as an integer with one bit per Saturday (bit 0 is the
+first Saturday of the year). Every calendar event is mapped to its Saturday using the
+same rules as CalendarEvent.saturday, and set queries such as "which Saturdays are
+free for these instructors and this cohort" are answered with bitwise operations.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import pytz
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+
+from webfolio import cache as versions
+from cohort.models import TIMEZONES, saturday
+
+
+CACHE_KEY = "availability:{version}:{year}"
+CACHE_VERSION_KEY = "availability:version"
+CACHE_TIMEOUT = 60 * 60 * 24
+
+
+##########################################################################
+## Availability Bitsets
+##########################################################################
+
+class Availability(object):
+    """
+    Busy bitsets for a consecutive run of Saturdays, starting on the Saturday
+    specified by first. The faculty and cohorts dictionaries map primary keys to the
+    busy bitset of the faculty member or cohort, holidays is the holiday bitset.
+    """
+
+    def __init__(self, first, weeks, faculty=None, cohorts=None, holidays=0):
+        if first.weekday() != 5:
+            raise ValueError("availability must start on a Saturday")
+
+        self.first = first
+        self.weeks = weeks
+        self.faculty = faculty or {}
+        self.cohorts = cohorts or {}
+        self.holidays = holidays
+
+    @classmethod
+    def year(cls, year):
+        """
+        Returns an empty availability for all of the Saturdays in the year.
+        """
+        first = saturday(date(year, 1, 1))
+        if first.year != year:
+            first += timedelta(days=7)
+        return cls(first, (date(year, 12, 31) - first).days // 7 + 1)
+
+    @classmethod
+    def merge(cls, *spans):
+        """
+        Combines the availabilities of consecutive spans (e.g. years) into a single
+        availability so that queries can cross year boundaries.
+        """
+        spans = sorted(spans, key=lambda span: span.first)
+        merged = cls(spans[0].first, 0)
+        for span in spans:
+            if span.first != merged.last + timedelta(days=7):
+                raise ValueError("can only merge consecutive availabilities")
+
+            offset = merged.weeks
+            merged.weeks += span.weeks
+            merged.holidays |= span.holidays << offset
+            for attr in ("faculty", "cohorts"):
+                target = getattr(merged, attr)
+                for key, bits in getattr(span, attr).items():
+                    target[key] = target.get(key, 0) | (bits << offset)
+        return merged
+
+    @property
+    def last(self):
+        return self.first + timedelta(days=7 * (self.weeks - 1))
+
+    @property
+    def full(self):
+        """
+        Bitset with every Saturday in the span set.
+        """
+        return (1 << self.weeks) - 1
+
+    def index(self, day):
+        """
+        Returns the bit index of the Saturday associated with the day or None if the
+        day is not in the span of this availability.
+        """
+        idx = (saturday(day) - self.first).days // 7
+        if 0 <= idx < self.weeks:
+            return idx
+        return None
+
+    def day(self, idx):
+        return self.first + timedelta(days=7 * idx)
+
+    def days(self, bits):
+        """
+        Returns the Saturdays whose bits are set in the bitset.
+        """
+        days = []
+        while bits:
+            low = bits & -bits
+            days.append(self.day(low.bit_length() - 1))
+            bits ^= low
+        return days
+
+    def mark(self, bits, day):
+        """
+        Returns the bitset with the Saturday of the specified day set.
+        """
+        idx = self.index(day)
+        if idx is None:
+            return bits
+        return bits | (1 << idx)
+
+    def busy(self, faculty=(), cohorts=(), holidays=True):
+        """
+        Returns the bitset of Saturdays when any of the specified faculty or cohorts
+        are busy, including holidays unless specified otherwise.
+        """
+        bits = self.holidays if holidays else 0
+        for pk in faculty:
+            bits |= self.faculty.get(pk, 0)
+        for pk in cohorts:
+            bits |= self.cohorts.get(pk, 0)
+        return bits
+
+    def free(self, faculty=(), cohorts=(), holidays=True):
+        """
+        Returns the bitset of Saturdays when all of the faculty and cohorts are free.
+        """
+        return self.full & ~self.busy(faculty, cohorts, holidays)
+
+    def is_free(self, day, faculty=(), cohorts=(), holidays=True):
+        idx = self.index(day)
+        if idx is None:
+            raise ValueError("{} is not in the availability span".format(day))
+        return bool(self.free(faculty, cohorts, holidays) >> idx & 1)
+
+
+##########################################################################
+## Building and Caching
+##########################################################################
+
+def get_availability(year):
+    """
+    Returns the availability for the year from the cache, building it if necessary.
+    """
+    key = CACHE_KEY.format(version=versions.get_version(CACHE_VERSION_KEY), year=year)
+    availability = cache.get(key)
+    if availability is None:
+        availability = build_availability(year)
+        cache.set(key, availability, CACHE_TIMEOUT)
+    return availability
+
+
+def get_span(start, end):
+    """
+    Returns the merged availability of every year from start to end inclusive.
+    """
+    return Availability.merge(*[get_availability(y) for y in range(start, end + 1)])
+
+
+def invalidate():
+    """
+    Invalidates all cached availabilities, e.g. when calendar events are modified.
+    """
+    versions.invalidate(CACHE_VERSION_KEY)
+
+
+def build_availability(year):
+    """
+    Builds the availability of the year with two queries: one for the calendar events
+    (for holidays and cohorts) and one for the faculty attending the events.
+    """
+    CalendarEvent = apps.get_model(app_label="cohort", model_name="CalendarEvent")
+    availability = Availability.year(year)
+
+    # Events on the Monday before the first Saturday through the Sunday after the last
+    # Saturday map to Saturdays in the year; pad by a day for timezone differences.
+    tz = pytz.timezone(settings.TIME_ZONE)
+    after = tz.localize(datetime.combine(
+        availability.first - timedelta(days=6), datetime.min.time()
+    ))
+    before = tz.localize(datetime.combine(
+        availability.last + timedelta(days=3), datetime.min.time()
+    ))
+
+    events = CalendarEvent.objects.filter(
+        start__gte=after, start__lt=before
+    ).order_by().values_list("start", "timezone", "is_holiday", "course__cohort_id")
+
+    cohorts = defaultdict(int)
+    for start, timezone, is_holiday, cohort in events:
+        day = local_date(start, timezone)
+        if is_holiday:
+            availability.holidays = availability.mark(availability.holidays, day)
+        elif cohort is not None:
+            cohorts[cohort] = availability.mark(cohorts[cohort], day)
+
+    Attendee = CalendarEvent.attendees.through
+    attendees = Attendee.objects.filter(
+        calendarevent__start__gte=after, calendarevent__start__lt=before,
+    ).order_by().values_list(
+        "faculty_id", "calendarevent__start", "calendarevent__timezone"
+    )
+
+    faculty = defaultdict(int)
+    for pk, start, timezone in attendees:
+        faculty[pk] = availability.mark(faculty[pk], local_date(start, timezone))
+
+    availability.cohorts = dict(cohorts)
+    availability.faculty = dict(faculty)
+    return availability
+
+
+def local_date(dt, timezone):
+    return dt.astimezone(pytz.timezone(TIMEZONES[timezone])).date()
@@ -0,0 +1,207 @@
+# cohort.changes
+# A change feed of the schedule for incremental synchronization.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Mon Oct 19 23:41:15 2026 -0400
+#
+# Copyright (C) 2026 Georgetown University
+# For license information, see LICENSE.txt
+#
+# ID: changes.py [] benjamin@bengfort.com $
+
+"""
+A change feed of the schedule for incremental synchronization.
+
+Clients that mirror the schedule request the changes since the cursor returned by their
+last request and receive the objects that were created or modified (upserts) and the
+objects that were deleted (from the tombstones) since then, ordered by their modified
+timestamp. Each stream is read with a keyset query on its indexed modified column, so
+the cost of a sync is proportional to the number of changes rather than to the size of
+the schedule.
+
+Changes from the last few seconds are held back (see SETTLE) so that a transaction that
+commits after a later one cannot be skipped by a client whose cursor has moved past its
+timestamp. Changes with the same timestamp are ordered by stream and primary key.
+
+The modified timestamps are set when the rows are written rather than when their
+transaction commits, so a change whose transaction commits more than SETTLE after it
+was written (e.g. a long running import) can still be missed by clients that synced in
+the meantime. Such imports should be followed by a full sync of the affected clients.
+
+Deleted objects are published with the same type of id as their upserts.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import json
+import base64
+import binascii
+
+from datetime import timedelta
+from django.apps import apps
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.module_loading import import_string
+from django.utils.dateparse import parse_datetime
+
+
+# Changes newer than this window are not published until their transactions settle
+SETTLE = timedelta(seconds=5)
+
+# The streams in the order that changes with the same timestamp are published
+STREAMS = (
+    ("cohort", "cohort.Cohort", "cohort.serializers.CohortSerializer"),
+    ("course", "cohort.Course", "cohort.serializers.CourseSerializer"),
+    ("faculty", "faculty.Faculty", "faculty.serializers.FacultySerializer"),
+    ("assignment", "faculty.Assignment", "faculty.serializers.AssignmentSerializer"),
+    ("event", "cohort.CalendarEvent", "cohort.serializers.CalendarEventSerializer"),
+)
+
+UPSERT = "upsert"
+DELETE = "delete"
+TOMBSTONES = len(STREAMS)
+
+
+def stream_name(model):
+    """
+    Returns the name of the change feed stream of the model.
+    """
+    for name, label, _ in STREAMS:
+        if model._meta.label == label:
+            return name
+    raise ValueError("{} is not published in the change feed".format(model._meta.label))
+
+
+##########################################################################
+## Cursors
+##########################################################################
+
+def encode_cursor(position):
+    """
+    Encodes the (timestamp, stream, pk) position of the last change that a client has
+    received as an opaque cursor.
+    """
+    if position is None:
+        return None
+    ts, stream, pk = position
+    data = json.dumps([ts.isoformat(), stream, str(pk)]).encode("utf-8")
+    return base64.urlsafe_b64encode(data).decode("ascii")
+
+
+def decode_cursor(cursor):
+    """
+    Decodes a cursor into a (timestamp, stream, pk) position, raising a ValueError if
+    the cursor is not valid.
+    """
+    if not cursor:
+        return None
+
+    try:
+        ts, stream, pk = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        ts = parse_datetime(ts)
+    except (binascii.Error, UnicodeError, TypeError, ValueError):
+        raise ValueError("invalid change feed cursor")
+
+    if ts is None or not isinstance(stream, int) or not 0 <= stream <= TOMBSTONES:
+        raise ValueError("invalid change feed cursor")
+    return ts, stream, pk
+
+
+##########################################################################
+## Change Feed
+##########################################################################
+
+def get_changes(since=None, limit=100, request=None):
+    """
+    Returns the next changes after the since cursor (or from the beginning if since is
+    None), at most limit of them. The result contains the ordered list of changes, the
+    cursor to request the next changes with, and whether more changes are available.
+    """
+    position = decode_cursor(since)
+    until = timezone.now() - SETTLE
+
+    # Fetch the keys of the next changes of every stream and merge them
+    keys = []
+    for idx, (name, label, _) in enumerate(STREAMS):
+        model = apps.get_model(label)
+        query = window(model.objects.all(), "modified", idx, position, until)
+        keys.extend(
+            (ts, idx, pk) for pk, ts in query.values_list("pk", "modified")[:limit + 1]
+        )
+
+    Tombstone = apps.get_model(app_label="cohort", model_name="Tombstone")
+    query = window(Tombstone.objects.all(), "deleted", TOMBSTONES, position, until)
+    rows = query.values_list("pk", "deleted")[:limit + 1]
+    keys.extend((ts, TOMBSTONES, pk) for pk, ts in rows)
+
+    # The pks are only compared within a stream so mixed types are never compared
+    keys.sort()
+    more = len(keys) > limit
+    keys = keys[:limit]
+
+    # Load the changed objects with one query per stream that has changes
+    objects = {}
+    for idx, (name, label, serializer) in enumerate(STREAMS):
+        pks = [pk for _, stream, pk in keys if stream == idx]
+        if pks:
+            serializer = import_string(serializer)
+            model = apps.get_model(label)
+            query = model.objects.filter(pk__in=pks)
+            query = serializer.optimize_queryset(query, request)
+            context = {"request": request}
+            for obj in query:
+                objects[(idx, obj.pk)] = serializer(obj, context=context).data
+
+    tombstones = {}
+    pks = [pk for _, stream, pk in keys if stream == TOMBSTONES]
+    if pks:
+        tombstones = Tombstone.objects.in_bulk(pks)
+
+    # Tombstones store the deleted primary keys as strings
+    pk_fields = {name: apps.get_model(label)._meta.pk for name, label, _ in STREAMS}
+
+    changes = []
+    for ts, idx, pk in keys:
+        if idx == TOMBSTONES:
+            tombstone = tombstones[pk]
+            object_id = tombstone.object_id
+            if tombstone.model in pk_fields:
+                object_id = pk_fields[tombstone.model].to_python(object_id)
+
+            changes.append({
+                "op": DELETE, "type": tombstone.model, "id": object_id,
+                "timestamp": ts,
+            })
+        elif (idx, pk) in objects:
+            # Objects deleted since their keys were fetched are published by tombstones
+            changes.append({
+                "op": UPSERT, "type": STREAMS[idx][0], "id": pk, "timestamp": ts,
+                "data": objects[(idx, pk)],
+            })
+
+    return {
+        "changes": changes,
+        "cursor": encode_cursor(keys[-1]) if keys else since,
+        "more": more,
+    }
+
+
+def window(queryset, field, stream, position, until):
+    """
+    Filters the queryset to the rows of the stream after the position (ordered by the
+    timestamp field and pk) that are older than the settle window.
+    """
+    queryset = queryset.filter(**{f"{field}__lte": until})
+    if position is not None:
+        ts, after, pk = position
+        if stream > after:
+            queryset = queryset.filter(**{f"{field}__gte": ts})
+        elif stream < after:
+            queryset = queryset.filter(**{f"{field}__gt": ts})
+        else:
+            queryset = queryset.filter(
+                Q(**{f"{field}__gt": ts}) | Q(**{field: ts, "pk__gt": pk})
+            )
+    return queryset.order_by(field, "pk")
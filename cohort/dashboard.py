@@ -0,0 +1,305 @@
+# cohort.dashboard
+# Precomputed snapshots of the overview dashboard.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Mon Oct 19 16:12:37 2026 -0400
+#
+# Copyright (C) 2026 Georgetown University
+# For license information, see LICENSE.txt
+#
+# ID: dashboard.py [] benjamin@bengfort.com $
+
+"""
+Precomputed snapshots of the overview dashboard.
+
+The overview is the landing page for every user, but almost everything on it only
+changes when a course, cohort, or assignment is modified or when the day rolls over
+(since what is current or upcoming depends on the date). Rather than recomputing the
+dashboard on every request, a snapshot of the rendered context is stored once per day
+in the DashboardSnapshot table. Writes to the underlying models rebuild the snapshot in
+a background thread once their transaction commits and no other writes have followed
+for a moment (so that a burst of writes causes a single rebuild), and the first view on
+a new day builds that day's snapshot if the refreshdashboard command has not already
+done so.
+
+Management commands exit before a background rebuild could finish, so commands that
+write run inside a synchronous() block, which rebuilds the snapshot once in the calling
+thread at the end of the block if any of its writes requested a refresh.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import time
+import logging
+import threading
+
+from datetime import date
+from contextlib import contextmanager
+from django.apps import apps
+from collections import defaultdict
+from django.db import connection, transaction
+from django.db.models import Q, Count, Min, Prefetch, prefetch_related_objects
+
+
+logger = logging.getLogger("cohort.dashboard")
+
+# Coalesces concurrent refresh requests into a single background rebuild
+_refreshing = threading.Lock()
+_pending = threading.Event()
+
+# Seconds without further refresh requests before rebuilding, and the longest that a
+# steady stream of requests can postpone the rebuild
+REFRESH_DELAY = 2
+REFRESH_MAX_DELAY = 30
+
+# Tracks the synchronous() blocks of each thread and whether they requested a refresh
+_synchronous = threading.local()
+
+
+##########################################################################
+## Snapshot Access
+##########################################################################
+
+def get_snapshot(today=None):
+    """
+    Returns the dashboard context for the day, building it if it does not exist yet.
+    """
+    DashboardSnapshot = apps.get_model(
+        app_label="cohort", model_name="DashboardSnapshot"
+    )
+    today = today or date.today()
+    snapshot = DashboardSnapshot.objects.filter(date=today).only("data").first()
+    if snapshot is None:
+        return refresh(today)
+    return snapshot.data
+
+
+def refresh(today=None):
+    """
+    Builds and stores the dashboard snapshot for the day, removing the snapshots of
+    earlier days, and returns the rebuilt dashboard context.
+    """
+    DashboardSnapshot = apps.get_model(
+        app_label="cohort", model_name="DashboardSnapshot"
+    )
+    today = today or date.today()
+    data = build_snapshot(today)
+
+    with transaction.atomic():
+        DashboardSnapshot.objects.update_or_create(date=today, defaults={"data": data})
+        DashboardSnapshot.objects.filter(date__lt=today).delete()
+    return data
+
+
+def schedule_refresh(sync=False):
+    """
+    Rebuilds the snapshot once the current transaction commits: in the calling thread
+    if sync is True, at the end of the enclosing synchronous() block if there is one,
+    and otherwise in the background.
+    """
+    if sync:
+        transaction.on_commit(refresh)
+    elif getattr(_synchronous, "depth", 0) > 0:
+        transaction.on_commit(_request_synchronous)
+    else:
+        transaction.on_commit(refresh_async)
+
+
+@contextmanager
+def synchronous():
+    """
+    Defers the refreshes requested by the writes within the block (e.g. by the signals
+    of a management command) and rebuilds the snapshot once in the calling thread
+    when the outermost block exits, rather than in a background thread that would be
+    killed when the process exits.
+    """
+    depth = getattr(_synchronous, "depth", 0)
+    if depth == 0:
+        _synchronous.requested = False
+
+    _synchronous.depth = depth + 1
+    try:
+        yield
+    finally:
+        _synchronous.depth = depth
+        if depth == 0 and _synchronous.requested:
+            _synchronous.requested = False
+            refresh()
+
+
+def _request_synchronous():
+    # The transaction may commit after the block that requested the refresh has exited
+    if getattr(_synchronous, "depth", 0) > 0:
+        _synchronous.requested = True
+    else:
+        refresh_async()
+
+
+def refresh_async():
+    """
+    Starts a background rebuild of the snapshot unless one is already running, in
+    which case the running thread rebuilds again once it has finished.
+    """
+    _pending.set()
+    if _refreshing.acquire(blocking=False):
+        threading.Thread(
+            target=_refresh_worker, name="refreshdashboard", daemon=True
+        ).start()
+
+
+def _refresh_worker():
+    try:
+        while _pending.is_set():
+            _pending.clear()
+            _debounce()
+            try:
+                refresh()
+            except Exception:
+                logger.exception("could not refresh the dashboard snapshot")
+    finally:
+        connection.close()
+        _refreshing.release()
+
+    # A refresh may have been requested after the loop exited but before the release
+    if _pending.is_set():
+        refresh_async()
+
+
+def _debounce():
+    """
+    Waits until no refresh has been requested for REFRESH_DELAY seconds (but no longer
+    than REFRESH_MAX_DELAY) so that the writes of a request are rebuilt together.
+    """
+    deadline = time.monotonic() + REFRESH_MAX_DELAY
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0 or not _pending.wait(min(REFRESH_DELAY, remaining)):
+            return
+        _pending.clear()
+
+
+##########################################################################
+## Snapshot Construction
+##########################################################################
+
+def build_snapshot(today=None):
+    """
+    Computes the overview dashboard context as plain data that can be stored as JSON
+    using a fixed number of queries.
+    """
+    Cohort = apps.get_model(app_label="cohort", model_name="Cohort")
+    today = today or date.today()
+
+    snapshot = get_counters(today)
+    cohorts = list(Cohort.objects.order_by("end").filter(end__gte=today))
+    snapshot["cohort_progress"] = get_cohort_progress(cohorts, today)
+    snapshot["current_cohorts"] = get_current_cohorts(cohorts, today)
+    snapshot["scheduled_semesters"] = get_scheduled_semesters(today)
+    return snapshot
+
+
+def get_counters(today):
+    """
+    Computes the at-a-glance course counters in a single aggregate query.
+    """
+    Course = apps.get_model(app_label="cohort", model_name="Course")
+    return Course.objects.aggregate(
+        next_capstone_presentations=Min(
+            "end", filter=Q(title__startswith="Applied", end__gt=today)
+        ),
+        num_active_courses=Count("id", filter=Q(start__lte=today, end__gte=today)),
+        num_upcoming_courses=Count("id", filter=Q(start__gt=today)),
+    )
+
+
+def get_cohort_progress(cohorts, today):
+    """
+    Returns the progress of the most recent cohort that has started.
+    """
+    current = [c for c in cohorts if c.start and c.start <= today]
+    if not current:
+        return None
+
+    cohort = max(current, key=lambda c: c.cohort)
+    return {
+        "pcent": cohort.percent_complete(),
+        "cohort": cohort.cohort,
+    }
+
+
+def get_current_cohorts(cohorts, today):
+    """
+    Returns the next three cohorts to end with their courses and advisors.
+    """
+    Course = apps.get_model(app_label="cohort", model_name="Course")
+    Assignment = apps.get_model(app_label="faculty", model_name="Assignment")
+
+    cohorts = [c for c in cohorts if c.end > today][0:3]
+    courses = Course.objects.order_by("start").prefetch_related(instructors_prefetch())
+    advisors = Assignment.objects.advisors().select_related("faculty")
+
+    prefetch_related_objects(
+        cohorts,
+        Prefetch("courses", queryset=courses),
+        Prefetch(
+            "instructional_assignments", queryset=advisors.order_by("start"),
+            to_attr="advisor_assignments",
+        ),
+    )
+
+    return [
+        {
+            "cohort": cohort.cohort,
+            "semester": cohort.get_semester_display(),
+            "percent_complete": cohort.percent_complete(),
+            "advisors": [
+                {
+                    "role": advisor.get_role_display(),
+                    "name": advisor.faculty.get_full_name(),
+                    "start": advisor.start,
+                    "end": advisor.end,
+                }
+                for advisor in cohort.advisor_assignments
+            ],
+            "courses": [serialize_course(course) for course in cohort.courses.all()],
+        }
+        for cohort in cohorts
+    ]
+
+
+def get_scheduled_semesters(today):
+    """
+    Returns the non-cohort courses of every scheduled semester in chronological
+    order, fetching the courses of all semesters in a single query.
+    """
+    Course = apps.get_model(app_label="cohort", model_name="Course")
+    Semester = apps.get_model(app_label="cohort", model_name="Semester")
+
+    semesters = list(Semester.objects.scheduled(today))
+    if not semesters:
+        return []
+
+    courses = Course.objects.non_cohort().filter(period__in=semesters)
+    courses = courses.order_by("start").prefetch_related(instructors_prefetch())
+
+    grouped = defaultdict(list)
+    for course in courses:
+        grouped[course.period_id].append(serialize_course(course))
+
+    return [[str(semester), grouped[semester.pk]] for semester in semesters]
+
+
+def instructors_prefetch():
+    Faculty = apps.get_model(app_label="faculty", model_name="Faculty")
+    return Prefetch("instructors", queryset=Faculty.objects.all())
+
+
+def serialize_course(course):
+    return {
+        "title": course.title,
+        "instructors": [str(instructor) for instructor in course.instructors.all()],
+        "start": course.start,
+        "end": course.end,
+    }
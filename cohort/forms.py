@@ -19,10 +19,11 @@ Forms for managing courses and scheduling
 
 from django import forms
 from django.apps import apps
-from datetime import timedelta
 from collections import Counter
 from django.contrib import messages
 
+from cohort.holidays import holiday_saturday, create_holiday
+
 
 DTFMT = "%A, %B %d, %Y"
 
@@ -91,44 +92,19 @@ class HolidayForm(forms.Form):
 
         if not self.cleaned_data["no_convert"]:
             # Find the nearest saturday
-            if day.weekday() == 6:
-                # Shift Sunday holiday to Saturday
-                day -= timedelta(days=1)
-            elif day.weekday() == 0:
-                # Three day weekends for Monday holidays
-                day -= timedelta(days=2)
-            elif day.weekday() == 1:
-                # Do we really move Tuesday holidays back to Saturday?
-                day -= timedelta(days=3)
-            elif day.weekday() < 5:
-                # Move Wednesday, Thursday, Friday to next Saturday
-                day += timedelta(days=(5 - day.weekday() + 7) % 7)
-            else:
-                # This is a Saturday already
-                pass
-
-        # Create the calendar event
-        CalendarEvent = apps.get_model(app_label="cohort", model_name="CalendarEvent")
-
-        # Check that the holiday doesn't already exist (no uniqueness constraint)
-        q = CalendarEvent.objects.filter(
-            is_holiday=True,
-            start__year=day.year,
-            start__month=day.month,
-            start__day=day.day
-        )
-        if q.exists():
-            messages.warning(
-                request, f"Holiday already scheduled on {day.strftime(DTFMT)}"
-            )
-            return
+            day = holiday_saturday(day)
 
+        # Create the calendar event, the unique holiday index prevents duplicates
         try:
-            CalendarEvent.objects.create(
-                summary=title, start=day, end=day, is_holiday=True,
-            )
+            event = create_holiday(day, title)
         except Exception as e:
             messages.warning(request, f"Could not create holiday: {e}")
             return
 
+        if event is None:
+            messages.warning(
+                request, f"Holiday already scheduled on {day.strftime(DTFMT)}"
+            )
+            return
+
         messages.success(request, f"Created holiday on {day.strftime(DTFMT)}")
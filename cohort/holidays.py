@@ -0,0 +1,187 @@
+# cohort.holidays
+# Holiday rules and helpers for blocking Saturdays on the academic calendar.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Mon Oct 19 15:10:44 2026 -0400
+#
+# Copyright (C) 2026 Georgetown University
+# For license information, see LICENSE.txt
+#
+# ID: holidays.py [] benjamin@bengfort.com $
+
+"""
+Holiday rules and helpers for blocking Saturdays on the academic calendar.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import pytz
+import calendar
+
+from django.apps import apps
+from dateutil.easter import easter
+from datetime import date, datetime, time, timedelta
+from django.db import IntegrityError, transaction
+
+from cohort import availability
+from cohort.models import TIMEZONES
+
+
+TZ = pytz.timezone(TIMEZONES[TIMEZONES.Eastern])
+
+
+##########################################################################
+## Holiday Rules
+##########################################################################
+
+class FixedHoliday(object):
+    """
+    A holiday that falls on the same date every year, e.g. July 4th.
+    """
+
+    def __init__(self, title, month, day):
+        self.title = title
+        self.month = month
+        self.day = day
+
+    def date(self, year):
+        return date(year, self.month, self.day)
+
+
+class NthWeekdayHoliday(object):
+    """
+    A holiday that falls on the nth weekday of the month (Monday is 0), e.g. Labor Day
+    is the first Monday in September. Use n=-1 for the last weekday of the month.
+    """
+
+    def __init__(self, title, month, weekday, n):
+        self.title = title
+        self.month = month
+        self.weekday = weekday
+        self.n = n
+
+    def date(self, year):
+        days = [
+            week[self.weekday] for week in calendar.monthcalendar(year, self.month)
+            if week[self.weekday]
+        ]
+        return date(year, self.month, days[self.n if self.n < 0 else self.n - 1])
+
+
+class EasterHoliday(object):
+    """
+    A holiday that falls a fixed number of days from (western) Easter Sunday.
+    """
+
+    def __init__(self, title, offset=0):
+        self.title = title
+        self.offset = offset
+
+    def date(self, year):
+        return easter(year) + timedelta(days=self.offset)
+
+
+# Federal and academic holidays observed by the program
+HOLIDAYS = (
+    FixedHoliday("New Year's Day", 1, 1),
+    NthWeekdayHoliday("Martin Luther King Jr. Day", 1, calendar.MONDAY, 3),
+    NthWeekdayHoliday("Presidents' Day", 2, calendar.MONDAY, 3),
+    EasterHoliday("Easter"),
+    NthWeekdayHoliday("Memorial Day", 5, calendar.MONDAY, -1),
+    FixedHoliday("Juneteenth", 6, 19),
+    FixedHoliday("Independence Day", 7, 4),
+    NthWeekdayHoliday("Labor Day", 9, calendar.MONDAY, 1),
+    NthWeekdayHoliday("Indigenous Peoples' Day", 10, calendar.MONDAY, 2),
+    FixedHoliday("Veterans Day", 11, 11),
+    NthWeekdayHoliday("Thanksgiving", 11, calendar.THURSDAY, 4),
+    FixedHoliday("Christmas Day", 12, 25),
+)
+
+
+##########################################################################
+## Helpers
+##########################################################################
+
+def holiday_saturday(day):
+    """
+    Returns the course Saturday that a holiday blocks: Sunday holidays shift to the
+    day before, Monday and Tuesday holidays to the weekend before (e.g. three day
+    weekends), and Wednesday, Thursday, and Friday holidays to the next Saturday.
+    """
+    if day.weekday() == 6:
+        # Shift Sunday holiday to Saturday
+        day -= timedelta(days=1)
+    elif day.weekday() == 0:
+        # Three day weekends for Monday holidays
+        day -= timedelta(days=2)
+    elif day.weekday() == 1:
+        # Do we really move Tuesday holidays back to Saturday?
+        day -= timedelta(days=3)
+    elif day.weekday() < 5:
+        # Move Wednesday, Thursday, Friday to next Saturday
+        day += timedelta(days=(5 - day.weekday() + 7) % 7)
+    return day
+
+
+def holiday_event(day, title):
+    """
+    Returns an unsaved all-day holiday event at midnight Eastern on the day.
+    """
+    CalendarEvent = apps.get_model(app_label="cohort", model_name="CalendarEvent")
+    start = TZ.localize(datetime.combine(day, time(0, 0)))
+    return CalendarEvent(summary=title, start=start, end=start, is_holiday=True)
+
+
+def create_holiday(day, title):
+    """
+    Creates a single holiday event, returning None if there is already a holiday
+    scheduled on the day (enforced by the unique holiday index).
+    """
+    event = holiday_event(day, title)
+    try:
+        with transaction.atomic():
+            event.save()
+    except IntegrityError:
+        return None
+    return event
+
+
+def expand_rules(years, rules=HOLIDAYS, convert=True):
+    """
+    Returns a list of (date, title) pairs for every rule in every year, converted to
+    the holiday Saturday unless specified otherwise. If multiple holidays land on the
+    same day, only the first rule is kept.
+    """
+    days = {}
+    for year in years:
+        for rule in rules:
+            day = rule.date(year)
+            if convert:
+                day = holiday_saturday(day)
+            days.setdefault(day, rule.title)
+    return sorted(days.items())
+
+
+def make_holidays(years, rules=HOLIDAYS, convert=True):
+    """
+    Inserts the holidays for the rules in the specified years in a single bulk
+    statement, skipping days that already have a holiday via the unique index.
+    Returns the number of holidays that were created.
+    """
+    CalendarEvent = apps.get_model(app_label="cohort", model_name="CalendarEvent")
+    events = [
+        holiday_event(day, title) for day, title in expand_rules(years, rules, convert)
+    ]
+    if not events:
+        return 0
+
+    holidays = CalendarEvent.objects.filter(
+        is_holiday=True, start__gte=events[0].start, start__lte=events[-1].start,
+    )
+
+    existing = holidays.count()
+    CalendarEvent.objects.bulk_create(events, ignore_conflicts=True)
+    availability.invalidate()
+    return holidays.count() - existing
@@ -0,0 +1,139 @@
+# cohort.integrity
+# Database-wide integrity checks of the course and faculty schedule.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Mon Oct 19 22:10:19 2026 -0400
+#
+# Copyright (C) 2026 Georgetown University
+# For license information, see LICENSE.txt
+#
+# ID: integrity.py [] benjamin@bengfort.com $
+
+"""
+Database-wide integrity checks of the course and faculty schedule.
+
+Each check is a queryset of the records that violate a scheduling rule, so the number
+of violations of every check over the entire database is a single aggregate query and
+the offending records are only fetched when they are going to be reported.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+from django.apps import apps
+from django.db.models.functions import TruncDate
+from django.db.models import Q, F, Sum, Exists, OuterRef
+
+from faculty.models import FACULTY_ROLES
+
+
+##########################################################################
+## Integrity Checks
+##########################################################################
+
+class ScheduleCheck(object):
+    """
+    A named scheduling rule whose query returns the records that violate it.
+    """
+
+    def __init__(self, name, description, query):
+        self.name = name
+        self.description = description
+        self.query = query
+
+    def violations(self):
+        return self.query()
+
+    def count(self):
+        return self.violations().count()
+
+    def examples(self, limit=10):
+        return list(self.violations()[:limit])
+
+
+def assignments_outside_course():
+    Assignment = apps.get_model(app_label="faculty", model_name="Assignment")
+    return Assignment.objects.filter(course__isnull=False).filter(
+        Q(start__lt=F("course__start")) | Q(end__gt=F("course__end"))
+    ).select_related("faculty", "course")
+
+
+def course_effort_totals():
+    Course = apps.get_model(app_label="cohort", model_name="Course")
+    return Course.objects.annotate(
+        total_effort=Sum(
+            "instructional_assignments__effort",
+            filter=Q(instructional_assignments__role=FACULTY_ROLES.Instructor),
+        )
+    ).filter(total_effort__isnull=False).exclude(total_effort=100)
+
+
+def events_outside_course():
+    CalendarEvent = apps.get_model(app_label="cohort", model_name="CalendarEvent")
+    return CalendarEvent.objects.filter(course__isnull=False).annotate(
+        start_date=TruncDate("start"), end_date=TruncDate("end"),
+    ).filter(
+        Q(start_date__lt=F("course__start")) | Q(end_date__gt=F("course__end"))
+    ).select_related("course")
+
+
+def courses_without_events():
+    Course = apps.get_model(app_label="cohort", model_name="Course")
+    CalendarEvent = apps.get_model(app_label="cohort", model_name="CalendarEvent")
+    return Course.objects.filter(start__isnull=False).filter(
+        ~Exists(CalendarEvent.objects.filter(course=OuterRef("pk")))
+    )
+
+
+def events_on_holidays():
+    CalendarEvent = apps.get_model(app_label="cohort", model_name="CalendarEvent")
+    holidays = CalendarEvent.objects.filter(is_holiday=True).annotate(
+        date=TruncDate("start")
+    ).filter(date=OuterRef("start_date"))
+
+    return CalendarEvent.objects.filter(is_holiday=False).annotate(
+        start_date=TruncDate("start"),
+    ).filter(Exists(holidays)).select_related("course")
+
+
+def faculty_without_email():
+    Faculty = apps.get_model(app_label="faculty", model_name="Faculty")
+    return Faculty.objects.filter(exclude=False).filter(
+        Q(resolved_email__isnull=True) | Q(resolved_email="")
+    )
+
+
+CHECKS = [
+    ScheduleCheck(
+        "assignment-dates", "assignments outside of their course dates",
+        assignments_outside_course,
+    ),
+    ScheduleCheck(
+        "course-effort", "courses whose instructor effort does not total 100%",
+        course_effort_totals,
+    ),
+    ScheduleCheck(
+        "event-dates", "calendar events outside of their course dates",
+        events_outside_course,
+    ),
+    ScheduleCheck(
+        "course-events", "courses without any calendar events",
+        courses_without_events,
+    ),
+    ScheduleCheck(
+        "holiday-events", "calendar events on an academic holiday",
+        events_on_holidays,
+    ),
+    ScheduleCheck(
+        "faculty-email", "active faculty members without an email address",
+        faculty_without_email,
+    ),
+]
+
+
+def run_checks(checks=CHECKS):
+    """
+    Returns a list of (check, count) pairs for every check using one query per check.
+    """
+    return [(check, check.count()) for check in checks]
@@ -0,0 +1,73 @@
+# cohort.management.commands.checkschedule
+# Audit the entire schedule for integrity problems.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Mon Oct 19 22:24:51 2026 -0400
+#
+# Copyright (C) 2026 Georgetown University
+# For license information, see LICENSE.txt
+#
+# ID: checkschedule.py [] benjamin@bengfort.com $
+
+"""
+Audit the entire schedule for integrity problems.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+from django.core.management.base import BaseCommand, CommandError
+
+from cohort.integrity import CHECKS, run_checks
+
+
+class Command(BaseCommand):
+
+    help = "run the schedule integrity checks over the entire database"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "-c", "--check", action="append", default=None, metavar="NAME",
+            choices=[check.name for check in CHECKS],
+            help="only run the specified check (may be specified multiple times)",
+        )
+        parser.add_argument(
+            "-e", "--examples", type=int, default=5, metavar="N",
+            help="the number of violations of each failed check to list",
+        )
+        parser.add_argument(
+            "-f", "--fail", action="store_true",
+            help="exit with an error if any check fails (e.g. for cron or CI)",
+        )
+
+    def handle(self, *args, **options):
+        checks = CHECKS
+        if options["check"]:
+            checks = [check for check in CHECKS if check.name in options["check"]]
+
+        failed = 0
+        for check, count in run_checks(checks):
+            if count == 0:
+                self.stdout.write(self.style.SUCCESS(
+                    "{}: no {}".format(check.name, check.description)
+                ))
+                continue
+
+            failed += 1
+            self.stdout.write(self.style.WARNING(
+                "{}: {} {}".format(check.name, count, check.description)
+            ))
+            if options["examples"] > 0:
+                for obj in check.examples(options["examples"]):
+                    self.stdout.write("  {}".format(obj))
+                remaining = count - options["examples"]
+                if remaining > 0:
+                    self.stdout.write("  ... and {} more".format(remaining))
+
+        summary = "{} of {} schedule checks failed".format(failed, len(checks))
+        if failed and options["fail"]:
+            raise CommandError(summary)
+
+        style = self.style.ERROR if failed else self.style.SUCCESS
+        self.stdout.write(style(summary))
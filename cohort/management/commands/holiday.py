@@ -17,20 +17,17 @@ Create holidays from the command line.
 ## Imports
 ##########################################################################
 
-import pytz
-
-from django.apps import apps
-from datetime import datetime, timedelta
+from datetime import datetime
 from django.core.management.base import BaseCommand, CommandError
 
+from cohort.holidays import holiday_saturday, create_holiday
+
 
 DTFMT = "%A, %B %d, %Y"
-TZ = pytz.timezone("America/New_York")
 
 
 def date(s):
-    d = datetime.strptime(s, "%Y-%m-%d")
-    return TZ.localize(d)
+    return datetime.strptime(s, "%Y-%m-%d").date()
 
 
 class Command(BaseCommand):
@@ -56,45 +53,20 @@ class Command(BaseCommand):
 
         if not options["no_convert"]:
             # Find the nearest saturday
-            if day.weekday() == 6:
-                # Shift Sunday holiday to Saturday
-                day -= timedelta(days=1)
-            elif day.weekday() == 0:
-                # Three day weekends for Monday holidays
-                day -= timedelta(days=2)
-            elif day.weekday() == 1:
-                # Do we really move Tuesday holidays back to Saturday?
-                day -= timedelta(days=3)
-            elif day.weekday() < 5:
-                # Move Wednesday, Thursday, Friday to next Saturday
-                day += timedelta(days=(5 - day.weekday() + 7) % 7)
-            else:
-                # This is a Saturday already
-                pass
-
-        # Create the calendar event
-        CalendarEvent = apps.get_model(app_label="cohort", model_name="CalendarEvent")
-
-        # Check that the holiday doesn't already exist (no uniqueness constraint)
-        q = CalendarEvent.objects.filter(
-            is_holiday=True,
-            start__year=day.year,
-            start__month=day.month,
-            start__day=day.day
-        )
-        if q.exists():
-            self.stdout.write(self.style.ERROR(
-                "Holiday already scheduled on {}".format(day.strftime(DTFMT))
-            ))
-            return
+            day = holiday_saturday(day)
 
+        # Create the calendar event, the unique holiday index prevents duplicates
         try:
-            CalendarEvent.objects.create(
-                summary=title, start=day, end=day, is_holiday=True,
-            )
+            event = create_holiday(day, title)
         except Exception as e:
             raise CommandError("could not create holiday: {}".format(e))
 
+        if event is None:
+            self.stdout.write(self.style.ERROR(
+                "Holiday already scheduled on {}".format(day.strftime(DTFMT))
+            ))
+            return
+
         self.stdout.write(self.style.SUCCESS(
             "created holiday on {}".format(day.strftime(DTFMT))
         ))
@@ -0,0 +1,71 @@
+# cohort.management.commands.makeholidays
+# Create federal and academic holidays for a range of years.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Mon Oct 19 15:41:08 2026 -0400
+#
+# Copyright (C) 2026 Georgetown University
+# For license information, see LICENSE.txt
+#
+# ID: makeholidays.py [] benjamin@bengfort.com $
+
+"""
+Create federal and academic holidays for a range of years.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+from django.core.management.base import BaseCommand, CommandError
+
+from cohort.holidays import expand_rules, make_holidays
+
+
+DTFMT = "%a, %b %d, %Y"
+
+
+class Command(BaseCommand):
+
+    help = "create holiday events from the holiday rules for a range of years"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "-C", "--no-convert", action="store_true",
+            help="don't convert holidays to the nearest saturday"
+        )
+        parser.add_argument(
+            "-l", "--list", action="store_true",
+            help="list the holidays that would be created without creating them",
+        )
+        parser.add_argument(
+            "start", type=int, metavar="YYYY",
+            help="the first year to create holidays for",
+        )
+        parser.add_argument(
+            "end", type=int, metavar="YYYY", nargs="?", default=None,
+            help="the last year to create holidays for (default start year)",
+        )
+
+    def handle(self, *args, **options):
+        start = options["start"]
+        end = options["end"] or start
+        if end < start:
+            raise CommandError("the end year must be on or after the start year")
+
+        years = range(start, end + 1)
+        convert = not options["no_convert"]
+
+        if options["list"]:
+            for day, title in expand_rules(years, convert=convert):
+                self.stdout.write("{}  {}".format(day.strftime(DTFMT), title))
+            return
+
+        try:
+            created = make_holidays(years, convert=convert)
+        except Exception as e:
+            raise CommandError("could not create holidays: {}".format(e))
+
+        self.stdout.write(self.style.SUCCESS(
+            "created {} holidays from {} to {}".format(created, start, end)
+        ))
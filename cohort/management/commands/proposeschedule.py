@@ -0,0 +1,127 @@
+# cohort.management.commands.proposeschedule
+# Propose course dates for a new cohort around holidays and faculty schedules.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Mon Oct 19 14:05:12 2026 -0400
+#
+# Copyright (C) 2026 Georgetown University
+# For license information, see LICENSE.txt
+#
+# ID: proposeschedule.py [] benjamin@bengfort.com $
+
+"""
+Propose course dates for a new cohort around holidays and faculty schedules.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+from django.apps import apps
+from django.db.models import Q
+from datetime import datetime
+from django.core.management.base import BaseCommand, CommandError
+
+from cohort.scheduler import propose_schedule
+
+
+DTFMT = "%a %b %d, %Y"
+
+
+def date(s):
+    return datetime.strptime(s, "%Y-%m-%d").date()
+
+
+def course(s):
+    """
+    Parses a course specification of the form HOURS[:NETID,NETID,...]
+    """
+    hours, _, instructors = s.partition(":")
+    return int(hours), [i.strip() for i in instructors.split(",") if i.strip()]
+
+
+class Command(BaseCommand):
+
+    help = "propose course dates for a sequence of courses in a cohort"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "-a", "--after", type=date, default=None, metavar="YYYY-MM-DD",
+            help="the earliest date the cohort can start (default today)",
+        )
+        parser.add_argument(
+            "-c", "--cohort", type=int, default=None,
+            help="the number of an existing cohort whose events must be avoided",
+        )
+        parser.add_argument(
+            "-n", "--options", type=int, default=5,
+            help="the maximum number of proposals to display",
+        )
+        parser.add_argument(
+            "-w", "--window", type=int, default=26,
+            help="the number of weeks to search for a start date",
+        )
+        parser.add_argument(
+            "-g", "--max-gap", type=int, default=2,
+            help="the maximum number of weeks between Saturdays of a course",
+        )
+        parser.add_argument(
+            "courses", nargs="+", type=course, metavar="HOURS[:NETID,...]",
+            help="hours and candidate instructors of each course in order",
+        )
+
+    def handle(self, *args, **options):
+        Faculty = apps.get_model(app_label="faculty", model_name="Faculty")
+        Cohort = apps.get_model(app_label="cohort", model_name="Cohort")
+
+        # Resolve all of the candidate instructors by netid or slug in one query
+        keys = {key for _, instructors in options["courses"] for key in instructors}
+        faculty = {}
+        if keys:
+            query = Faculty.objects.filter(Q(netid__in=keys) | Q(slug__in=keys))
+            for person in query:
+                faculty[person.netid] = person
+                faculty[person.slug] = person
+
+        missing = keys - set(faculty)
+        if missing:
+            raise CommandError("unknown faculty: {}".format(", ".join(sorted(missing))))
+
+        cohort = None
+        if options["cohort"] is not None:
+            try:
+                cohort = Cohort.objects.get(cohort=options["cohort"])
+            except Cohort.DoesNotExist:
+                raise CommandError(f"cohort {options['cohort']} does not exist")
+
+        courses = [
+            (hours, [faculty[key].pk for key in instructors])
+            for hours, instructors in options["courses"]
+        ]
+
+        try:
+            proposals = propose_schedule(
+                courses, after=options["after"],
+                cohort=cohort.pk if cohort else None,
+                options=options["options"], window=options["window"],
+                max_gap=options["max_gap"],
+            )
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        if not proposals:
+            raise CommandError("no schedule satisfies the constraints")
+
+        names = {person.pk: person.get_full_name() for person in faculty.values()}
+        for rank, proposal in enumerate(proposals, 1):
+            self.stdout.write(self.style.SUCCESS(
+                "option {}: {} - {} ({} weeks)".format(
+                    rank, proposal.start.strftime(DTFMT),
+                    proposal.end.strftime(DTFMT), proposal.weeks,
+                )
+            ))
+            for item in proposal.courses:
+                self.stdout.write("  {:>2} hours: {} - {}{}".format(
+                    item.hours, item.start.strftime(DTFMT), item.end.strftime(DTFMT),
+                    " ({})".format(names[item.instructor]) if item.instructor else "",
+                ))
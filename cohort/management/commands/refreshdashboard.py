@@ -0,0 +1,50 @@
+# cohort.management.commands.refreshdashboard
+# Rebuild the precomputed overview dashboard snapshot.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Mon Oct 19 16:48:20 2026 -0400
+#
+# Copyright (C) 2026 Georgetown University
+# For license information, see LICENSE.txt
+#
+# ID: refreshdashboard.py [] benjamin@bengfort.com $
+
+"""
+Rebuild the precomputed overview dashboard snapshot.
+
+Schedule this command shortly after midnight so that the first visitor of the day does
+not have to wait for the snapshot to be built.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+from datetime import datetime
+from django.core.management.base import BaseCommand
+
+from cohort.dashboard import refresh
+
+
+def date(s):
+    return datetime.strptime(s, "%Y-%m-%d").date()
+
+
+class Command(BaseCommand):
+
+    help = "rebuild the overview dashboard snapshot for today (or the specified day)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "-d", "--date", type=date, default=None, metavar="YYYY-MM-DD",
+            help="the day to compute the dashboard for (default today)",
+        )
+
+    def handle(self, *args, **options):
+        snapshot = refresh(options["date"])
+        self.stdout.write(self.style.SUCCESS(
+            "dashboard refreshed: {} active and {} upcoming courses, {} cohorts".format(
+                snapshot["num_active_courses"], snapshot["num_upcoming_courses"],
+                len(snapshot["current_cohorts"]),
+            )
+        ))
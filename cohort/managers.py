@@ -17,11 +17,56 @@ Query managers for cohort models.
 ## Imports
 ##########################################################################
 
-from django.db import models
-from django.db.models import Q
-from django.db import connection
+import re
 
-from datetime import datetime, date
+from django.apps import apps
+from django.db import models, connections
+from django.db.models import Q, Func, Value
+from django.db.models.functions import Greatest, Least
+from django.contrib.postgres.fields import DateRangeField
+
+from datetime import datetime, date, timedelta
+
+
+##########################################################################
+## Date Ranges
+##########################################################################
+
+def closed_range(start, end):
+    """
+    Constructs a closed Postgres daterange from two date expressions. This is a plain
+    Func (rather than a subclass) so that indexes on it can be serialized in migrations
+    without referencing application code.
+    """
+    return Func(
+        start, end, Value("[]"), function="daterange", output_field=DateRangeField()
+    )
+
+
+def date_range(start="start", end="end"):
+    """
+    Returns the daterange expression of a model's start and end dates that is indexed
+    by the GiST range indexes. The bounds are ordered so that a row whose end is
+    mistakenly before its start cannot raise an error when the index is updated.
+    """
+    return closed_range(Least(start, end), Greatest(start, end))
+
+
+##########################################################################
+## Helpers
+##########################################################################
+
+def flatten(values):
+    """
+    Expands any lists, tuples, sets, or querysets in the values into a single list.
+    """
+    items = []
+    for value in values:
+        if isinstance(value, (list, tuple, set, frozenset, models.QuerySet)):
+            items.extend(value)
+        else:
+            items.append(value)
+    return items
 
 
 ##########################################################################
@@ -60,12 +105,49 @@ class TimeRangeQuerySet(models.QuerySet):
         """
         return self.ends_before(self.today())
 
+    def overlaps(self, start=None, end=None):
+        """
+        Include objects whose start and end dates (inclusive) overlap the specified
+        dates (inclusive); a start or end of None leaves that side unbounded. Objects
+        without both a start and an end date never overlap.
+
+        On Postgres the comparison is a range overlap that can use the GiST index on
+        the date range, on other databases it is the equivalent pair of comparisons.
+        """
+        query = self.filter(start__isnull=False, end__isnull=False)
+        if connections[self.db].vendor == "postgresql":
+            span = closed_range(Value(start), Value(end))
+            return query.alias(date_range=date_range()).filter(date_range__overlap=span)
+
+        if start is not None:
+            query = query.filter(end__gte=start)
+        if end is not None:
+            query = query.filter(start__lte=end)
+        return query
+
+    def during(self, span):
+        """
+        Include objects that overlap the span, which can be a (start, end) tuple, a
+        Postgres range, or an object with start and end dates such as a semester.
+        """
+        if hasattr(span, "lower"):
+            start, end = span.lower, span.upper
+            if start is not None and not span.lower_inc:
+                start += timedelta(days=1)
+            if end is not None and not span.upper_inc:
+                end -= timedelta(days=1)
+        elif hasattr(span, "start"):
+            start, end = span.start, span.end
+        else:
+            start, end = span
+        return self.overlaps(start, end)
+
     def current(self):
         """
         Include only objects that are currently active.
         """
         today = date.today()
-        return self.filter(start__lte=today, end__gte=today)
+        return self.overlaps(today, today)
 
     def upcoming(self):
         """
@@ -85,6 +167,18 @@ class TimeRangeManager(models.Manager):
         """
         return self.get_queryset().completed()
 
+    def overlaps(self, start=None, end=None):
+        """
+        Include objects whose dates overlap the specified dates (inclusive).
+        """
+        return self.get_queryset().overlaps(start, end)
+
+    def during(self, span):
+        """
+        Include objects whose dates overlap the specified span.
+        """
+        return self.get_queryset().during(span)
+
     def current(self):
         """
         Include only objects that are currently active.
@@ -98,6 +192,88 @@ class TimeRangeManager(models.Manager):
         return self.get_queryset().upcoming()
 
 
+##########################################################################
+## Semester Queryset and Manager
+##########################################################################
+
+SEMESTER_NAME = re.compile(
+    r"^(?P<term>SP|SU|FA|Spring|Summer|Fall)[\s\-_]*(?P<year>\d{4})$", re.I
+)
+
+
+class SemesterQuerySet(models.QuerySet):
+
+    def scheduled(self, after=None):
+        """
+        Include semesters with courses that end on or after the specified day.
+        """
+        after = after or date.today()
+        return self.filter(courses__end__gte=after).distinct()
+
+
+class SemesterManager(models.Manager):
+
+    def get_queryset(self):
+        return SemesterQuerySet(self.model, using=self._db)
+
+    def scheduled(self, after=None):
+        """
+        Include semesters with courses that end on or after the specified day.
+        """
+        return self.get_queryset().scheduled(after)
+
+    def lookup(self, name):
+        """
+        Returns the semester identified by a name such as "FA2026", "FA-2026" or
+        "Fall 2026" or by its id, or None if the name is invalid or the semester does
+        not exist.
+        """
+        name = str(name).strip() if name else ""
+        if name.isdigit():
+            return self.filter(pk=int(name)).first()
+
+        match = SEMESTER_NAME.match(name)
+        if not match:
+            return None
+
+        term = match.group("term")[0:2].upper()
+        return self.filter(term=term, year=int(match.group("year"))).first()
+
+    def get_for(self, term, year):
+        """
+        Returns the semester for the term and year, creating it if it doesn't exist.
+        """
+        start, end = self.model.bounds(term, year)
+        semester, _ = self.get_or_create(
+            term=term, year=year, defaults={"start": start, "end": end}
+        )
+        return semester
+
+    def resolve(self, keys):
+        """
+        Returns a dict mapping (term, year) keys to semesters, creating all of the
+        missing semesters with a single insert.
+        """
+        keys = set(keys)
+        if not keys:
+            return {}
+
+        query = Q()
+        for term, year in keys:
+            query |= Q(term=term, year=year)
+
+        semesters = {(s.term, s.year): s for s in self.filter(query)}
+        missing = []
+        for term, year in keys - set(semesters):
+            start, end = self.model.bounds(term, year)
+            missing.append(self.model(term=term, year=year, start=start, end=end))
+
+        if missing:
+            self.bulk_create(missing, ignore_conflicts=True)
+            semesters = {(s.term, s.year): s for s in self.filter(query)}
+        return semesters
+
+
 ##########################################################################
 ## Cohort Queryset and Manager
 ##########################################################################
@@ -119,7 +295,7 @@ class CohortManager(TimeRangeManager):
 class CourseQuerySet(TimeRangeQuerySet):
 
     def semester(self, semester, year):
-        return self.filter(Q(semester=semester) & Q(start__year=year))
+        return self.filter(Q(period__term=semester) & Q(period__year=year))
 
     def non_cohort(self):
         return self.filter(cohort__isnull=True)
@@ -130,37 +306,31 @@ class CourseManager(TimeRangeManager):
     def get_queryset(self):
         return CourseQuerySet(self.model, using=self._db)
 
+    def semester(self, semester, year):
+        return self.get_queryset().semester(semester, year)
+
+    def non_cohort(self):
+        return self.get_queryset().non_cohort()
+
     def non_cohort_courses(self, semester, year):
-        return self.filter(
-            Q(semester=semester) & Q(start__year=year) & Q(cohort__isnull=True)
-        )
+        return self.get_queryset().semester(semester, year).non_cohort()
 
 
 def scheduled_semesters(after=None):
     """
-    Returns all semesters with courses scheduled on or after the specified datetime.
+    Returns the (semester, year) of all semesters with courses scheduled on or after
+    the specified datetime in chronological order.
 
     Parameters
     ----------
     after : datetime, optional
         Get all semesters scheduled after the specified date, otherwise use today.
     """
-    query = (
-        "WITH sorted_courses AS ( "
-        "SELECT c.semester, c.start FROM courses c WHERE c.end >= %s ORDER BY c.start) "
-        "SELECT DISTINCT c.semester, EXTRACT(YEAR FROM c.start) AS year "
-        "FROM sorted_courses c"
-    )
-
-    if after is None:
-        after = date.today().strftime("%Y-%m-%d")
-    else:
-        if not isinstance(after, (datetime, date)):
-            raise TypeError("after must be a datetime or date")
-        after = after.strftime("%Y-%m-%d")
+    if after is not None and not isinstance(after, (datetime, date)):
+        raise TypeError("after must be a datetime or date")
 
-    with connection.cursor() as cursor:
-        cursor.execute(query, [after])
-        rows = cursor.fetchall()
+    if isinstance(after, datetime):
+        after = after.date()
 
-    return rows
+    Semester = apps.get_model(app_label="cohort", model_name="Semester")
+    return list(Semester.objects.scheduled(after).values_list("term", "year"))
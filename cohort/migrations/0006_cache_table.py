@@ -0,0 +1,23 @@
+# Generated by Django 4.1.3 on 2026-10-20 09:20
+
+from django.db import migrations
+from django.core.management import call_command
+
+
+def create_cache_table(apps, schema_editor):
+    """
+    Creates the table of the database cache backend (if it is configured) wherever
+    the migrations are run; the command skips tables that already exist.
+    """
+    call_command("createcachetable", database=schema_editor.connection.alias)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cohort", "0005_alter_calendarevent_options_alter_capstone_id_and_more"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_cache_table, migrations.RunPython.noop),
+    ]
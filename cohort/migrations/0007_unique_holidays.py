@@ -0,0 +1,44 @@
+# Generated by Django 4.1.3 on 2026-10-19 15:22
+
+from django.db import migrations, models
+from django.db.models.functions import TruncDate
+
+
+def remove_duplicate_holidays(apps, schema_editor):
+    """
+    Keep only the first holiday created on each day so that the unique holiday index
+    can be created on databases that already have duplicate holidays.
+    """
+    CalendarEvent = apps.get_model("cohort", "CalendarEvent")
+    seen, duplicates = set(), []
+    holidays = (
+        CalendarEvent.objects.filter(is_holiday=True)
+        .annotate(day=TruncDate("start"))
+        .order_by("start", "created")
+    )
+    for pk, day in holidays.values_list("pk", "day"):
+        if day in seen:
+            duplicates.append(pk)
+        seen.add(day)
+
+    if duplicates:
+        CalendarEvent.objects.filter(pk__in=duplicates).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cohort", "0006_cache_table"),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_holidays, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="calendarevent",
+            constraint=models.UniqueConstraint(
+                TruncDate("start"),
+                condition=models.Q(("is_holiday", True)),
+                name="unique_holiday_date",
+            ),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 4.1.3 on 2026-10-19 18:27
+
+import cohort.models
+import django.core.serializers.json
+from django.db import migrations, models
+import django.utils.timezone
+import model_utils.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cohort', '0007_unique_holidays'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DashboardSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', model_utils.fields.AutoCreatedField(default=django.utils.timezone.now, editable=False, verbose_name='created')),
+                ('modified', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, editable=False, verbose_name='modified')),
+                ('date', models.DateField(help_text='The day the dashboard snapshot was computed for', unique=True)),
+                ('data', models.JSONField(decoder=cohort.models.SnapshotDecoder, encoder=django.core.serializers.json.DjangoJSONEncoder, help_text='The context of the overview dashboard')),
+            ],
+            options={
+                'verbose_name': 'Dashboard Snapshot',
+                'verbose_name_plural': 'Dashboard Snapshots',
+                'db_table': 'dashboard_snapshots',
+                'get_latest_by': 'date',
+            },
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 4.1.3 on 2026-10-19 18:28
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+import model_utils.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cohort', '0008_dashboard_snapshot'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Semester',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', model_utils.fields.AutoCreatedField(default=django.utils.timezone.now, editable=False, verbose_name='created')),
+                ('modified', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, editable=False, verbose_name='modified')),
+                ('term', models.CharField(choices=[('SP', 'Spring'), ('SU', 'Summer'), ('FA', 'Fall')], help_text='The academic term of the semester', max_length=2)),
+                ('year', models.PositiveSmallIntegerField(help_text='The calendar year of the semester')),
+                ('start', models.DateField(help_text='The first day of the semester')),
+                ('end', models.DateField(help_text='The last day of the semester')),
+            ],
+            options={
+                'db_table': 'semesters',
+                'ordering': ('start',),
+                'get_latest_by': 'start',
+                'unique_together': {('term', 'year')},
+            },
+        ),
+        migrations.AddField(
+            model_name='cohort',
+            name='period',
+            field=models.ForeignKey(blank=True, default=None, editable=False, help_text='The semester of the cohort, set from the semester and start date', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='cohorts', to='cohort.semester'),
+        ),
+        migrations.AddField(
+            model_name='course',
+            name='period',
+            field=models.ForeignKey(blank=True, default=None, editable=False, help_text='The semester of the course, set from the semester and start date', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='courses', to='cohort.semester'),
+        ),
+    ]
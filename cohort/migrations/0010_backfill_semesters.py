@@ -0,0 +1,48 @@
+# Generated by Django 4.1.3 on 2026-10-19 18:28
+
+from datetime import date
+from django.db import migrations
+
+
+TERM_BOUNDS = {
+    "SP": ((1, 1), (5, 31)),
+    "SU": ((6, 1), (8, 31)),
+    "FA": ((9, 1), (12, 31)),
+}
+
+
+def backfill_semesters(apps, schema_editor):
+    """
+    Create a semester for every term and start year of the existing courses and
+    cohorts, then reference it from each course and cohort with one update per
+    semester and model.
+    """
+    Semester = apps.get_model("cohort", "Semester")
+    models = [apps.get_model("cohort", "Course"), apps.get_model("cohort", "Cohort")]
+
+    periods = {}
+    for model in models:
+        rows = model.objects.exclude(semester="").filter(start__isnull=False)
+        for pk, term, start in rows.values_list("pk", "semester", "start"):
+            periods.setdefault((term, start.year), {}).setdefault(model, []).append(pk)
+
+    for (term, year), members in periods.items():
+        (smonth, sday), (emonth, eday) = TERM_BOUNDS[term]
+        semester, _ = Semester.objects.get_or_create(
+            term=term, year=year, defaults={
+                "start": date(year, smonth, sday), "end": date(year, emonth, eday),
+            }
+        )
+        for model, pks in members.items():
+            model.objects.filter(pk__in=pks).update(period=semester)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cohort", "0009_semesters"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_semesters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 4.1.3 on 2026-10-19 19:05
+
+import django.contrib.postgres.fields.ranges
+import django.contrib.postgres.indexes
+import django.db.models.functions.comparison
+from django.db import migrations, models
+
+
+class AddPostgresIndex(migrations.AddIndex):
+    """
+    Records the index in the model state on every database but only creates it on
+    Postgres; range indexes are not supported elsewhere and other databases fall back
+    to comparisons on the start and end columns.
+    """
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == "postgresql":
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == "postgresql":
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
+
+
+def daterange_index(name):
+    # The closed daterange of the start and end dates (see cohort.managers.date_range)
+    return django.contrib.postgres.indexes.GistIndex(
+        models.Func(
+            django.db.models.functions.comparison.Least("start", "end"),
+            django.db.models.functions.comparison.Greatest("start", "end"),
+            models.Value("[]"),
+            function="daterange",
+            output_field=django.contrib.postgres.fields.ranges.DateRangeField(),
+        ),
+        name=name,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cohort", "0010_backfill_semesters"),
+    ]
+
+    operations = [
+        AddPostgresIndex(
+            model_name="cohort",
+            index=daterange_index("cohorts_daterange_gist"),
+        ),
+        AddPostgresIndex(
+            model_name="course",
+            index=daterange_index("courses_daterange_gist"),
+        ),
+    ]
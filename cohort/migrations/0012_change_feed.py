@@ -0,0 +1,39 @@
+# Generated by Django 4.1.3 on 2026-10-19 18:50
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cohort', '0011_daterange_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Tombstone',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('model', models.CharField(help_text='The name of the change feed stream of the deleted object', max_length=32)),
+                ('object_id', models.CharField(help_text='The primary key of the deleted object', max_length=64)),
+                ('deleted', models.DateTimeField(db_index=True, default=django.utils.timezone.now, editable=False, help_text='When the object was deleted')),
+            ],
+            options={
+                'db_table': 'tombstones',
+                'get_latest_by': 'deleted',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='calendarevent',
+            index=models.Index(fields=['modified'], name='calendar_modifie_a20156_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='cohort',
+            index=models.Index(fields=['modified'], name='cohorts_modifie_bdb814_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='course',
+            index=models.Index(fields=['modified'], name='courses_modifie_7f7d8a_idx'),
+        ),
+    ]
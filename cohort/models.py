@@ -17,15 +17,20 @@ Cohort app database models.
 ## Imports
 ##########################################################################
 
+import json
 import pytz
 import uuid
 
 from django.db import models
+from django.db.models.functions import TruncDate
+from django.contrib.postgres.indexes import GistIndex
+from django.core.serializers.json import DjangoJSONEncoder
 from model_utils import Choices
+from django.utils import timezone
 from django.utils.timezone import is_aware
 from model_utils.models import TimeStampedModel
 from datetime import date, datetime, time, timedelta
-from cohort.managers import CohortManager, CourseManager
+from cohort.managers import SemesterManager, CohortManager, CourseManager, date_range
 
 
 SEMESTER = Choices(
@@ -34,6 +39,13 @@ SEMESTER = Choices(
     ("FA", "Fall", "Fall"),
 )
 
+# The (month, day) bounds of each term, used when a semester is created automatically
+TERM_BOUNDS = {
+    SEMESTER.Spring: ((1, 1), (5, 31)),
+    SEMESTER.Summer: ((6, 1), (8, 31)),
+    SEMESTER.Fall: ((9, 1), (12, 31)),
+}
+
 SECTION = Choices("A", "B", "C")
 SCS_ADDRESS = (
     "Georgetown University School of Continuing Studies, "
@@ -41,6 +53,62 @@ SCS_ADDRESS = (
 )
 
 
+##########################################################################
+## Semesters
+##########################################################################
+
+class Semester(TimeStampedModel):
+    """
+    A semester is an academic term in a specific year. Courses and cohorts reference
+    their semester directly so that semester listings and lookups are simple indexed
+    joins rather than year extractions on the course dates.
+    """
+
+    term = models.CharField(
+        max_length=2, choices=SEMESTER, null=False, blank=False,
+        help_text="The academic term of the semester",
+    )
+    year = models.PositiveSmallIntegerField(
+        null=False, blank=False,
+        help_text="The calendar year of the semester",
+    )
+    start = models.DateField(
+        null=False, blank=False,
+        help_text="The first day of the semester",
+    )
+    end = models.DateField(
+        null=False, blank=False,
+        help_text="The last day of the semester",
+    )
+
+    # Add a custom manager to resolve semesters by term and year
+    objects = SemesterManager()
+
+    class Meta:
+        db_table = "semesters"
+        ordering = ("start",)
+        get_latest_by = "start"
+        unique_together = ("term", "year")
+
+    @staticmethod
+    def bounds(term, year):
+        """
+        Returns the default start and end dates of the term in the specified year.
+        """
+        (smonth, sday), (emonth, eday) = TERM_BOUNDS[term]
+        return date(year, smonth, sday), date(year, emonth, eday)
+
+    @property
+    def code(self):
+        """
+        A short name for the semester, e.g. FA2026, used to filter by semester in URLs.
+        """
+        return "{}{}".format(self.term, self.year)
+
+    def __str__(self):
+        return "{} {}".format(SEMESTER[self.term], self.year)
+
+
 ##########################################################################
 ## Cohorts
 ##########################################################################
@@ -59,6 +127,12 @@ class Cohort(TimeStampedModel):
         max_length=2, choices=SEMESTER, null=False, blank=False,
         help_text="The academic semester the cohort has been assigned to",
     )
+    period = models.ForeignKey(
+        "Semester",
+        null=True, blank=True, default=None, editable=False,
+        on_delete=models.SET_NULL, related_name="cohorts",
+        help_text="The semester of the cohort, set from the semester and start date",
+    )
     section = models.CharField(
         max_length=1, null=True, blank=True, choices=SECTION, default=None,
         help_text="If multiple cohorts per semester, the semester section",
@@ -81,6 +155,10 @@ class Cohort(TimeStampedModel):
     class Meta:
         db_table = "cohorts"
         ordering = ("-cohort",)
+        indexes = [
+            models.Index(fields=["modified"]),
+            GistIndex(date_range(), name="cohorts_daterange_gist"),
+        ]
 
     def get_semester_display(self):
         """
@@ -132,6 +210,12 @@ class Course(TimeStampedModel):
         max_length=2, choices=SEMESTER, null=False, blank=True,
         help_text="The academic semester the course is in (cohort semester by default)",
     )
+    period = models.ForeignKey(
+        "Semester",
+        null=True, blank=True, default=None, editable=False,
+        on_delete=models.SET_NULL, related_name="courses",
+        help_text="The semester of the course, set from the semester and start date",
+    )
     course_id = models.CharField(
         max_length=55, null=False, blank=False, db_index=True, verbose_name="Course ID",
         help_text="The course ID, e.g. XBUS-500 that uniquely identifies an offering",
@@ -167,6 +251,10 @@ class Course(TimeStampedModel):
         db_table = "courses"
         ordering = ("-cohort__cohort", "start")
         unique_together = ("course_id", "section")
+        indexes = [
+            models.Index(fields=["modified"]),
+            GistIndex(date_range(), name="courses_daterange_gist"),
+        ]
 
     def get_semester_display(self):
         """
@@ -316,6 +404,20 @@ class Capstone(TimeStampedModel):
 ## Calendar Events
 ##########################################################################
 
+def saturday(day):
+    """
+    Returns the Saturday associated with the date, e.g. the date itself if it is a
+    Saturday, the day before if it is a Sunday, or the following Saturday if the date
+    is a weekday. See CalendarEvent.saturday for the timezone aware version.
+    """
+    if day.weekday() == 5:
+        return day
+    elif day.weekday() < 5:
+        return day + timedelta(days=(5 - day.weekday() + 7) % 7)
+    else:
+        return day - timedelta(days=1)
+
+
 TIMEZONES = Choices(
     ("E", "Eastern", "America/New_York"),
     ("C", "Central", "America/Chicago"),
@@ -379,6 +481,14 @@ class CalendarEvent(TimeStampedModel):
         get_latest_by = "start"
         verbose_name = "Calendar Event"
         verbose_name_plural = "Calendar Events"
+        constraints = [
+            # One holiday per (local) day, regardless of the time of the event
+            models.UniqueConstraint(
+                TruncDate("start"), condition=models.Q(is_holiday=True),
+                name="unique_holiday_date",
+            ),
+        ]
+        indexes = [models.Index(fields=["modified"])]
 
     @property
     def event_id(self):
@@ -463,14 +573,7 @@ class CalendarEvent(TimeStampedModel):
         date is a Saturday, the day before if the start date is a Sunday, or the
         following Saturday if the start date is a weekday.
         """
-        day = self.start.astimezone(self.get_timezone_object())
-
-        if day.weekday() == 5:
-            return day.date()
-        elif day.weekday() < 5:
-            return day.date() + timedelta(days=(5 - day.weekday() + 7) % 7)
-        else:
-            return day.date() - timedelta(days=1)
+        return saturday(self.start.astimezone(self.get_timezone_object()).date())
 
     def __str__(self):
         if self.is_holiday or self.is_all_day():
@@ -480,3 +583,83 @@ class CalendarEvent(TimeStampedModel):
             self.start.strftime("%Y-%m-%d %H:%M"),
             self.end.strftime("%H:%M"),
         )
+
+
+##########################################################################
+## Dashboard Snapshot
+##########################################################################
+
+class SnapshotDecoder(json.JSONDecoder):
+    """
+    Restores the ISO formatted dates in a dashboard snapshot to date objects.
+    """
+
+    DATE_KEYS = frozenset(("start", "end", "next_capstone_presentations"))
+
+    def __init__(self, *args, **kwargs):
+        kwargs["object_hook"] = self.decode_dates
+        super(SnapshotDecoder, self).__init__(*args, **kwargs)
+
+    def decode_dates(self, obj):
+        for key in self.DATE_KEYS.intersection(obj):
+            if obj[key]:
+                obj[key] = date.fromisoformat(obj[key])
+        return obj
+
+
+class DashboardSnapshot(TimeStampedModel):
+    """
+    A precomputed copy of the overview dashboard for a single day. Snapshots are
+    rebuilt in the background whenever courses, cohorts, or assignments change and
+    the first time the dashboard is viewed on a new day, since what is current or
+    upcoming depends on the date (see cohort.dashboard).
+    """
+
+    date = models.DateField(
+        unique=True, null=False,
+        help_text="The day the dashboard snapshot was computed for",
+    )
+    data = models.JSONField(
+        encoder=DjangoJSONEncoder, decoder=SnapshotDecoder,
+        help_text="The context of the overview dashboard",
+    )
+
+    class Meta:
+        db_table = "dashboard_snapshots"
+        get_latest_by = "date"
+        verbose_name = "Dashboard Snapshot"
+        verbose_name_plural = "Dashboard Snapshots"
+
+    def __str__(self):
+        return "Dashboard Snapshot {}".format(self.date)
+
+
+##########################################################################
+## Change Tracking
+##########################################################################
+
+class Tombstone(models.Model):
+    """
+    Records the deletion of an object that is published in the change feed so that
+    clients syncing incrementally can remove it (see cohort.changes).
+    """
+
+    model = models.CharField(
+        max_length=32, null=False,
+        help_text="The name of the change feed stream of the deleted object",
+    )
+    object_id = models.CharField(
+        max_length=64, null=False,
+        help_text="The primary key of the deleted object",
+    )
+    deleted = models.DateTimeField(
+        default=timezone.now, editable=False, db_index=True,
+        help_text="When the object was deleted",
+    )
+
+    class Meta:
+        db_table = "tombstones"
+        get_latest_by = "deleted"
+
+    def __str__(self):
+        return "{} {} deleted {}".format(self.model, self.object_id, self.deleted)
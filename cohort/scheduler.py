@@ -0,0 +1,197 @@
+# cohort.scheduler
+# Propose course dates for a cohort from precomputed Saturday availability.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Mon Oct 19 13:27:50 2026 -0400
+#
+# Copyright (C) 2026 Georgetown University
+# For license information, see LICENSE.txt
+#
+# ID: scheduler.py [] benjamin@bengfort.com $
+
+"""
+Propose course dates for a cohort from precomputed Saturday availability.
+
+A cohort is a sequence of courses, each of which meets on one or two Saturdays
+depending on its hours (the same meeting patterns used by make_calendar_events). For
+each candidate start week the courses are packed greedily onto the earliest Saturdays
+that are free for the cohort and for at least one of the course's candidate
+instructors, avoiding holidays. Because the free days are bitsets, every placement is
+a handful of bitwise operations and all of the candidate start weeks can be searched
+in a few milliseconds.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+from datetime import date, timedelta
+from collections import namedtuple
+
+from cohort.models import saturday
+from cohort.availability import get_span
+
+
+# Number of Saturdays each course length meets on (see Course.make_calendar_events)
+SESSIONS = {
+    3: 1,
+    6: 1,
+    12: 2,
+    18: 2,
+}
+
+
+ProposedCourse = namedtuple(
+    "ProposedCourse", ("hours", "instructor", "start", "end", "saturdays")
+)
+
+Proposal = namedtuple("Proposal", ("start", "end", "weeks", "courses"))
+
+
+##########################################################################
+## Scheduler
+##########################################################################
+
+def propose_schedule(
+    courses, after=None, cohort=None, options=5, window=26, max_gap=2
+):
+    """
+    Proposes start and end dates for a sequence of courses, returning the best
+    options ranked by the number of weeks the cohort takes to complete.
+
+    Parameters
+    ----------
+    courses : list of (int, list) tuples
+        The hours of each course in the order they are taught along with the ids of
+        the faculty members who could teach the course. If no instructors are given,
+        only the cohort and the holidays constrain the course dates.
+    after : date, optional
+        The earliest date the cohort can start, today by default.
+    cohort : int, optional
+        The id of an existing cohort whose scheduled events must be avoided.
+    options : int, default: 5
+        The maximum number of proposals to return.
+    window : int, default: 26
+        The number of consecutive weeks to consider as the start of the cohort.
+    max_gap : int, default: 2
+        The maximum number of weeks between the Saturdays of a single course.
+    """
+    courses = [(hours, list(instructors or [])) for hours, instructors in courses]
+    for hours, _ in courses:
+        if hours not in SESSIONS:
+            raise ValueError("cannot handle {} hours courses".format(hours))
+
+    if not courses:
+        raise ValueError("specify at least one course to schedule")
+
+    # Load enough years to fit the whole sequence even if every course is spread out
+    after = after or date.today()
+    weeks = window + sum(SESSIONS[hours] * max_gap for hours, _ in courses)
+    availability = get_span(after.year, (after + timedelta(weeks=weeks)).year)
+
+    # The first Saturday on or after the specified date
+    day = saturday(after)
+    if day < after:
+        day += timedelta(days=7)
+    first = availability.index(day)
+
+    # Precompute the free days for the cohort and for each candidate instructor
+    cohorts = [cohort] if cohort is not None else []
+    free = {None: availability.free(cohorts=cohorts)}
+    for _, instructors in courses:
+        for pk in instructors:
+            if pk not in free:
+                free[pk] = availability.free(faculty=[pk], cohorts=cohorts)
+
+    proposals = []
+    for start in range(first, min(first + window, availability.weeks)):
+        placement = pack(courses, free, start, max_gap)
+        if placement is not None:
+            proposals.append(placement)
+
+    proposals.sort(key=lambda p: (end_of(p) - start_of(p), start_of(p)))
+    return [make_proposal(availability, p) for p in proposals[:options]]
+
+
+def pack(courses, free, start, max_gap):
+    """
+    Greedily places each course on the earliest free Saturdays after the previous
+    course, where the first course must start exactly at the start index. Returns a
+    list of (hours, instructor, indices) or None if the courses cannot be placed.
+    """
+    placement, pos = [], start
+    for idx, (hours, instructors) in enumerate(courses):
+        best = None
+        for pk in instructors or [None]:
+            sessions = earliest(free[pk], pos, SESSIONS[hours], max_gap)
+            if sessions is None:
+                continue
+            if idx == 0 and sessions[0] != start:
+                continue
+            if best is None or sessions[-1] < best[2][-1]:
+                best = (hours, pk, sessions)
+
+        if best is None:
+            return None
+
+        placement.append(best)
+        pos = best[2][-1] + 1
+    return placement
+
+
+def earliest(bits, pos, sessions, max_gap):
+    """
+    Returns the indices of the earliest run of free Saturdays at or after pos where
+    consecutive Saturdays are at most max_gap weeks apart, or None if no run exists.
+    """
+    bits >>= pos
+    offset = pos
+    while bits:
+        # Jump to the next free Saturday and attempt to fit the course from there
+        skip = (bits & -bits).bit_length() - 1
+        bits >>= skip
+        offset += skip
+
+        run, cursor, rest = [offset], offset, bits >> 1
+        while len(run) < sessions and rest:
+            step = (rest & -rest).bit_length()
+            if step > max_gap:
+                break
+            cursor += step
+            rest >>= step
+            run.append(cursor)
+
+        if len(run) == sessions:
+            return run
+
+        bits >>= 1
+        offset += 1
+    return None
+
+
+def start_of(placement):
+    return placement[0][2][0]
+
+
+def end_of(placement):
+    return placement[-1][2][-1]
+
+
+def make_proposal(availability, placement):
+    """
+    Converts a placement of Saturday indices into course start and end dates using
+    the meeting patterns expected by Course.make_calendar_events.
+    """
+    courses = []
+    for hours, instructor, indices in placement:
+        saturdays = [availability.day(idx) for idx in indices]
+        start, end = saturdays[0], saturdays[-1]
+        if hours == 18:
+            # 18 hour courses start on the Friday evening before the first Saturday
+            start -= timedelta(days=1)
+        courses.append(ProposedCourse(hours, instructor, start, end, saturdays))
+
+    return Proposal(
+        courses[0].start, courses[-1].end,
+        end_of(placement) - start_of(placement) + 1, courses,
+    )
@@ -0,0 +1,79 @@
+# cohort.serializers
+# REST API serializers for cohort models.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Mon Oct 19 22:55:12 2026 -0400
+#
+# Copyright (C) 2026 Georgetown University
+# For license information, see LICENSE.txt
+#
+# ID: serializers.py [] benjamin@bengfort.com $
+
+"""
+REST API serializers for cohort models.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+from rest_framework import serializers
+from webfolio.serializers import SparseModelSerializer
+from cohort.models import Cohort, Course, Capstone, CalendarEvent
+
+
+##########################################################################
+## Serializers
+##########################################################################
+
+class CohortSerializer(SparseModelSerializer):
+
+    courses = serializers.PrimaryKeyRelatedField(many=True, read_only=True)
+
+    class Meta:
+        model = Cohort
+        fields = (
+            "id", "cohort", "semester", "section", "start", "end", "courses",
+            "created", "modified",
+        )
+        prefetch_related = {"courses": "courses"}
+
+
+class CourseSerializer(SparseModelSerializer):
+
+    cohort_number = serializers.IntegerField(
+        source="cohort.cohort", read_only=True, default=None
+    )
+    instructors = serializers.PrimaryKeyRelatedField(many=True, read_only=True)
+
+    class Meta:
+        model = Course
+        fields = (
+            "id", "cohort", "cohort_number", "semester", "course_id", "section",
+            "title", "hours", "start", "end", "instructors", "created", "modified",
+        )
+        select_related = {"cohort_number": "cohort"}
+        prefetch_related = {"instructors": "instructors"}
+
+
+class CapstoneSerializer(SparseModelSerializer):
+
+    cohort_number = serializers.IntegerField(source="cohort.cohort", read_only=True)
+
+    class Meta:
+        model = Capstone
+        fields = ("id", "cohort", "cohort_number", "title", "created", "modified")
+        select_related = {"cohort_number": "cohort"}
+
+
+class CalendarEventSerializer(SparseModelSerializer):
+
+    attendees = serializers.PrimaryKeyRelatedField(many=True, read_only=True)
+
+    class Meta:
+        model = CalendarEvent
+        fields = (
+            "id", "summary", "location", "description", "start", "end", "timezone",
+            "is_holiday", "course", "attendees", "created", "modified",
+        )
+        prefetch_related = {"attendees": "attendees"}
@@ -18,9 +18,12 @@ Signals used by cohort models - imported by the apps.py configuration.
 ##########################################################################
 
 from django.dispatch import receiver
-from django.db.models.signals import pre_save
+from django.utils import timezone
+from django.db.models.signals import pre_save, post_save, post_delete, m2m_changed
 
-from cohort.models import Course
+from cohort import availability, dashboard
+from cohort.changes import stream_name
+from cohort.models import Semester, Cohort, Course, CalendarEvent, Tombstone
 
 
 @receiver(pre_save, sender=Course, dispatch_uid="check_course_defaults")
@@ -28,3 +31,101 @@ def check_course_defaults(sender, instance, **kwargs):
     # Ensure that the cohort and instance semesters are the same
     if not instance.semester and instance.cohort:
         instance.semester = instance.cohort.semester
+
+
+@receiver(pre_save, sender=Course, dispatch_uid="set_course_period")
+@receiver(pre_save, sender=Cohort, dispatch_uid="set_cohort_period")
+def set_period(sender, instance, **kwargs):
+    """
+    Reference the semester for the term and the year that the course or cohort starts.
+    """
+    if not instance.semester or not instance.start:
+        instance.period = None
+        return
+
+    key = (instance.semester, instance.start.year)
+    period = instance.period if instance.period_id else None
+    if period is None or (period.term, period.year) != key:
+        instance.period = Semester.objects.get_for(*key)
+
+
+@receiver(post_save, sender=Course, dispatch_uid="course_saved_availability")
+@receiver(post_delete, sender=Course, dispatch_uid="course_deleted_availability")
+@receiver(post_save, sender=CalendarEvent, dispatch_uid="event_saved_availability")
+@receiver(post_delete, sender=CalendarEvent, dispatch_uid="event_deleted_availability")
+@receiver(
+    m2m_changed, sender=CalendarEvent.attendees.through,
+    dispatch_uid="event_attendees_availability",
+)
+def invalidate_availability(sender, **kwargs):
+    """
+    Any change to the calendar or to course cohorts changes the Saturday bitsets.
+    """
+    availability.invalidate()
+
+
+@receiver(post_save, sender=Course, dispatch_uid="course_saved_dashboard")
+@receiver(post_delete, sender=Course, dispatch_uid="course_deleted_dashboard")
+@receiver(post_save, sender=Cohort, dispatch_uid="cohort_saved_dashboard")
+@receiver(post_delete, sender=Cohort, dispatch_uid="cohort_deleted_dashboard")
+@receiver(
+    post_save, sender="faculty.Assignment",
+    dispatch_uid="assignment_saved_dashboard",
+)
+@receiver(
+    post_delete, sender="faculty.Assignment",
+    dispatch_uid="assignment_deleted_dashboard",
+)
+@receiver(
+    post_save, sender="faculty.Faculty",
+    dispatch_uid="faculty_saved_dashboard",
+)
+@receiver(
+    post_delete, sender="faculty.Faculty",
+    dispatch_uid="faculty_deleted_dashboard",
+)
+def refresh_dashboard(sender, **kwargs):
+    """
+    Rebuild the dashboard snapshot in the background when its source data changes,
+    including faculty members since the dashboard shows their names.
+    """
+    dashboard.schedule_refresh()
+
+
+@receiver(post_delete, sender=Cohort, dispatch_uid="cohort_deleted_tombstone")
+@receiver(post_delete, sender=Course, dispatch_uid="course_deleted_tombstone")
+@receiver(post_delete, sender=CalendarEvent, dispatch_uid="event_deleted_tombstone")
+@receiver(
+    post_delete, sender="faculty.Faculty",
+    dispatch_uid="faculty_deleted_tombstone",
+)
+@receiver(
+    post_delete, sender="faculty.Assignment",
+    dispatch_uid="assignment_deleted_tombstone",
+)
+def record_tombstone(sender, instance, **kwargs):
+    """
+    Record deletions so that they are published in the change feed.
+    """
+    Tombstone.objects.create(model=stream_name(sender), object_id=str(instance.pk))
+
+
+@receiver(
+    m2m_changed, sender=CalendarEvent.attendees.through,
+    dispatch_uid="event_attendees_modified",
+)
+def touch_event_attendees(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Changing the attendees does not save the event, so update its modified timestamp
+    directly (without sending signals) so that it is published in the change feed.
+    """
+    if action not in {"post_add", "post_remove", "pre_clear"}:
+        return
+
+    if not reverse:
+        events = CalendarEvent.objects.filter(pk=instance.pk)
+    elif action == "pre_clear":
+        events = CalendarEvent.objects.filter(attendees=instance)
+    else:
+        events = CalendarEvent.objects.filter(pk__in=pk_set or [])
+    events.update(modified=timezone.now())
@@ -17,6 +17,695 @@ Cohort app tests
 ## Imports
 ##########################################################################
 
-from django.test import TestCase
+import json
+import base64
+import calendar
 
-# Create your tests here.
+from io import StringIO
+from datetime import date, datetime, timedelta, timezone
+from itertools import count
+from unittest import mock
+
+from django.urls import reverse
+from django.core.management import call_command, CommandError
+from django.test import TestCase, SimpleTestCase, TransactionTestCase
+from django.core.cache import cache
+
+from cohort import availability, changes, dashboard, integrity, scheduler
+from cohort.models import Semester, Cohort, Course, CalendarEvent, DashboardSnapshot
+from cohort.holidays import FixedHoliday, NthWeekdayHoliday
+from cohort.holidays import create_holiday, expand_rules, make_holidays
+from faculty.models import Faculty, Assignment, FACULTY_ROLES
+from webfolio.pagination import KeysetPaginator, InvalidCursor
+
+
+##########################################################################
+## Date Ranges
+##########################################################################
+
+class OverlapsTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cohort = Cohort.objects.create(
+            cohort=1, semester="FA", start=date(2021, 1, 1), end=date(2021, 12, 31)
+        )
+        dates = {
+            "XBUS-501": (date(2021, 1, 1), date(2021, 1, 31)),
+            "XBUS-502": (date(2021, 2, 1), date(2021, 2, 28)),
+            "XBUS-503": (None, date(2021, 1, 15)),
+        }
+        for course_id, (start, end) in dates.items():
+            Course.objects.create(
+                cohort=cohort, course_id=course_id, section=1, title=course_id,
+                start=start, end=end,
+            )
+
+    def overlapping(self, start, end):
+        query = Course.objects.overlaps(start, end)
+        return set(query.values_list("course_id", flat=True))
+
+    def test_inclusive_bounds(self):
+        day = date(2021, 1, 31)
+        self.assertEqual(self.overlapping(day, day), {"XBUS-501"})
+
+        overlapping = self.overlapping(day, date(2021, 2, 1))
+        self.assertEqual(overlapping, {"XBUS-501", "XBUS-502"})
+
+    def test_unbounded(self):
+        self.assertEqual(self.overlapping(date(2021, 2, 15), None), {"XBUS-502"})
+        self.assertEqual(self.overlapping(None, date(2021, 1, 1)), {"XBUS-501"})
+        self.assertEqual(self.overlapping(None, None), {"XBUS-501", "XBUS-502"})
+
+    def test_no_overlap(self):
+        self.assertEqual(self.overlapping(date(2020, 1, 1), date(2020, 12, 31)), set())
+
+
+##########################################################################
+## Holidays
+##########################################################################
+
+class HolidayTests(TestCase):
+
+    rules = (
+        FixedHoliday("Independence Day", 7, 4),
+        FixedHoliday("Fourth of July", 7, 4),
+        NthWeekdayHoliday("Labor Day", 9, calendar.MONDAY, 1),
+    )
+
+    def test_expand_rules(self):
+        days = expand_rules([2021], self.rules, convert=False)
+        self.assertEqual(days, [
+            (date(2021, 7, 4), "Independence Day"),
+            (date(2021, 9, 6), "Labor Day"),
+        ])
+
+        # Sunday holidays move to Saturday, Monday holidays to the weekend before
+        days = expand_rules([2022, 2021], self.rules)
+        self.assertEqual(days, [
+            (date(2021, 7, 3), "Independence Day"),
+            (date(2021, 9, 4), "Labor Day"),
+            (date(2022, 7, 2), "Independence Day"),
+            (date(2022, 9, 3), "Labor Day"),
+        ])
+
+    def test_make_holidays_is_idempotent(self):
+        self.assertEqual(make_holidays([2021, 2022], self.rules), 4)
+        self.assertEqual(make_holidays([2021, 2022], self.rules), 0)
+        self.assertEqual(CalendarEvent.objects.filter(is_holiday=True).count(), 4)
+
+    def test_create_holiday(self):
+        event = create_holiday(date(2021, 7, 3), "Independence Day")
+        self.assertIsNotNone(event)
+        self.assertTrue(event.is_holiday)
+        self.assertIsNone(create_holiday(date(2021, 7, 3), "Fourth of July"))
+
+        # Only one holiday per day, whatever time the existing event starts at
+        CalendarEvent.objects.create(
+            summary="Labor Day", is_holiday=True,
+            start=datetime(2021, 9, 4, 18, tzinfo=timezone.utc),
+            end=datetime(2021, 9, 4, 22, tzinfo=timezone.utc),
+        )
+        self.assertIsNone(create_holiday(date(2021, 9, 4), "Labor Day"))
+        self.assertIsNotNone(create_holiday(date(2021, 9, 5), "Labor Day"))
+        self.assertEqual(CalendarEvent.objects.filter(is_holiday=True).count(), 3)
+
+
+##########################################################################
+## Availability
+##########################################################################
+
+class AvailabilityCacheTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        builds = count()
+        patcher = mock.patch.object(
+            availability, "build_availability", side_effect=lambda year: next(builds)
+        )
+        self.build = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_cached(self):
+        first = availability.get_availability(2021)
+        self.assertEqual(availability.get_availability(2021), first)
+        self.assertEqual(self.build.call_count, 1)
+
+    def test_invalidate(self):
+        first = availability.get_availability(2021)
+        availability.invalidate()
+        self.assertNotEqual(availability.get_availability(2021), first)
+        self.assertEqual(self.build.call_count, 2)
+
+    def test_lost_version_does_not_restore_stale_entries(self):
+        availability.get_availability(2021)
+        availability.invalidate()
+        current = availability.get_availability(2021)
+
+        # Eviction or expiration of the version must not fall back to an old version
+        cache.delete(availability.CACHE_VERSION_KEY)
+        rebuilt = availability.get_availability(2021)
+        self.assertNotEqual(rebuilt, current)
+        self.assertEqual(self.build.call_count, 3)
+
+
+##########################################################################
+## Semesters
+##########################################################################
+
+class SemesterTests(TestCase):
+
+    def test_get_for(self):
+        semester = Semester.objects.get_for("FA", 2021)
+        self.assertEqual((semester.start, semester.end), (
+            date(2021, 9, 1), date(2021, 12, 31)
+        ))
+        self.assertEqual(Semester.objects.get_for("FA", 2021), semester)
+
+    def test_resolve(self):
+        self.assertEqual(Semester.objects.resolve([]), {})
+
+        fall = Semester.objects.get_for("FA", 2021)
+        with self.assertNumQueries(1):
+            self.assertEqual(Semester.objects.resolve([("FA", 2021)]), {
+                ("FA", 2021): fall
+            })
+
+        # Missing semesters are created with a single insert
+        keys = [("FA", 2021), ("SP", 2022), ("SU", 2022), ("SP", 2022)]
+        with self.assertNumQueries(3):
+            semesters = Semester.objects.resolve(keys)
+
+        self.assertEqual(set(semesters), set(keys))
+        self.assertEqual(semesters["FA", 2021], fall)
+        self.assertEqual(semesters["SU", 2022].start, date(2022, 6, 1))
+        self.assertEqual(Semester.objects.count(), 3)
+
+    def test_lookup(self):
+        semester = Semester.objects.get_for("FA", 2021)
+        self.assertEqual(semester.code, "FA2021")
+        for name in ("FA2021", "fa-2021", "Fall 2021", " FA_2021 ", str(semester.pk)):
+            self.assertEqual(Semester.objects.lookup(name), semester, name)
+
+        for name in ("", None, "FA21", "Winter 2021", "SP2021", str(semester.pk + 1)):
+            self.assertIsNone(Semester.objects.lookup(name), name)
+
+    def test_set_period(self):
+        cohort = Cohort.objects.create(
+            cohort=1, semester="FA", start=date(2021, 9, 1), end=date(2022, 6, 30)
+        )
+        self.assertEqual((cohort.period.term, cohort.period.year), ("FA", 2021))
+
+        # Courses default to the semester of their cohort
+        course = Course.objects.create(
+            cohort=cohort, course_id="XBUS-501", section=1, title="Foundations",
+            start=date(2022, 1, 15),
+        )
+        self.assertEqual((course.period.term, course.period.year), ("FA", 2022))
+
+        course.semester = "SP"
+        course.save()
+        self.assertEqual((course.period.term, course.period.year), ("SP", 2022))
+
+        course.start = None
+        course.save()
+        self.assertIsNone(course.period)
+        self.assertEqual(Semester.objects.count(), 3)
+
+
+##########################################################################
+## Scheduler
+##########################################################################
+
+class SchedulerTests(SimpleTestCase):
+
+    def setUp(self):
+        # Weeks are indexed from the first Saturday of 2021
+        self.availability = availability.Availability(date(2021, 1, 2), 52)
+        patcher = mock.patch.object(
+            scheduler, "get_span", return_value=self.availability
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def busy(self, *weeks, faculty=None):
+        bits = sum(1 << idx for idx in weeks)
+        if faculty is None:
+            self.availability.holidays |= bits
+        else:
+            self.availability.faculty[faculty] = bits
+
+    def propose(self, courses, **kwargs):
+        kwargs.setdefault("after", date(2021, 1, 2))
+        return scheduler.propose_schedule(courses, **kwargs)
+
+    def test_earliest(self):
+        bits = 0b1011
+        self.assertEqual(scheduler.earliest(bits, 0, 2, 2), [0, 1])
+        self.assertEqual(scheduler.earliest(bits, 1, 2, 2), [1, 3])
+        self.assertIsNone(scheduler.earliest(bits, 1, 2, 1))
+        self.assertIsNone(scheduler.earliest(0, 0, 1, 2))
+
+    def test_packs_around_holidays(self):
+        self.busy(1)
+        proposal = self.propose([(12, []), (18, [])], window=1)[0]
+        self.assertEqual(proposal.weeks, 5)
+        first, second = proposal.courses
+        self.assertEqual(first.saturdays, [date(2021, 1, 2), date(2021, 1, 16)])
+        self.assertEqual(second.saturdays, [date(2021, 1, 23), date(2021, 1, 30)])
+
+        # 18 hour courses start on the Friday before their first Saturday
+        self.assertEqual(second.start, date(2021, 1, 22))
+        self.assertEqual(proposal.end, date(2021, 1, 30))
+
+    def test_ranked_by_weeks(self):
+        self.busy(1)
+        proposals = self.propose([(12, [])], window=3)
+        self.assertEqual([p.start for p in proposals], [
+            date(2021, 1, 16), date(2021, 1, 2)
+        ])
+        self.assertEqual([p.weeks for p in proposals], [2, 3])
+
+    def test_max_gap(self):
+        self.busy(1, 2)
+        self.assertEqual(self.propose([(12, [])], window=1, max_gap=2), [])
+
+        proposal = self.propose([(12, [])], window=1, max_gap=3)[0]
+        self.assertEqual(proposal.courses[0].saturdays, [
+            date(2021, 1, 2), date(2021, 1, 23)
+        ])
+
+    def test_first_course_pinned_to_start(self):
+        self.busy(0)
+        self.assertEqual(self.propose([(6, [])], window=1), [])
+
+        proposals = self.propose([(6, [])], window=2)
+        self.assertEqual(len(proposals), 1)
+        self.assertEqual(proposals[0].start, date(2021, 1, 9))
+
+        # An instructor who is busy on the start week cannot teach the first course
+        self.busy(1, faculty=1)
+        self.assertEqual(self.propose([(6, [1])], window=2), [])
+
+    def test_instructor_choice(self):
+        self.busy(1, faculty=1)
+        proposal = self.propose([(6, []), (6, [1, 2])], window=1)[0]
+        self.assertEqual(proposal.courses[1].instructor, 2)
+        self.assertEqual(proposal.courses[1].start, date(2021, 1, 9))
+
+        # Ties go to the first instructor listed
+        proposal = self.propose([(6, []), (6, [2, 3])], window=1)[0]
+        self.assertEqual(proposal.courses[1].instructor, 2)
+
+    def test_invalid_courses(self):
+        with self.assertRaises(ValueError):
+            self.propose([(9, [])])
+        with self.assertRaises(ValueError):
+            self.propose([])
+
+
+##########################################################################
+## Dashboard
+##########################################################################
+
+class DashboardSnapshotTests(TestCase):
+
+    def test_refresh_past_day(self):
+        day = date(2020, 1, 6)
+        data = dashboard.refresh(day)
+        self.assertEqual(data["num_active_courses"], 0)
+        self.assertEqual(DashboardSnapshot.objects.get(date=day).data, data)
+
+    def test_refresh_prunes_earlier_days(self):
+        dashboard.refresh(date(2020, 1, 6))
+        data = dashboard.refresh(date(2020, 1, 7))
+        self.assertEqual(
+            list(DashboardSnapshot.objects.values_list("date", flat=True)),
+            [date(2020, 1, 7)],
+        )
+        self.assertEqual(dashboard.get_snapshot(date(2020, 1, 7)), data)
+
+    def test_faculty_changes_refresh(self):
+        with mock.patch.object(dashboard, "schedule_refresh") as schedule_refresh:
+            member = Faculty.objects.create(first_name="Jane", last_name="Doe")
+            member.last_name = "Smith"
+            member.save()
+        self.assertEqual(schedule_refresh.call_count, 2)
+
+
+class DashboardCommandTests(TransactionTestCase):
+
+    def setUp(self):
+        patcher = mock.patch.object(dashboard, "refresh_async")
+        self.refresh_async = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        today = date.today()
+        with dashboard.synchronous():
+            cohort = Cohort.objects.create(
+                cohort=1, semester="FA", start=today - timedelta(days=30),
+                end=today + timedelta(days=300),
+            )
+            self.member = Faculty.objects.create(first_name="Jane", last_name="Doe")
+            Assignment.objects.create(
+                faculty=self.member, cohort=cohort, role=FACULTY_ROLES.Advisor
+            )
+
+    def advisors(self):
+        data = DashboardSnapshot.objects.get(date=date.today()).data
+        return [advisor["name"] for advisor in data["current_cohorts"][0]["advisors"]]
+
+    def test_block_refreshes_on_exit(self):
+        self.assertEqual(self.advisors(), ["Jane Doe"])
+        with dashboard.synchronous():
+            self.member.first_name = "Janet"
+            self.member.save()
+            self.assertEqual(self.advisors(), ["Jane Doe"])
+
+        self.assertEqual(self.advisors(), ["Janet Doe"])
+        self.refresh_async.assert_not_called()
+
+    def test_command_refreshes_synchronously(self):
+        # The display name is stale until derivefaculty recomputes it
+        Faculty.objects.update(first_name="Janet")
+        call_command("derivefaculty", stdout=StringIO())
+        self.refresh_async.assert_not_called()
+        self.assertEqual(self.advisors(), ["Janet Doe"])
+
+    def test_nested_blocks_refresh_once(self):
+        with mock.patch.object(dashboard, "refresh") as refresh:
+            with dashboard.synchronous():
+                with dashboard.synchronous():
+                    dashboard.schedule_refresh()
+                    dashboard.schedule_refresh()
+                refresh.assert_not_called()
+        refresh.assert_called_once_with()
+
+
+class DashboardDebounceTests(SimpleTestCase):
+
+    @mock.patch.object(dashboard, "REFRESH_DELAY", 0.1)
+    @mock.patch.object(dashboard, "refresh")
+    def test_burst_refreshes_once(self, refresh):
+        for _ in range(5):
+            dashboard.refresh_async()
+
+        # Wait for the background worker to finish
+        self.assertTrue(dashboard._refreshing.acquire(timeout=5))
+        dashboard._refreshing.release()
+        self.assertEqual(refresh.call_count, 1)
+
+
+##########################################################################
+## Change Feed
+##########################################################################
+
+class ChangeFeedTests(TestCase):
+
+    def setUp(self):
+        patcher = mock.patch.object(changes, "SETTLE", timedelta(0))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.cohort = Cohort.objects.create(
+            cohort=1, semester="FA", start=date(2021, 1, 1), end=date(2021, 12, 31)
+        )
+        self.courses = [
+            Course.objects.create(
+                cohort=self.cohort, course_id="XBUS-50{}".format(idx), section=1,
+                title="Course {}".format(idx),
+            )
+            for idx in range(3)
+        ]
+        self.faculty = Faculty.objects.create(first_name="Jane", last_name="Doe")
+
+    def sync(self, since=None, limit=2):
+        received = []
+        while True:
+            page = changes.get_changes(since, limit)
+            received.extend(page["changes"])
+            since = page["cursor"]
+            if not page["more"]:
+                return received, since
+
+    def test_cursor_encoding(self):
+        position = (datetime(2021, 1, 1, 12, tzinfo=timezone.utc), 2, 42)
+        cursor = changes.encode_cursor(position)
+        self.assertEqual(changes.decode_cursor(cursor), (position[0], 2, "42"))
+        self.assertIsNone(changes.encode_cursor(None))
+        self.assertIsNone(changes.decode_cursor(""))
+
+        invalid = (
+            "not a cursor!",
+            base64.urlsafe_b64encode(b'["2021-01-01T00:00:00Z", 9, 1]').decode(),
+            base64.urlsafe_b64encode(b'["yesterday", 1, 1]').decode(),
+            base64.urlsafe_b64encode(b'{"ts": 1}').decode(),
+        )
+        for cursor in invalid:
+            with self.assertRaises(ValueError):
+                changes.decode_cursor(cursor)
+
+    def test_paging(self):
+        received, cursor = self.sync()
+        objects = [(change["type"], change["id"]) for change in received]
+        expected = [("cohort", self.cohort.pk), ("faculty", self.faculty.pk)]
+        expected += [("course", course.pk) for course in self.courses]
+        self.assertEqual(sorted(objects), sorted(expected))
+
+        timestamps = [change["timestamp"] for change in received]
+        self.assertEqual(timestamps, sorted(timestamps))
+        self.assertEqual(self.sync(cursor), ([], cursor))
+
+        # Only the changes since the cursor are published
+        self.faculty.save()
+        received, _ = self.sync(cursor)
+        self.assertEqual(
+            [(change["op"], change["id"]) for change in received],
+            [(changes.UPSERT, self.faculty.pk)],
+        )
+
+    def test_deletes(self):
+        _, cursor = self.sync()
+        pk = self.courses[0].pk
+        self.courses[0].delete()
+
+        received, _ = self.sync(cursor)
+        self.assertEqual(len(received), 1)
+        self.assertEqual(
+            (received[0]["op"], received[0]["type"], received[0]["id"]),
+            (changes.DELETE, "course", pk),
+        )
+        self.assertIs(type(received[0]["id"]), type(self.courses[1].pk))
+
+
+##########################################################################
+## Keyset Pagination
+##########################################################################
+
+class KeysetPaginatorTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cohorts = {
+            number: Cohort.objects.create(
+                cohort=number, semester="FA", start=date(2021, 1, 1),
+                end=date(2021, 12, 31),
+            )
+            for number in (1, 2)
+        }
+        courses = (
+            ("XBUS-501", 1, date(2021, 2, 1)),
+            ("XBUS-502", 1, date(2021, 3, 1)),
+            ("XBUS-503", 1, None),
+            ("XBUS-504", 2, date(2021, 2, 1)),
+            ("XBUS-505", None, date(2021, 4, 1)),
+            ("XBUS-506", None, None),
+            ("XBUS-507", None, date(2021, 4, 1)),
+        )
+        for course_id, cohort, end in courses:
+            Course.objects.create(
+                cohort=cohorts.get(cohort), course_id=course_id, section=1,
+                title=course_id, end=end,
+            )
+
+    def paginate(self, ordering, per_page):
+        paginator = KeysetPaginator(Course.objects.all(), ordering, per_page)
+        pages, cursor = [], None
+        while True:
+            page = paginator.page(cursor)
+            pages.append([course.course_id for course in page])
+            if not page.has_next():
+                return pages
+            cursor = page.next_cursor
+
+    def test_descending_nulls_first(self):
+        expected = [
+            "XBUS-506", "XBUS-505", "XBUS-507", "XBUS-504",
+            "XBUS-503", "XBUS-502", "XBUS-501",
+        ]
+        for per_page in (1, 2, 3, 10):
+            pages = self.paginate(("-cohort__cohort", "-end"), per_page)
+            self.assertEqual(sum(pages, []), expected)
+            self.assertTrue(all(len(page) <= per_page for page in pages))
+
+    def test_ascending_nulls_last(self):
+        expected = [
+            "XBUS-501", "XBUS-502", "XBUS-503", "XBUS-504",
+            "XBUS-505", "XBUS-507", "XBUS-506",
+        ]
+        for per_page in (1, 2, 3, 10):
+            pages = self.paginate(("cohort__cohort", "end"), per_page)
+            self.assertEqual(sum(pages, []), expected)
+
+    def test_cursor_encoding(self):
+        paginator = KeysetPaginator(Course.objects.all(), ("end",), 1)
+        page = paginator.page()
+        course = page.object_list[0]
+        self.assertEqual(course.course_id, "XBUS-501")
+
+        cursor = page.next_cursor
+        self.assertNotIn("=", cursor)
+        self.assertEqual(paginator.decode(cursor), [date(2021, 2, 1), course.pk])
+        self.assertEqual(paginator.page(cursor).cursor, cursor)
+
+    def test_invalid_cursor(self):
+        def encode(values):
+            data = json.dumps(values).encode("utf-8")
+            return base64.urlsafe_b64encode(data).decode("ascii")
+
+        paginator = KeysetPaginator(Course.objects.all(), ("end",), 1)
+        cursors = (
+            "not a cursor!", encode({"end": "2021-02-01"}),
+            encode(["2021-02-01"]), encode(["not a date", 1]),
+        )
+        for cursor in cursors:
+            with self.assertRaises(InvalidCursor):
+                paginator.decode(cursor)
+
+
+##########################################################################
+## Integrity Checks
+##########################################################################
+
+class IntegrityCheckTests(TestCase):
+
+    def setUp(self):
+        cohort = Cohort.objects.create(
+            cohort=1, semester="FA", start=date(2021, 1, 1), end=date(2021, 6, 30)
+        )
+        self.course = Course.objects.create(
+            cohort=cohort, course_id="XBUS-501", section=1, title="Foundations",
+            start=date(2021, 1, 1), end=date(2021, 3, 31),
+        )
+        self.event = self.make_event(date(2021, 1, 9))
+        self.faculty = Faculty.objects.create(
+            first_name="Jane", last_name="Doe", email="jane@example.com"
+        )
+        self.assignment = Assignment.objects.create(
+            faculty=self.faculty, course=self.course, role=FACULTY_ROLES.Instructor
+        )
+
+    def make_event(self, day, course=None, **kwargs):
+        start = datetime(day.year, day.month, day.day, 14, tzinfo=timezone.utc)
+        return CalendarEvent.objects.create(
+            summary="Session", course=course or self.course,
+            start=start, end=start + timedelta(hours=4), **kwargs
+        )
+
+    def assertViolations(self, name, *expected):
+        counts = {check.name: count for check, count in integrity.run_checks()}
+        self.assertEqual(counts.pop(name), len(expected), name)
+        self.assertFalse(any(counts.values()), counts)
+
+        check = next(check for check in integrity.CHECKS if check.name == name)
+        self.assertEqual(set(check.examples()), set(expected))
+
+    def test_clean(self):
+        counts = integrity.run_checks()
+        self.assertEqual(len(counts), len(integrity.CHECKS))
+        self.assertFalse(any(count for _, count in counts))
+
+    def test_assignment_dates(self):
+        self.assignment.end = date(2021, 3, 31)
+        self.assignment.save()
+        self.assertViolations("assignment-dates")
+
+        self.assignment.end = date(2021, 4, 1)
+        self.assignment.save()
+        self.assertViolations("assignment-dates", self.assignment)
+
+    def test_course_effort(self):
+        self.assignment.effort = 50
+        self.assignment.save()
+        self.assertViolations("course-effort", self.course)
+
+        # Assistants do not count towards the effort of the course
+        Assignment.objects.create(
+            faculty=self.faculty, course=self.course, role=FACULTY_ROLES.TA, effort=50
+        )
+        self.assertViolations("course-effort", self.course)
+
+        self.assignment.effort = 100
+        self.assignment.save()
+        self.assertViolations("course-effort")
+
+    def test_event_dates(self):
+        self.make_event(date(2021, 3, 31))
+        self.assertViolations("event-dates")
+
+        event = self.make_event(date(2021, 4, 1))
+        self.assertViolations("event-dates", event)
+
+    def test_course_events(self):
+        # Courses without dates are not expected to have events
+        Course.objects.create(
+            cohort=self.course.cohort, course_id="XBUS-502", section=1, title="TBD"
+        )
+        self.assertViolations("course-events")
+
+        self.event.delete()
+        self.assertViolations("course-events", self.course)
+
+    def test_holiday_events(self):
+        create_holiday(date(2021, 1, 16), "Holiday")
+        self.assertViolations("holiday-events")
+
+        event = self.make_event(date(2021, 1, 16))
+        self.assertViolations("holiday-events", event)
+
+    def test_faculty_email(self):
+        Faculty.objects.create(first_name="John", last_name="Smith", exclude=True)
+        self.assertViolations("faculty-email")
+
+        member = Faculty.objects.create(first_name="Jill", last_name="Smith")
+        self.assertViolations("faculty-email", member)
+
+    def test_checkschedule(self):
+        stdout = StringIO()
+        call_command("checkschedule", "--fail", stdout=stdout)
+        self.assertIn("0 of 6 schedule checks failed", stdout.getvalue())
+
+        self.event.delete()
+        call_command("checkschedule", stdout=StringIO())
+        with self.assertRaisesMessage(CommandError, "1 of 6 schedule checks failed"):
+            call_command("checkschedule", "--fail", stdout=StringIO())
+
+        # Only the specified checks are run
+        stdout = StringIO()
+        call_command("checkschedule", "--fail", "-c", "event-dates", stdout=stdout)
+        self.assertIn("0 of 1 schedule checks failed", stdout.getvalue())
+
+
+##########################################################################
+## Views
+##########################################################################
+
+class ListViewTests(TestCase):
+
+    def test_login_required(self):
+        for name in ("cohort_list", "course_list", "capstone_list"):
+            url = reverse(name)
+            response = self.client.get(url, HTTP_HOST="localhost")
+            self.assertRedirects(
+                response, "/login/?next=" + url, fetch_redirect_response=False
+            )
@@ -21,14 +21,32 @@ from django.urls import reverse
 from django.views.generic import ListView, FormView
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
 
-from cohort.models import Cohort, Course, Capstone
+from rest_framework import viewsets
+from rest_framework.response import Response
+from rest_framework.exceptions import ParseError
+
+from cohort.changes import get_changes, decode_cursor
+from webfolio.views import ReadOnlyAPIViewSet
+from webfolio.pagination import KeysetPaginationMixin
+from webfolio.conditional import ConditionalListMixin
 from cohort.forms import CalendarEventsForm, HolidayForm
+from cohort.models import Cohort, Course, Capstone, CalendarEvent
+from cohort.serializers import CohortSerializer, CourseSerializer
+from cohort.serializers import CapstoneSerializer, CalendarEventSerializer
 
 
-class CohortListView(ListView, LoginRequiredMixin):
+class CohortListView(
+    LoginRequiredMixin, ConditionalListMixin, KeysetPaginationMixin, ListView,
+):
 
     model = Cohort
     context_object_name = "cohorts"
+    ordering = ("-cohort",)
+    fragment_template_name = "cohort/cohort_rows.html"
+
+    def get_queryset(self):
+        qs = super(CohortListView, self).get_queryset()
+        return qs.only("cohort", "semester", "section", "start", "end")
 
     def get_context_data(self, **kwargs):
         context = super(CohortListView, self).get_context_data(**kwargs)
@@ -36,14 +54,21 @@ class CohortListView(ListView, LoginRequiredMixin):
         return context
 
 
-class CourseListView(ListView, LoginRequiredMixin):
+class CourseListView(
+    LoginRequiredMixin, ConditionalListMixin, KeysetPaginationMixin, ListView,
+):
 
     model = Course
+    conditional_models = (Course, Cohort)
     context_object_name = "courses"
+    ordering = ("-cohort__cohort", "-end")
+    fragment_template_name = "cohort/course_rows.html"
 
     def get_queryset(self):
-        qs = super(CourseListView, self).get_queryset()
-        return qs.order_by("-cohort__cohort", "-end")
+        qs = super(CourseListView, self).get_queryset().select_related("cohort")
+        return qs.only(
+            "course_id", "section", "title", "hours", "start", "end", "cohort__cohort",
+        )
 
     def get_context_data(self, **kwargs):
         context = super(CourseListView, self).get_context_data(**kwargs)
@@ -51,10 +76,16 @@ class CourseListView(ListView, LoginRequiredMixin):
         return context
 
 
-class CapstoneListView(ListView, LoginRequiredMixin):
+class CapstoneListView(LoginRequiredMixin, KeysetPaginationMixin, ListView):
 
     model = Capstone
     context_object_name = "capstones"
+    ordering = ("-cohort__cohort", "title")
+    fragment_template_name = "cohort/capstone_rows.html"
+
+    def get_queryset(self):
+        qs = super(CapstoneListView, self).get_queryset().select_related("cohort")
+        return qs.only("title", "cohort__cohort")
 
     def get_context_data(self, **kwargs):
         context = super(CapstoneListView, self).get_context_data(**kwargs)
@@ -106,3 +137,74 @@ class HolidayView(UserPassesTestMixin, FormView):
         context = super(HolidayView, self).get_context_data(**kwargs)
         context["page"] = "admin/holiday"
         return context
+
+
+##########################################################################
+## API Views
+##########################################################################
+
+class CohortViewSet(ReadOnlyAPIViewSet):
+    """
+    Cohorts and the ids of their courses.
+    """
+
+    queryset = Cohort.objects.all()
+    serializer_class = CohortSerializer
+
+
+class CourseViewSet(ReadOnlyAPIViewSet):
+    """
+    Courses and the ids of their instructors.
+    """
+
+    queryset = Course.objects.all()
+    serializer_class = CourseSerializer
+
+
+class CapstoneViewSet(ReadOnlyAPIViewSet):
+    """
+    Capstone projects and their cohorts.
+    """
+
+    queryset = Capstone.objects.all()
+    serializer_class = CapstoneSerializer
+
+
+class CalendarEventViewSet(ReadOnlyAPIViewSet):
+    """
+    Course events and holidays on the calendar and the ids of their attendees.
+    """
+
+    queryset = CalendarEvent.objects.all()
+    serializer_class = CalendarEventSerializer
+
+
+class ChangesViewSet(viewsets.ViewSet):
+    """
+    The schedule objects created, modified, or deleted since the cursor returned by the
+    previous request, e.g. ?since=<cursor>&limit=100 (omit since for a full sync).
+    Request again with the returned cursor until more is false.
+
+    Changes are published a few seconds after they are written (see SETTLE in
+    cohort.changes) so that transactions that commit out of order are not skipped. A
+    change whose transaction commits later than that can be missed, so clients should
+    run a full sync after a long running import.
+    """
+
+    max_limit = 500
+
+    def list(self, request):
+        try:
+            limit = int(request.query_params.get("limit", 100))
+        except ValueError:
+            raise ParseError("limit must be an integer")
+
+        if not 1 <= limit <= self.max_limit:
+            raise ParseError("limit must be between 1 and {}".format(self.max_limit))
+
+        since = request.query_params.get("since")
+        try:
+            decode_cursor(since)
+        except ValueError as e:
+            raise ParseError(str(e))
+        return Response(get_changes(since, limit, request))
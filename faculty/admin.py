@@ -17,14 +17,37 @@ Faculty app admin site management.
 ## Imports
 ##########################################################################
 
-from django.contrib import admin
+from django.contrib import admin, messages
 from .models import Faculty, Assignment, Contact
 
+from faculty import roster, profile
+from cohort import dashboard
+
+
+##########################################################################
+## Admin Forms
+##########################################################################
+
+class AssignmentAdmin(admin.ModelAdmin):
+
+    actions = ["apply_defaults"]
+
+    @admin.action(description="Fill in blank fields from the course or cohort")
+    def apply_defaults(self, request, queryset):
+        updated = queryset.apply_defaults()
+        if updated:
+            roster.invalidate()
+            profile.invalidate()
+            dashboard.schedule_refresh()
+
+        message = "applied defaults to {} assignments".format(updated)
+        self.message_user(request, message, messages.SUCCESS)
+
 
 ##########################################################################
 ## Register your models here
 ##########################################################################
 
 admin.site.register(Faculty)
-admin.site.register(Assignment)
+admin.site.register(Assignment, AssignmentAdmin)
 admin.site.register(Contact)
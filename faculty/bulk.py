@@ -0,0 +1,449 @@
+# faculty.bulk
+# Validate and apply bulk upserts of courses and faculty assignments.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Mon Oct 19 23:18:06 2026 -0400
+#
+# Copyright (C) 2026 Georgetown University
+# For license information, see LICENSE.txt
+#
+# ID: bulk.py [] benjamin@bengfort.com $
+
+"""
+Validate and apply bulk upserts of courses and faculty assignments.
+
+Scheduling tools push a semester of changes as lists of course and assignment records
+that are keyed on their natural keys (the course ID and section of a course, and the
+faculty member, cohort, course, and role of an assignment) rather than on database ids.
+Every record is validated and all references are resolved with one query per model
+before anything is written; if any record is invalid, nothing is applied. Otherwise
+the records are written in a single transaction with bulk inserts and updates and the
+assignment defaults are filled in with a single update.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+from django.apps import apps
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.settings import api_settings
+
+from faculty import roster, profile
+from cohort import availability, dashboard
+from cohort.models import SEMESTER
+from faculty.models import FACULTY_ROLES
+
+
+CREATED = "created"
+UPDATED = "updated"
+UNCHANGED = "unchanged"
+INVALID = "invalid"
+VALID = "valid"
+
+# Errors of a record as a whole rather than of one of its fields
+NON_FIELD = api_settings.NON_FIELD_ERRORS_KEY
+
+
+##########################################################################
+## Record Serializers
+##########################################################################
+
+class DateRangeSerializer(serializers.Serializer):
+    """
+    Checks the dates of a record when both are specified; dates that are merged with
+    an existing row are checked when the batch is resolved.
+    """
+
+    def validate(self, data):
+        if data.get("start") and data.get("end") and data["start"] > data["end"]:
+            raise serializers.ValidationError("start must be on or before end")
+        return data
+
+
+class BulkCourseSerializer(DateRangeSerializer):
+    """
+    A course identified by its course ID and section, e.g. XBUS-500 section 1. The
+    cohort is specified by its cohort number.
+    """
+
+    course_id = serializers.CharField(max_length=55)
+    section = serializers.IntegerField(min_value=0)
+    title = serializers.CharField(max_length=255, required=False)
+    cohort = serializers.IntegerField(min_value=1, required=False, allow_null=True)
+    semester = serializers.ChoiceField(choices=SEMESTER, required=False)
+    hours = serializers.IntegerField(min_value=0, required=False, allow_null=True)
+    start = serializers.DateField(required=False, allow_null=True)
+    end = serializers.DateField(required=False, allow_null=True)
+
+
+class BulkAssignmentSerializer(DateRangeSerializer):
+    """
+    An assignment identified by the faculty member (slug or netid), the cohort number,
+    the course ID and section (if it is instructional), and the role.
+    """
+
+    faculty = serializers.CharField(max_length=80)
+    cohort = serializers.IntegerField(min_value=1, required=False, allow_null=True)
+    course_id = serializers.CharField(max_length=55, required=False, allow_null=True)
+    section = serializers.IntegerField(min_value=0, required=False, allow_null=True)
+    role = serializers.ChoiceField(
+        choices=FACULTY_ROLES, default=FACULTY_ROLES.Instructor
+    )
+    start = serializers.DateField(required=False, allow_null=True)
+    end = serializers.DateField(required=False, allow_null=True)
+    hours = serializers.IntegerField(min_value=0, required=False, allow_null=True)
+    effort = serializers.IntegerField(
+        min_value=1, max_value=100, required=False, allow_null=True
+    )
+    primary = serializers.BooleanField(required=False)
+
+    def validate(self, data):
+        data = super(BulkAssignmentSerializer, self).validate(data)
+        if bool(data.get("course_id")) != (data.get("section") is not None):
+            raise serializers.ValidationError(
+                "specify both the course_id and section of the course"
+            )
+        if not data.get("course_id") and not data.get("cohort"):
+            raise serializers.ValidationError("specify a course or a cohort")
+        return data
+
+
+##########################################################################
+## Bulk Upserts
+##########################################################################
+
+class BulkUpsert(object):
+    """
+    Validates and applies a batch of course and assignment upserts. The results list
+    the status of every record by its index in the batch, along with its id once it
+    has been written or the errors that prevented the batch from being applied.
+    """
+
+    COURSE_FIELDS = ("title", "semester", "hours", "start", "end")
+    ASSIGNMENT_FIELDS = ("start", "end", "hours", "effort", "primary")
+
+    def __init__(self, courses=None, assignments=None):
+        self.courses = self.validate(BulkCourseSerializer, courses or [])
+        self.assignments = self.validate(BulkAssignmentSerializer, assignments or [])
+        self.resolve()
+
+    @property
+    def is_valid(self):
+        return not any(
+            result["status"] == INVALID
+            for result in self.results["courses"] + self.results["assignments"]
+        )
+
+    @property
+    def results(self):
+        return {
+            "courses": [result for result, _ in self.courses],
+            "assignments": [result for result, _ in self.assignments],
+        }
+
+    def validate(self, serializer_class, records):
+        validated = []
+        for idx, record in enumerate(records):
+            serializer = serializer_class(data=record)
+            result = {"index": idx, "status": VALID}
+            if serializer.is_valid():
+                validated.append((result, serializer.validated_data))
+            else:
+                result.update(status=INVALID, errors=serializer.errors)
+                validated.append((result, None))
+        return validated
+
+    def error(self, result, field, message):
+        result["status"] = INVALID
+        result.setdefault("errors", {}).setdefault(field, []).append(message)
+
+    def valid(self, records):
+        return [(result, data) for result, data in records if data is not None]
+
+    def resolve(self):
+        """
+        Fetches the cohorts, faculty members, courses, and assignments referenced by the
+        records with one query each and checks that every reference exists, that no
+        row is upserted twice, and that the dates of every row are in order once the
+        record has been merged with the existing row.
+        """
+        Cohort = apps.get_model(app_label="cohort", model_name="Cohort")
+        Course = apps.get_model(app_label="cohort", model_name="Course")
+        Faculty = apps.get_model(app_label="faculty", model_name="Faculty")
+
+        courses, assignments = self.valid(self.courses), self.valid(self.assignments)
+
+        numbers = {
+            data["cohort"] for _, data in courses + assignments if data.get("cohort")
+        }
+        self.cohorts = {c.cohort: c for c in Cohort.objects.filter(cohort__in=numbers)}
+
+        members = {data["faculty"] for _, data in assignments}
+        self.faculty = {}
+        query = Faculty.objects.filter(Q(slug__in=members) | Q(netid__in=members))
+        for member in query:
+            self.faculty[member.slug] = member
+            if member.netid:
+                self.faculty.setdefault(member.netid, member)
+
+        keys = {(data["course_id"], data["section"]) for _, data in courses}
+        keys |= {
+            (data["course_id"], data["section"]) for _, data in assignments
+            if data.get("course_id")
+        }
+        self.existing_courses = {}
+        if keys:
+            query = Course.objects.filter(
+                course_id__in={k[0] for k in keys}, section__in={k[1] for k in keys}
+            ).select_related("cohort").order_by()
+            self.existing_courses = {
+                (c.course_id, c.section): c for c in query
+                if (c.course_id, c.section) in keys
+            }
+
+        # The cohort and dates of every course once the batch has been applied
+        merged = {
+            key: (course.cohort, course.start, course.end)
+            for key, course in self.existing_courses.items()
+        }
+
+        seen = set()
+        for result, data in courses:
+            key = (data["course_id"], data["section"])
+            if key in seen:
+                self.error(result, "course_id", "duplicate course in the batch")
+            seen.add(key)
+
+            if data.get("cohort") and data["cohort"] not in self.cohorts:
+                self.error(result, "cohort", "unknown cohort {}".format(data["cohort"]))
+            if key not in self.existing_courses and not data.get("title"):
+                self.error(result, "title", "a title is required to create a course")
+
+            cohort, start, end = merged.get(key, (None, None, None))
+            if "cohort" in data:
+                cohort = self.cohorts.get(data["cohort"])
+            start, end = data.get("start", start), data.get("end", end)
+            if start and end and start > end:
+                self.error(result, NON_FIELD, "start must be on or before end")
+            merged[key] = (cohort, start, end)
+
+        self.existing_assignments = self.fetch_assignments(assignments)
+
+        seen, self.assignment_keys = set(), {}
+        for result, data in assignments:
+            if data["faculty"] not in self.faculty:
+                self.error(
+                    result, "faculty",
+                    "unknown faculty member {}".format(data["faculty"]),
+                )
+            if data.get("cohort") and data["cohort"] not in self.cohorts:
+                self.error(result, "cohort", "unknown cohort {}".format(data["cohort"]))
+
+            course = None
+            if data.get("course_id"):
+                course = (data["course_id"], data["section"])
+                if course not in merged:
+                    message = "unknown course {}-{}".format(*course)
+                    self.error(result, "course_id", message)
+
+            if result["status"] == INVALID:
+                continue
+
+            # The cohort defaults to the course cohort (see Assignment.apply_defaults)
+            cohort = self.cohorts.get(data.get("cohort"))
+            if cohort is None and course is not None:
+                cohort = merged[course][0]
+
+            key = (
+                self.faculty[data["faculty"]].pk, getattr(cohort, "pk", None),
+                course, data["role"],
+            )
+            if key in seen:
+                self.error(result, NON_FIELD, "duplicate assignment in the batch")
+                continue
+            seen.add(key)
+            self.assignment_keys[result["index"]] = key
+
+            # Blank dates default to the dates of the course or the cohort
+            existing = self.existing_assignments.get(key)
+            defaults = (None, None)
+            if course is not None:
+                defaults = merged[course][1:]
+            elif cohort is not None:
+                defaults = (cohort.start, cohort.end)
+
+            start, end = (
+                data.get(field, getattr(existing, field, None)) or default
+                for field, default in zip(("start", "end"), defaults)
+            )
+            if start and end and start > end:
+                self.error(result, NON_FIELD, "start must be on or before end")
+
+    def fetch_assignments(self, assignments):
+        """
+        Returns the existing assignments of the faculty members and roles referenced
+        by the assignment records by their (faculty, cohort, course key, role) keys.
+        """
+        Assignment = apps.get_model(app_label="faculty", model_name="Assignment")
+
+        members = {
+            self.faculty[data["faculty"]].pk for _, data in assignments
+            if data["faculty"] in self.faculty
+        }
+        if not members:
+            return {}
+
+        courses = {course.pk: key for key, course in self.existing_courses.items()}
+        query = Assignment.objects.filter(
+            faculty_id__in=members, role__in={data["role"] for _, data in assignments},
+        ).order_by()
+
+        existing = {}
+        for assignment in query:
+            course = assignment.course_id
+            if course is not None and course not in courses:
+                continue
+
+            key = (
+                assignment.faculty_id, assignment.cohort_id,
+                courses.get(assignment.course_id), assignment.role,
+            )
+            existing.setdefault(key, assignment)
+        return existing
+
+    def apply(self):
+        """
+        Writes the batch in a single transaction, returning the results. Raises a
+        ValueError if the batch is not valid.
+        """
+        if not self.is_valid:
+            raise ValueError("cannot apply an invalid batch")
+
+        with transaction.atomic():
+            courses = self.apply_courses()
+            self.apply_assignments(courses)
+
+        # Bulk writes do not send signals so invalidate the caches directly
+        roster.invalidate()
+        profile.invalidate()
+        availability.invalidate()
+        dashboard.schedule_refresh()
+        return self.results
+
+    def apply_courses(self):
+        Course = apps.get_model(app_label="cohort", model_name="Course")
+        Semester = apps.get_model(app_label="cohort", model_name="Semester")
+
+        now = timezone.now()
+        courses = dict(self.existing_courses)
+        created, updated = [], []
+        pending = []
+
+        for result, data in self.courses:
+            key = (data["course_id"], data["section"])
+            course = courses.get(key)
+            if course is None:
+                course = Course(course_id=key[0], section=key[1])
+                created.append((result, course))
+            else:
+                pending.append((result, course))
+
+            changed = False
+            if "cohort" in data:
+                cohort = self.cohorts.get(data["cohort"])
+                if course.cohort_id != getattr(cohort, "pk", None):
+                    course.cohort, changed = cohort, True
+
+            for field in self.COURSE_FIELDS:
+                if field in data and getattr(course, field) != data[field]:
+                    setattr(course, field, data[field])
+                    changed = True
+
+            # Matches check_course_defaults
+            if not course.semester and course.cohort is not None:
+                course.semester, changed = course.cohort.semester, True
+
+            if course.pk is not None:
+                result["status"] = UPDATED if changed else UNCHANGED
+                if changed:
+                    course.modified = now
+                    updated.append(course)
+            courses[key] = course
+
+        # Matches set_period for all of the courses in the batch with one query
+        batch = created + pending
+        semesters = Semester.objects.resolve(
+            (c.semester, c.start.year) for _, c in batch if c.semester and c.start
+        )
+        for result, course in batch:
+            period = None
+            if course.semester and course.start:
+                period = semesters.get((course.semester, course.start.year))
+            if course.period_id != getattr(period, "pk", None):
+                course.period = period
+                if course.pk is not None and result["status"] == UNCHANGED:
+                    result["status"] = UPDATED
+                    course.modified = now
+                    updated.append(course)
+
+        if created:
+            Course.objects.bulk_create([course for _, course in created])
+        if updated:
+            Course.objects.bulk_update(
+                updated, ("cohort", "period", "modified") + self.COURSE_FIELDS
+            )
+
+        for result, course in created:
+            result["status"], result["id"] = CREATED, course.pk
+        for result, course in pending:
+            result["id"] = course.pk
+        return courses
+
+    def apply_assignments(self, courses):
+        Assignment = apps.get_model(app_label="faculty", model_name="Assignment")
+
+        now = timezone.now()
+        created, updated, touched = [], [], []
+        for result, data in self.assignments:
+            key = self.assignment_keys[result["index"]]
+            assignment = self.existing_assignments.get(key)
+            if assignment is None:
+                faculty, cohort, course, role = key
+                assignment = Assignment(
+                    faculty_id=faculty, cohort_id=cohort, role=role,
+                    course=courses[course] if course is not None else None,
+                )
+
+            changed = False
+            for field in self.ASSIGNMENT_FIELDS:
+                if field in data and getattr(assignment, field) != data[field]:
+                    setattr(assignment, field, data[field])
+                    changed = True
+
+            if assignment.pk is None:
+                created.append((result, assignment))
+            else:
+                result["id"] = assignment.pk
+                result["status"] = UPDATED if changed else UNCHANGED
+                if changed:
+                    assignment.modified = now
+                    updated.append(assignment)
+                touched.append(assignment.pk)
+
+        if created:
+            Assignment.objects.bulk_create([assignment for _, assignment in created])
+            for result, assignment in created:
+                result["status"], result["id"] = CREATED, assignment.pk
+                touched.append(assignment.pk)
+
+        if updated:
+            Assignment.objects.bulk_update(
+                updated, ("modified",) + self.ASSIGNMENT_FIELDS
+            )
+
+        if touched:
+            Assignment.objects.filter(pk__in=touched).apply_defaults()
@@ -0,0 +1,156 @@
+# faculty.conflicts
+# Detect faculty members who are double-booked by their assignments or sessions.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Mon Oct 19 09:12:41 2026 -0400
+#
+# Copyright (C) 2026 Georgetown University
+# For license information, see LICENSE.txt
+#
+# ID: conflicts.py [] benjamin@bengfort.com $
+
+"""
+Detect faculty members who are double-booked by their assignments or sessions.
+
+All of the intervals in the requested date range are loaded in bulk (one query for
+instructional assignments and one for calendar event attendance), grouped by faculty
+member, and then swept in start order so that conflicts are found in O(n log n) time
+rather than by comparing every pair of assignments.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import heapq
+
+from django.apps import apps
+from itertools import groupby
+from collections import namedtuple
+from operator import attrgetter
+
+
+# Kinds of intervals that are checked for conflicts
+COURSE = "course"
+SESSION = "session"
+
+
+Interval = namedtuple(
+    "Interval", ("faculty", "kind", "start", "end", "label", "course")
+)
+
+Conflict = namedtuple("Conflict", ("faculty", "kind", "first", "second"))
+
+
+##########################################################################
+## Conflict Detection
+##########################################################################
+
+def find_conflicts(after=None, before=None, faculty=None):
+    """
+    Returns a list of conflicts for all faculty members whose instructional
+    assignments or calendar events overlap in the specified date range.
+
+    Parameters
+    ----------
+    after : date, optional
+        Only consider intervals that end on or after this date.
+    before : date, optional
+        Only consider intervals that start on or before this date.
+    faculty : iterable of int, optional
+        Limit the search to the specified faculty ids.
+    """
+    return list(sweep(load_intervals(after, before, faculty)))
+
+
+def load_intervals(after=None, before=None, faculty=None):
+    """
+    Loads all course and session intervals in the date range in two queries.
+    """
+    Assignment = apps.get_model(app_label="faculty", model_name="Assignment")
+    CalendarEvent = apps.get_model(app_label="cohort", model_name="CalendarEvent")
+
+    # Instructional assignments are inclusive date ranges
+    assignments = Assignment.objects.instructional().overlaps(after, before)
+    if faculty is not None:
+        assignments = assignments.filter(faculty_id__in=list(faculty))
+
+    # Multiple roles on the same course only count as a single interval
+    rows = assignments.order_by().values_list(
+        "faculty_id", "start", "end", "course__title", "course_id"
+    ).distinct()
+    for fid, start, end, title, course in rows:
+        yield Interval(fid, COURSE, start, end, title, course)
+
+    # Calendar events are half-open datetime ranges; holidays block the schedule for
+    # everyone and are not considered conflicts with each other.
+    Attendee = CalendarEvent.attendees.through
+    attendees = Attendee.objects.filter(
+        calendarevent__is_holiday=False,
+        calendarevent__start__isnull=False,
+        calendarevent__end__isnull=False,
+    )
+    if after is not None:
+        attendees = attendees.filter(calendarevent__end__date__gte=after)
+    if before is not None:
+        attendees = attendees.filter(calendarevent__start__date__lte=before)
+    if faculty is not None:
+        attendees = attendees.filter(faculty_id__in=list(faculty))
+
+    rows = attendees.order_by().values_list(
+        "faculty_id", "calendarevent__start", "calendarevent__end",
+        "calendarevent__summary", "calendarevent__course_id",
+    )
+    for fid, start, end, summary, course in rows:
+        yield Interval(fid, SESSION, start, end, summary, course)
+
+
+def sweep(intervals):
+    """
+    Sweeps the intervals of each faculty member and kind in start order, yielding a
+    Conflict for every pair of overlapping intervals. Course intervals are inclusive
+    dates whereas sessions are half-open datetimes. Intervals of the same course are
+    never reported as conflicting with each other (e.g. co-instructor and TA roles).
+    """
+    key = attrgetter("faculty", "kind")
+    for (fid, kind), group in groupby(sorted(intervals, key=key), key=key):
+        closed = kind == COURSE
+        active = []
+
+        for idx, interval in enumerate(sorted(group, key=attrgetter("start", "end"))):
+            # Drop all active intervals that ended before this one started
+            while active and (
+                active[0][0] < interval.start if closed
+                else active[0][0] <= interval.start
+            ):
+                heapq.heappop(active)
+
+            # Everything that is still active overlaps with the current interval
+            for _, _, other in active:
+                if other.course is not None and other.course == interval.course:
+                    continue
+                yield Conflict(fid, kind, other, interval)
+
+            # The index breaks ties so intervals themselves are never compared
+            heapq.heappush(active, (interval.end, idx, interval))
+
+
+def group_by_faculty(conflicts):
+    """
+    Returns a list of (faculty, conflicts) pairs, fetching all of the faculty members
+    referenced by the conflicts in a single query.
+    """
+    Faculty = apps.get_model(app_label="faculty", model_name="Faculty")
+
+    conflicts = sorted(conflicts, key=lambda c: (c.faculty, c.kind, c.first.start))
+    members = Faculty.objects.in_bulk(
+        {conflict.faculty for conflict in conflicts}
+    )
+
+    grouped = [
+        (members[fid], list(items))
+        for fid, items in groupby(conflicts, key=attrgetter("faculty"))
+        if fid in members
+    ]
+    grouped.sort(key=lambda item: (item[0].last_name or "", item[0].first_name or ""))
+    return grouped
@@ -21,6 +21,7 @@ import re
 import csv
 
 from django.apps import apps
+from django.db.models import Q
 from datetime import datetime
 from itertools import groupby
 from operator import itemgetter
@@ -78,6 +79,9 @@ def parse_assignments(cohort_rows):
         )
         yield cohort, created
 
+        # Fetch or create all of the faculty members of the cohort at once
+        faculty_members = load_faculty(assignment_rows)
+
         for course_id, rows in groupby(assignment_rows, itemgetter("Course ID")):
             # materialize all the rows from the iterator
             rows = list(rows)
@@ -92,7 +96,7 @@ def parse_assignments(cohort_rows):
             for row in rows:
                 # Get the faculty member(s)
                 try:
-                    faculty, created = parse_faculty(row)
+                    faculty, created = parse_faculty(row, faculty_members)
                     yield faculty, created
                 except ValueError:
                     yield ValueError(
@@ -111,22 +115,65 @@ def parse_assignments(cohort_rows):
                     yield parse_advisor(row, cohort, faculty)
 
 
-def parse_faculty(row):
+def parse_faculty(row, faculty_members=None):
     """
     Parse a faculty member by their name in the row, performs a get_or_create based on
     the first and last name of the faculty member, which isn't ideal but works well.
+    If the faculty members have been loaded with load_faculty, they are looked up
+    rather than queried; created is only True the first time a member is returned.
     """
+    kwargs = parse_faculty_name(row)
+    if kwargs is None:
+        raise ValueError("row does not contain either first or last name!")
+
+    if faculty_members is not None:
+        key = (kwargs["first_name"], kwargs["last_name"])
+        faculty, created = faculty_members[key]
+        faculty_members[key] = (faculty, False)
+        return faculty, created
+
+    Faculty = apps.get_model(app_label="faculty", model_name="Faculty")
+    return Faculty.objects.get_or_create(**kwargs)
+
+
+def parse_faculty_name(row):
     kwargs = {
         field.replace(" ", "_").lower(): row[field]
         for field in ("First Name", "Last Name")
         if field in row and row[field] and row[field] != "--"
     }
+    return kwargs if len(kwargs) == 2 else None
 
-    if len(kwargs) != 2:
-        raise ValueError("row does not contain either first or last name!")
 
+def load_faculty(rows):
+    """
+    Fetches the faculty members named in the rows with a single query and creates the
+    missing members with a single bulk insert (which allocates their slugs at once).
+    Returns a dict of (first name, last name) to (faculty, created) for parse_faculty.
+    """
     Faculty = apps.get_model(app_label="faculty", model_name="Faculty")
-    return Faculty.objects.get_or_create(**kwargs)
+    names = {
+        (kwargs["first_name"], kwargs["last_name"])
+        for kwargs in map(parse_faculty_name, rows) if kwargs is not None
+    }
+    if not names:
+        return {}
+
+    query = Q()
+    for first_name, last_name in names:
+        query |= Q(first_name=first_name, last_name=last_name)
+
+    members = {}
+    for faculty in Faculty.objects.filter(query).order_by("pk"):
+        members.setdefault((faculty.first_name, faculty.last_name), (faculty, False))
+
+    missing = [
+        Faculty(first_name=first_name, last_name=last_name)
+        for first_name, last_name in sorted(names - members.keys())
+    ]
+    for faculty in Faculty.objects.bulk_create(missing):
+        members[(faculty.first_name, faculty.last_name)] = (faculty, True)
+    return members
 
 
 def parse_course(rows, cohort):
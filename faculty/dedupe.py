@@ -0,0 +1,303 @@
+# faculty.dedupe
+# Detect and merge duplicate faculty members.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Mon Oct 19 21:14:27 2026 -0400
+#
+# Copyright (C) 2026 Georgetown University
+# For license information, see LICENSE.txt
+#
+# ID: dedupe.py [] benjamin@bengfort.com $
+
+"""
+Detect and merge duplicate faculty members.
+
+Faculty imported from schedules are matched by name, so the same person may exist as
+several faculty members with their assignments split between them. Rather than
+comparing every pair of faculty members, candidates are grouped into blocks that share
+a normalized last name, email, or netid and only members of the same block are scored
+against each other. Matching pairs are joined into clusters with a union-find so that
+every cluster can be merged into a single primary faculty member.
+
+Because clusters are transitive, two different people can be joined through a member
+that matches both of them (e.g. a record with only a name between two records with
+different netids). Clusters whose members have more than one netid or email are
+therefore reported as conflicts and are never merged.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+from itertools import combinations
+from django.apps import apps
+from django.db import transaction
+from django.db.models import Count
+from django.utils import timezone
+from collections import defaultdict
+from difflib import SequenceMatcher
+
+from faculty import roster, profile
+from faculty.models import normalize_name
+from cohort import availability, dashboard
+
+
+# Faculty fields that are copied from a duplicate when they are blank on the primary
+MERGE_FIELDS = (
+    "netid", "prefix", "first_name", "last_name", "suffix", "email", "occupation",
+    "organization", "bio", "github", "twitter", "linkedin",
+)
+
+# Blocks larger than this (e.g. a very common last name) are not scored pairwise
+MAX_BLOCK_SIZE = 50
+
+
+##########################################################################
+## Blocking and Scoring
+##########################################################################
+
+def blocking_keys(faculty):
+    """
+    Returns the blocking keys of a faculty member; only members that share at least
+    one key are compared to each other.
+    """
+    keys = []
+    last_name = normalize_name(faculty.last_name)
+    if last_name:
+        keys.append(("last_name", last_name))
+    if faculty.resolved_email and faculty.email_hash:
+        keys.append(("email", faculty.email_hash))
+    if faculty.netid:
+        keys.append(("netid", faculty.netid.strip().lower()))
+    return keys
+
+
+def similarity(a, b):
+    """
+    Scores how likely it is that two faculty members are the same person from 0 to 1.
+    A shared netid or email is a certain match, otherwise the score is the similarity
+    of the normalized names, penalized if the first names do not share an initial.
+    """
+    if a.netid and b.netid:
+        if a.netid.strip().lower() == b.netid.strip().lower():
+            return 1.0
+        # Different netids are different people
+        return 0.0
+
+    if a.email_hash and a.resolved_email and a.email_hash == b.email_hash:
+        return 1.0
+
+    afirst, bfirst = normalize_name(a.first_name), normalize_name(b.first_name)
+    alast, blast = normalize_name(a.last_name), normalize_name(b.last_name)
+    if not (afirst and bfirst and alast and blast):
+        return 0.0
+
+    score = SequenceMatcher(None, afirst + alast, bfirst + blast).ratio()
+    if afirst[0] != bfirst[0]:
+        score *= 0.5
+    elif afirst.startswith(bfirst) or bfirst.startswith(afirst):
+        # e.g. "Ben" and "Benjamin"
+        score = max(score, SequenceMatcher(None, alast, blast).ratio())
+    return score
+
+
+##########################################################################
+## Duplicate Detection
+##########################################################################
+
+class UnionFind(object):
+
+    def __init__(self):
+        self.parents = {}
+
+    def find(self, item):
+        parent = self.parents.setdefault(item, item)
+        if parent != item:
+            parent = self.parents[item] = self.find(parent)
+        return parent
+
+    def union(self, a, b):
+        a, b = self.find(a), self.find(b)
+        if a != b:
+            self.parents[max(a, b)] = min(a, b)
+
+    def groups(self):
+        groups = defaultdict(list)
+        for item in self.parents:
+            groups[self.find(item)].append(item)
+        return [sorted(group) for group in groups.values() if len(group) > 1]
+
+
+def find_duplicates(threshold=0.9, queryset=None):
+    """
+    Returns a list of clusters of duplicate faculty members; each cluster is a list of
+    faculty members with the suggested primary member first. The faculty are loaded in
+    a single query and only members that share a blocking key are scored.
+    """
+    Faculty = apps.get_model(app_label="faculty", model_name="Faculty")
+    if queryset is None:
+        queryset = Faculty.objects.all()
+
+    faculty = {
+        member.pk: member
+        for member in queryset.annotate(num_assignments=Count("assignments")).only(
+            "id", "user", "netid", "first_name", "last_name", "email",
+            "resolved_email", "email_hash", "display_name",
+        )
+    }
+
+    blocks = defaultdict(set)
+    for member in faculty.values():
+        for key in blocking_keys(member):
+            blocks[key].add(member.pk)
+
+    scored = set()
+    clusters = UnionFind()
+    for key, members in blocks.items():
+        if len(members) < 2 or len(members) > MAX_BLOCK_SIZE:
+            continue
+
+        for pair in combinations(sorted(members), 2):
+            if pair in scored:
+                continue
+            scored.add(pair)
+
+            a, b = faculty[pair[0]], faculty[pair[1]]
+            if similarity(a, b) >= threshold:
+                clusters.union(a.pk, b.pk)
+
+    return [
+        sorted((faculty[pk] for pk in group), key=primary_order)
+        for group in clusters.groups()
+    ]
+
+
+def primary_order(faculty):
+    """
+    Members linked to a user come first, then those with the most assignments, and
+    finally the oldest member.
+    """
+    assignments = getattr(faculty, "num_assignments", 0)
+    return (faculty.user_id is None, -assignments, faculty.pk)
+
+
+def conflicts(members):
+    """
+    Returns the identifying fields (netid or email) that have more than one distinct
+    value among the members of a cluster. A cluster with conflicts contains different
+    people that were joined transitively and must not be merged.
+    """
+    fields = []
+    for field in ("netid", "email"):
+        values = {
+            getattr(member, field).strip().lower()
+            for member in members if getattr(member, field)
+        }
+        if len(values) > 1:
+            fields.append(field)
+    return fields
+
+
+##########################################################################
+## Merging
+##########################################################################
+
+def merge(primary, duplicates):
+    """
+    Merges the duplicate faculty members into the primary faculty member, moving their
+    assignments, calendar event attendance, and user in set-based updates and deleting
+    the duplicates. Assignments and attendance that the primary already has are
+    dropped rather than violating the unique constraints. Returns the number of
+    assignments that were moved to the primary faculty member and the values of the
+    assignments that were dropped (see move_related).
+
+    Raises a ValueError if the members have different netids or emails.
+    """
+    Faculty = apps.get_model(app_label="faculty", model_name="Faculty")
+    Assignment = apps.get_model(app_label="faculty", model_name="Assignment")
+    CalendarEvent = apps.get_model(app_label="cohort", model_name="CalendarEvent")
+    Attendee = CalendarEvent.attendees.through
+
+    duplicates = [d for d in duplicates if d.pk != primary.pk]
+    if not duplicates:
+        return 0, []
+
+    members = [primary.pk] + [d.pk for d in duplicates]
+    with transaction.atomic():
+        # Refetch everything with locks so that concurrent edits are not lost
+        faculty = Faculty.objects.select_for_update().in_bulk(members)
+        primary = faculty[primary.pk]
+        duplicates = [faculty[pk] for pk in members[1:] if pk in faculty]
+        dids = [d.pk for d in duplicates]
+
+        fields = conflicts([primary] + duplicates)
+        if fields:
+            raise ValueError("the faculty members have different {}".format(
+                " and ".join(field + "s" for field in fields)
+            ))
+
+        # Touch the events whose attendees change so they appear in the change feed
+        now = timezone.now()
+        attending = Attendee.objects.filter(faculty_id__in=dids)
+        CalendarEvent.objects.filter(
+            pk__in=attending.values("calendarevent_id")
+        ).update(modified=now)
+
+        moved, dropped = move_related(
+            Assignment.objects.filter(faculty_id__in=members),
+            "faculty_id", primary.pk, ("cohort_id", "course_id", "role"),
+            modified=now,
+        )
+        move_related(
+            Attendee.objects.filter(faculty_id__in=members),
+            "faculty_id", primary.pk, ("calendarevent_id",),
+        )
+
+        # Only one faculty member can be linked to a user
+        user_id = primary.user_id or next(
+            (d.user_id for d in duplicates if d.user_id), None
+        )
+        Faculty.objects.filter(pk__in=dids).update(user=None)
+
+        primary.user_id = user_id
+        for field in MERGE_FIELDS:
+            if not getattr(primary, field):
+                values = (getattr(d, field) for d in duplicates)
+                setattr(primary, field, next((v for v in values if v), None))
+
+        Faculty.objects.filter(pk__in=dids).delete()
+        primary.save()
+
+    # The updates above do not send signals so invalidate the caches directly
+    roster.invalidate()
+    profile.invalidate(primary.pk)
+    availability.invalidate()
+    dashboard.schedule_refresh()
+    return moved, dropped
+
+
+def move_related(queryset, field, target, keys, **updates):
+    """
+    Reassigns the rows of the queryset to the target by updating the field, deleting
+    the rows that would be duplicates on the keys, preferring to keep the rows that
+    already belong to the target. Any additional updates are applied to the moved rows.
+    Returns the number of rows that were moved and the (pk, field, *keys) values of
+    the rows that were deleted.
+    """
+    keep, drop = {}, []
+    rows = queryset.order_by("pk").values_list("pk", field, *keys)
+    for row in sorted(rows, key=lambda row: (row[1] != target, row[0])):
+        pk, owner, *key = row
+        key = tuple(key)
+        if key in keep:
+            drop.append(row)
+        else:
+            keep[key] = (pk, owner)
+
+    if drop:
+        queryset.filter(pk__in=[row[0] for row in drop]).delete()
+
+    moves = [pk for pk, owner in keep.values() if owner != target]
+    if moves:
+        queryset.filter(pk__in=moves).update(**{field: target}, **updates)
+    return len(moves), drop
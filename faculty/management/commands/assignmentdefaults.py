@@ -0,0 +1,53 @@
+# faculty.management.commands.assignmentdefaults
+# Fill in blank assignment fields from their course or cohort.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Mon Oct 19 21:52:36 2026 -0400
+#
+# Copyright (C) 2026 Georgetown University
+# For license information, see LICENSE.txt
+#
+# ID: assignmentdefaults.py [] benjamin@bengfort.com $
+
+"""
+Fill in blank assignment fields from their course or cohort.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+from django.core.management.base import BaseCommand
+
+from faculty import roster, profile
+from cohort import dashboard
+from faculty.models import Assignment
+
+
+class Command(BaseCommand):
+
+    help = "fill in the blank cohort, dates, and hours of assignments in one update"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "-c", "--cohort", type=int, nargs="*", default=None, metavar="N",
+            help="only update the assignments of the specified cohort numbers",
+        )
+
+    @dashboard.synchronous()
+    def handle(self, *args, **options):
+        assignments = Assignment.objects.all()
+        if options["cohort"]:
+            assignments = assignments.cohort(options["cohort"])
+
+        updated = assignments.apply_defaults()
+
+        # The update does not send signals so invalidate the caches directly
+        if updated:
+            roster.invalidate()
+            profile.invalidate()
+            dashboard.schedule_refresh()
+
+        self.stdout.write(self.style.SUCCESS(
+            "applied defaults to {} assignments".format(updated)
+        ))
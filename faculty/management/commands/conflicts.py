@@ -0,0 +1,74 @@
+# faculty.management.commands.conflicts
+# Report faculty members who are double-booked in the schedule.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Mon Oct 19 09:48:17 2026 -0400
+#
+# Copyright (C) 2026 Georgetown University
+# For license information, see LICENSE.txt
+#
+# ID: conflicts.py [] benjamin@bengfort.com $
+
+"""
+Report faculty members who are double-booked in the schedule.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+from datetime import datetime
+from django.utils.timezone import localtime
+from django.core.management.base import BaseCommand
+
+from faculty.conflicts import COURSE, find_conflicts, group_by_faculty
+
+
+def date(s):
+    return datetime.strptime(s, "%Y-%m-%d").date()
+
+
+class Command(BaseCommand):
+
+    help = "report faculty with overlapping courses or calendar events"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "-a", "--after", type=date, default=None, metavar="YYYY-MM-DD",
+            help="only check the schedule on or after this date",
+        )
+        parser.add_argument(
+            "-b", "--before", type=date, default=None, metavar="YYYY-MM-DD",
+            help="only check the schedule on or before this date",
+        )
+
+    def handle(self, *args, **options):
+        conflicts = find_conflicts(options["after"], options["before"])
+        if not conflicts:
+            self.stdout.write(self.style.SUCCESS("no faculty conflicts found"))
+            return
+
+        for faculty, items in group_by_faculty(conflicts):
+            self.stdout.write(self.style.WARNING(
+                "{} ({} conflicts)".format(faculty.get_full_name(), len(items))
+            ))
+            for conflict in items:
+                self.stdout.write("  {}".format(describe(conflict)))
+
+        self.stdout.write(self.style.ERROR(
+            "found {} conflicts".format(len(conflicts))
+        ))
+
+
+def describe(conflict):
+    if conflict.kind == COURSE:
+        fmt, tz = "%Y-%m-%d", lambda d: d
+    else:
+        fmt, tz = "%Y-%m-%d %H:%M", localtime
+
+    first, second = conflict.first, conflict.second
+    return "{} {} ({} - {}) overlaps {} ({} - {})".format(
+        conflict.kind,
+        first.label, tz(first.start).strftime(fmt), tz(first.end).strftime(fmt),
+        second.label, tz(second.start).strftime(fmt), tz(second.end).strftime(fmt),
+    )
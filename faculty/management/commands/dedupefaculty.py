@@ -0,0 +1,105 @@
+# faculty.management.commands.dedupefaculty
+# Find and optionally merge duplicate faculty members.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Mon Oct 19 21:32:05 2026 -0400
+#
+# Copyright (C) 2026 Georgetown University
+# For license information, see LICENSE.txt
+#
+# ID: dedupefaculty.py [] benjamin@bengfort.com $
+
+"""
+Find and optionally merge duplicate faculty members.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+from django.core.management.base import BaseCommand, CommandError
+
+from cohort import dashboard
+from faculty.dedupe import find_duplicates, conflicts, merge
+
+
+class Command(BaseCommand):
+
+    help = "report faculty members that are likely duplicates and optionally merge them"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "-t", "--threshold", type=float, default=0.9, metavar="SCORE",
+            help="the name similarity from 0 to 1 required for a duplicate",
+        )
+        parser.add_argument(
+            "-m", "--merge", action="store_true",
+            help="merge each group of duplicates into its first (primary) member",
+        )
+
+    @dashboard.synchronous()
+    def handle(self, *args, **options):
+        if not 0 < options["threshold"] <= 1:
+            raise CommandError("the threshold must be between 0 and 1")
+
+        clusters = find_duplicates(options["threshold"])
+        if not clusters:
+            self.stdout.write(self.style.SUCCESS("no duplicate faculty members found"))
+            return
+
+        rejected = 0
+        for primary, *duplicates in clusters:
+            self.stdout.write(self.style.WARNING(describe(primary)))
+            for duplicate in duplicates:
+                self.stdout.write("  duplicate: {}".format(describe(duplicate)))
+
+            # Clusters can join different people through a member that matches both
+            fields = conflicts([primary] + duplicates)
+            if fields:
+                rejected += 1
+                self.stdout.write(self.style.ERROR(
+                    "  not merged: the members have different {}".format(
+                        " and ".join(field + "s" for field in fields)
+                    )
+                ))
+                continue
+
+            if options["merge"]:
+                try:
+                    moved, dropped = merge(primary, duplicates)
+                except Exception as e:
+                    raise CommandError("could not merge {}: {}".format(primary, e))
+
+                self.stdout.write(
+                    "  merged {} duplicates and moved {} assignments".format(
+                        len(duplicates), moved,
+                    )
+                )
+                for pk, owner, cohort, course, role in dropped:
+                    self.stdout.write(self.style.NOTICE(
+                        "  dropped assignment {} of faculty {} (cohort id {}, "
+                        "course id {}, role {}) that duplicated an assignment of "
+                        "the primary".format(
+                            pk, owner, cohort, course, role,
+                        )
+                    ))
+
+        action = "merged" if options["merge"] else "found"
+        self.stdout.write(self.style.SUCCESS(
+            "{} {} groups of duplicate faculty members".format(
+                action, len(clusters) - rejected
+            )
+        ))
+        if rejected:
+            self.stdout.write(self.style.ERROR(
+                "{} groups with conflicting netids or emails were not merged".format(
+                    rejected
+                )
+            ))
+
+
+def describe(faculty):
+    return "{} (id {}, {} assignments{})".format(
+        faculty.get_full_name(), faculty.pk, faculty.num_assignments,
+        ", netid {}".format(faculty.netid) if faculty.netid else "",
+    )
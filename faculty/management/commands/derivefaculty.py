@@ -0,0 +1,59 @@
+# faculty.management.commands.derivefaculty
+# Backfill the stored display name, email, and email hash of faculty members.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Mon Oct 19 20:58:44 2026 -0400
+#
+# Copyright (C) 2026 Georgetown University
+# For license information, see LICENSE.txt
+#
+# ID: derivefaculty.py [] benjamin@bengfort.com $
+
+"""
+Backfill the stored display name, email, and email hash of faculty members.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+from django.utils import timezone
+from django.core.management.base import BaseCommand
+
+from cohort import dashboard
+from faculty import roster, profile
+from faculty.models import Faculty
+
+
+class Command(BaseCommand):
+
+    help = "recompute the derived name and email fields of all faculty members"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "-b", "--batch-size", type=int, default=500,
+            help="the number of faculty members to update per query",
+        )
+
+    @dashboard.synchronous()
+    def handle(self, *args, **options):
+        changed, now = [], timezone.now()
+        faculty = Faculty.objects.select_related("user")
+        for member in faculty.iterator(chunk_size=options["batch_size"]):
+            if member.update_derived_fields():
+                member.modified = now
+                changed.append(member)
+
+        # bulk_update does not send signals so invalidate the caches directly
+        if changed:
+            Faculty.objects.bulk_update(
+                changed, Faculty.DERIVED_FIELDS + ("modified",),
+                batch_size=options["batch_size"],
+            )
+            roster.invalidate()
+            profile.invalidate()
+            dashboard.schedule_refresh()
+
+        self.stdout.write(self.style.SUCCESS(
+            "updated the derived fields of {} faculty members".format(len(changed))
+        ))
@@ -20,6 +20,7 @@ Parse faculty assignments from a CSV file on local disk.
 from collections import Counter
 from django.core.management.base import BaseCommand, CommandError
 from faculty.csv import read_assignments, parse_assignments
+from cohort import dashboard
 
 
 class Command(BaseCommand):
@@ -30,6 +31,7 @@ class Command(BaseCommand):
             "assignments", nargs="+", metavar="CSV", help="CSV of faculty assignments"
         )
 
+    @dashboard.synchronous()
     def handle(self, *args, **options):
         n_errors = 0
         created, fetched = Counter(), Counter()
@@ -17,55 +17,210 @@ Query managers for faculty models.
 ## Imports
 ##########################################################################
 
+import re
+
 from itertools import chain
+from django.apps import apps
 from django.db import models
-from django.db.models import Q
+from django.utils import timezone
+from django.utils.text import slugify
+from django.db.models import Q, F, Case, When, Count, Exists, OuterRef, Subquery
+
+from cohort.managers import TimeRangeQuerySet, TimeRangeManager, flatten
+
+
+##########################################################################
+## Faculty Queryset and Manager
+##########################################################################
+
+class FacultyQuerySet(models.QuerySet):
+
+    def with_roles(self):
+        """
+        Annotates each faculty member with their most common role (top_role) and the
+        number of instructional (num_courses) and advisor (num_advising) assignments
+        so that the list of faculty can be rendered without a query per member.
+        """
+        Assignment = apps.get_model(app_label="faculty", model_name="Assignment")
+        roles = (
+            Assignment.objects.filter(faculty=OuterRef("pk"))
+            .order_by()
+            .values("role")
+            .annotate(count=Count("id"))
+            .order_by("-count", "role")
+            .values("role")[:1]
+        )
+
+        return self.annotate(
+            top_role=Subquery(roles),
+            num_courses=Count(
+                "assignments", filter=Q(assignments__course__isnull=False)
+            ),
+            num_advising=Count(
+                "assignments", filter=Q(assignments__course__isnull=True)
+            ),
+        )
+
+    def match_user(self, user):
+        """
+        Returns the unlinked faculty members whose netid is the username of the user or
+        whose normalized name matches the name of the user using the indexed netid and
+        name_key columns. At most two members are fetched since only a unique match
+        can be associated with the user.
+        """
+        from faculty.models import make_name_key
+
+        query = Q(netid=user.username)
+        name_key = make_name_key(user.first_name, user.last_name)
+        if name_key:
+            query |= Q(name_key=name_key)
+        return self.filter(query, user__isnull=True)[:2]
+
+    def allocate_slugs(self, faculty):
+        """
+        Assigns a unique slug to every faculty member in the list that does not have
+        one, e.g. jane-doe, then jane-doe-2 if that slug is taken. The slugs that are
+        already taken are fetched with a single prefix query for all of the members,
+        so this should be used (rather than the pre_save signal) when creating many
+        faculty members at once.
+        """
+        max_length = self.model._meta.get_field("slug").max_length - 8
+        unslugged = []
+        for member in faculty:
+            if not member.slug:
+                name = " ".join(filter(None, [member.first_name, member.last_name]))
+                base = slugify(name)[:max_length].strip("-") or "faculty"
+                unslugged.append((member, base))
+
+        if not unslugged:
+            return faculty
+
+        # A single member can use the slug index, many use one alternation instead of
+        # an OR of prefixes that would be too deep for the database to parse
+        bases = sorted({base for _, base in unslugged})
+        if len(bases) == 1:
+            query = Q(slug=bases[0]) | Q(slug__startswith=bases[0] + "-")
+        else:
+            pattern = r"^({})(-[0-9]+)?$".format("|".join(map(re.escape, bases)))
+            query = Q(slug__regex=pattern)
+        taken = set(self.model.objects.filter(query).values_list("slug", flat=True))
+
+        for member, base in unslugged:
+            slug, idx = base, 1
+            while slug in taken:
+                idx += 1
+                slug = "{}-{}".format(base, idx)
+
+            member.slug = slug
+            taken.add(slug)
+        return faculty
+
+    def bulk_create(self, objs, *args, **kwargs):
+        """
+        Faculty created in bulk do not send pre_save or post_save signals, so the slugs
+        and derived fields are set and unmatched users are invalidated here instead.
+        """
+        from faculty.signals import invalidate_unmatched_users
+
+        objs = list(objs)
+        for member in objs:
+            member.update_derived_fields()
+        self.allocate_slugs(objs)
+        objs = super(FacultyQuerySet, self).bulk_create(objs, *args, **kwargs)
+        invalidate_unmatched_users(self.model)
+        return objs
+
+
+class FacultyManager(models.Manager):
+
+    def get_queryset(self):
+        return FacultyQuerySet(self.model, using=self._db)
+
+    def with_roles(self):
+        """
+        Annotates faculty with their primary role and assignment counts.
+        """
+        return self.get_queryset().with_roles()
+
+    def match_user(self, user):
+        """
+        Returns up to two unlinked faculty members that match the user.
+        """
+        return self.get_queryset().match_user(user)
+
+    def allocate_slugs(self, faculty):
+        """
+        Assigns unique slugs to the faculty members that do not have one.
+        """
+        return self.get_queryset().allocate_slugs(faculty)
 
 
 ##########################################################################
 ## Assignment Queryset and Manager
 ##########################################################################
 
-class AssignmentQuerySet(models.QuerySet):
+class AssignmentQuerySet(TimeRangeQuerySet):
 
     REL_FIELDS = ("advisor", "instructor")
 
     def faculty(self, *faculty):
         """
-        Filter the assignments based on the specified faculty members
+        Filter the assignments based on the specified faculty members, which can be
+        Faculty instances or primary keys (or lists of either).
         """
+        faculty = flatten(faculty)
         if len(faculty) == 0:
             raise ValueError("specify at least one faculty to filter on")
 
-        qor = [
-            Q(faculty=faculty)
-            for faculty in faculty
-        ]
-        query = qor[0]
-        for item in qor[1:]:
-            query |= item
-
-        return self.filter(query)
+        return self.filter(faculty_id__in={getattr(f, "pk", f) for f in faculty})
 
     def cohort(self, *cohorts):
         """
-        Filter the assignments based on the specified cohorts
+        Filter the assignments based on the specified cohorts, which can be Cohort
+        instances or cohort numbers (or lists of either).
         """
+        cohorts = flatten(cohorts)
         if len(cohorts) == 0:
             raise ValueError("specify at least one cohort to filter on")
 
-        qor = []
-        for cohort in cohorts:
-            if isinstance(cohort, int):
-                qor.append(cohort__cohort=cohort)
-            else:
-                qor.append(Q(cohort=cohort))
+        numbers = {c for c in cohorts if isinstance(c, int)}
+        pks = {c.pk for c in cohorts if not isinstance(c, int)}
+        return self.filter(self.any_of(cohort_id=pks, cohort__cohort=numbers))
+
+    def courses(self, *courses):
+        """
+        Filter the assignments based on the specified courses, which can be Course
+        instances, primary keys, or course IDs such as "XBUS-500" (or lists of these).
+        """
+        courses = flatten(courses)
+        if len(courses) == 0:
+            raise ValueError("specify at least one course to filter on")
+
+        course_ids = {c for c in courses if isinstance(c, str)}
+        pks = {getattr(c, "pk", c) for c in courses if not isinstance(c, str)}
+        return self.filter(self.any_of(course_id=pks, course__course_id=course_ids))
+
+    def roles(self, *roles):
+        """
+        Filter the assignments based on the specified roles, e.g. FACULTY_ROLES.Advisor
+        """
+        roles = flatten(roles)
+        if len(roles) == 0:
+            raise ValueError("specify at least one role to filter on")
 
-        query = qor[0]
-        for item in qor[1:]:
-            query |= item
+        return self.filter(role__in=set(roles))
 
-        return self.filter(query)
+    @staticmethod
+    def any_of(**fields):
+        """
+        Returns a Q that matches any of the values of any of the specified fields,
+        omitting the fields that have no values.
+        """
+        query = Q()
+        for field, values in fields.items():
+            if values:
+                query |= Q(**{f"{field}__in": values})
+        return query
 
     def instructional(self):
         """
@@ -79,8 +234,71 @@ class AssignmentQuerySet(models.QuerySet):
         """
         return self.exclude(course__isnull=False)
 
-
-class AssignmentManager(models.Manager):
+    def apply_defaults(self):
+        """
+        Fills in the blank cohort, start, end, and hours of the assignments from their
+        course or cohort in a single UPDATE statement, matching the defaults set by
+        check_assignment_defaults for assignments that are created or modified without
+        a save (e.g. bulk_create or update). Only the rows with a blank field that
+        their course or cohort can fill are updated (and their modified timestamp
+        touched), so rows that can never be filled are not republished in the change
+        feed every time. Note that no signals are sent; returns the number of updated
+        rows.
+        """
+        Course = apps.get_model(app_label="cohort", model_name="Course")
+        Cohort = apps.get_model(app_label="cohort", model_name="Cohort")
+
+        def course(field):
+            query = Course.objects.filter(pk=OuterRef("course_id")).order_by()
+            return Subquery(query.values(field)[:1])
+
+        def cohort(field):
+            query = Cohort.objects.filter(pk=OuterRef("cohort_id")).order_by()
+            return Subquery(query.values(field)[:1])
+
+        def default(field):
+            # Use the course date if there is a course otherwise the cohort date
+            return Case(
+                When(**{f"{field}__isnull": False}, then=F(field)),
+                When(course_id__isnull=False, then=course(field)),
+                When(cohort_id__isnull=False, then=cohort(field)),
+                default=None,
+            )
+
+        def has(model, ref, **filters):
+            return Exists(model.objects.filter(pk=OuterRef(ref), **filters))
+
+        has_course = Q(course_id__isnull=False)
+        no_hours = Q(hours__isnull=True) | Q(hours=0)
+
+        # The blank fields that the course (or the cohort without a course) can fill
+        fillable = Q(cohort_id__isnull=True) & Q(
+            has(Course, "course_id", cohort__isnull=False)
+        )
+        for field in ("start", "end"):
+            filled = {f"{field}__isnull": False}
+            from_course = Q(has(Course, "course_id", **filled))
+            from_cohort = Q(has(Cohort, "cohort_id", **filled))
+            from_cohort &= Q(course_id__isnull=True)
+            fillable |= Q(**{f"{field}__isnull": True}) & (from_course | from_cohort)
+        fillable |= no_hours & Q(has(Course, "course_id", hours__gt=0))
+
+        return self.filter(fillable).update(
+            cohort_id=Case(
+                When(Q(cohort_id__isnull=True) & has_course, then=course("cohort_id")),
+                default=F("cohort_id"),
+                output_field=self.model._meta.get_field("cohort").target_field,
+            ),
+            start=default("start"),
+            end=default("end"),
+            hours=Case(
+                When(no_hours & has_course, then=course("hours")), default=F("hours"),
+            ),
+            modified=timezone.now(),
+        )
+
+
+class AssignmentManager(TimeRangeManager):
 
     def get_queryset(self):
         return AssignmentQuerySet(self.model, using=self._db)
@@ -97,6 +315,18 @@ class AssignmentManager(models.Manager):
         """
         return self.get_queryset().cohort(*cohorts)
 
+    def courses(self, *courses):
+        """
+        Filter the assignments based on the specified courses
+        """
+        return self.get_queryset().courses(*courses)
+
+    def roles(self, *roles):
+        """
+        Filter the assignments based on the specified roles
+        """
+        return self.get_queryset().roles(*roles)
+
     def instructional(self):
         """
         Return only assignments that have associated courses.
@@ -109,6 +339,12 @@ class AssignmentManager(models.Manager):
         """
         return self.get_queryset().advisors()
 
+    def apply_defaults(self):
+        """
+        Fill in the blank fields of all assignments from their course or cohort.
+        """
+        return self.get_queryset().apply_defaults()
+
 
 ##########################################################################
 ## Contacts Manager
@@ -0,0 +1,45 @@
+# Generated by Django 4.1.3 on 2026-10-19 19:05
+
+import django.contrib.postgres.fields.ranges
+import django.contrib.postgres.indexes
+import django.db.models.functions.comparison
+from django.db import migrations, models
+
+
+class AddPostgresIndex(migrations.AddIndex):
+    """
+    Records the index in the model state on every database but only creates it on
+    Postgres; range indexes are not supported elsewhere and other databases fall back
+    to comparisons on the start and end columns.
+    """
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == "postgresql":
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == "postgresql":
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("faculty", "0007_alter_assignment_id_alter_contact_id_and_more"),
+    ]
+
+    operations = [
+        AddPostgresIndex(
+            model_name="assignment",
+            index=django.contrib.postgres.indexes.GistIndex(
+                models.Func(
+                    django.db.models.functions.comparison.Least("start", "end"),
+                    django.db.models.functions.comparison.Greatest("start", "end"),
+                    models.Value("[]"),
+                    function="daterange",
+                    output_field=django.contrib.postgres.fields.ranges.DateRangeField(),
+                ),
+                name="assignments_daterange_gist",
+            ),
+        ),
+    ]
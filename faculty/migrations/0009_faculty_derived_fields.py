@@ -0,0 +1,32 @@
+# Generated by Django 4.1.3 on 2026-10-19 18:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('faculty', '0008_assignment_daterange_index'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='assignment',
+            options={'ordering': ('-cohort__cohort', 'start')},
+        ),
+        migrations.AddField(
+            model_name='faculty',
+            name='display_name',
+            field=models.CharField(blank=True, default='', editable=False, help_text='The full name of the faculty member (derived on save)', max_length=600),
+        ),
+        migrations.AddField(
+            model_name='faculty',
+            name='email_hash',
+            field=models.CharField(blank=True, default='', editable=False, help_text='The MD5 hash of the resolved email for gravatars (derived on save)', max_length=32),
+        ),
+        migrations.AddField(
+            model_name='faculty',
+            name='resolved_email',
+            field=models.EmailField(blank=True, default=None, editable=False, help_text='The preferred contact email of the faculty member (derived on save)', max_length=254, null=True),
+        ),
+    ]
@@ -0,0 +1,60 @@
+# Generated by Django 4.1.3 on 2026-10-20 10:05
+
+from hashlib import md5
+
+from django.db import migrations
+
+
+def full_name(member):
+    name = " ".join(filter(None, [member.first_name, member.last_name])).strip()
+    if not name and member.user is not None:
+        name = "{} {}".format(member.user.first_name, member.user.last_name).strip()
+
+    if member.prefix:
+        name = "{} {}".format(member.prefix, name)
+    if member.suffix:
+        name += ", " + member.suffix
+    return name
+
+
+def email(member):
+    if member.email:
+        return member.email
+    if member.user is not None and member.user.email:
+        return member.user.email
+    if member.netid:
+        return "{}@georgetown.edu".format(member.netid)
+    return None
+
+
+def backfill_derived_fields(apps, schema_editor):
+    """
+    Store the display name, email, and email hash of every faculty member so that
+    lists that only load the derived fields do not have to compute them.
+    """
+    Faculty = apps.get_model("faculty", "Faculty")
+
+    changed = []
+    for member in Faculty.objects.select_related("user").iterator(chunk_size=500):
+        resolved = email(member)
+        member.display_name = full_name(member)
+        member.resolved_email = resolved
+        member.email_hash = md5(
+            (resolved or "").strip().lower().encode("utf-8")
+        ).hexdigest()
+        changed.append(member)
+
+    Faculty.objects.bulk_update(
+        changed, ["display_name", "resolved_email", "email_hash"], batch_size=500
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('faculty', '0009_faculty_derived_fields'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_derived_fields, migrations.RunPython.noop),
+    ]
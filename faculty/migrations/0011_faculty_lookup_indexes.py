@@ -0,0 +1,51 @@
+# Generated by Django 4.1.3 on 2026-10-19 18:39
+
+import re
+import unicodedata
+
+from django.db import migrations, models
+
+
+def normalize_name(name):
+    if not name:
+        return ""
+    name = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii")
+    return re.sub(r"[^a-z0-9]", "", name.lower())
+
+
+def backfill_name_keys(apps, schema_editor):
+    """
+    Store the normalized name key of every faculty member with a first and last name.
+    """
+    Faculty = apps.get_model("faculty", "Faculty")
+    faculty = Faculty.objects.exclude(first_name=None).exclude(last_name=None)
+
+    changed = []
+    for member in faculty.only("pk", "first_name", "last_name"):
+        first_name, last_name = normalize_name(member.first_name), normalize_name(member.last_name)
+        if first_name and last_name:
+            member.name_key = "{}:{}".format(first_name, last_name)
+            changed.append(member)
+
+    Faculty.objects.bulk_update(changed, ["name_key"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('faculty', '0010_backfill_derived_fields'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='faculty',
+            name='name_key',
+            field=models.CharField(blank=True, db_index=True, default='', editable=False, help_text='The normalized first and last name used for lookups (derived on save)', max_length=255),
+        ),
+        migrations.AlterField(
+            model_name='faculty',
+            name='netid',
+            field=models.CharField(blank=True, db_index=True, help_text='The Georgetown NetID of the faculty member', max_length=24, null=True),
+        ),
+        migrations.RunPython(backfill_name_keys, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.1.3 on 2026-10-19 18:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('faculty', '0011_faculty_lookup_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='assignment',
+            index=models.Index(fields=['modified'], name='assignments_modifie_2f44c2_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='faculty',
+            index=models.Index(fields=['modified'], name='faculty_modifie_e1b635_idx'),
+        ),
+    ]
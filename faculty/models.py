@@ -17,13 +17,18 @@ Faculty app database models.
 ## Imports
 ##########################################################################
 
+import re
+import unicodedata
+
 from hashlib import md5
 from django.db import models
+from django.contrib.postgres.indexes import GistIndex
 from django.urls import reverse
 from model_utils import Choices
 from django.conf import settings
 from model_utils.models import TimeStampedModel
-from faculty.managers import AssignmentManager, ContactManager
+from cohort.managers import date_range
+from faculty.managers import FacultyManager, AssignmentManager, ContactManager
 from django.core.validators import MaxValueValidator, MinValueValidator
 
 
@@ -45,6 +50,28 @@ NAME_SUFFIX = Choices(
 )
 
 
+def normalize_name(name):
+    """
+    Returns a lowercase ascii version of the name without punctuation or whitespace,
+    e.g. "O'Brien-Smith" becomes "obriensmith".
+    """
+    if not name:
+        return ""
+    name = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii")
+    return re.sub(r"[^a-z0-9]", "", name.lower())
+
+
+def make_name_key(first_name, last_name):
+    """
+    Returns the normalized lookup key of a first and last name, e.g. "jane:doe", or
+    an empty string if either name is missing.
+    """
+    first_name, last_name = normalize_name(first_name), normalize_name(last_name)
+    if not first_name or not last_name:
+        return ""
+    return "{}:{}".format(first_name, last_name)
+
+
 ##########################################################################
 ## Faculty Model
 ##########################################################################
@@ -64,7 +91,7 @@ class Faculty(TimeStampedModel):
         help_text="The user associated with the faculty member (optional)",
     )
     netid = models.CharField(
-        max_length=24, null=True, blank=True,
+        max_length=24, null=True, blank=True, db_index=True,
         help_text="The Georgetown NetID of the faculty member",
     )
     prefix = models.CharField(
@@ -119,15 +146,48 @@ class Faculty(TimeStampedModel):
         default=False, null=False,
         help_text="Exclude from active faculty participation (archive only)",
     )
+    display_name = models.CharField(
+        max_length=600, null=False, blank=True, default="", editable=False,
+        help_text="The full name of the faculty member (derived on save)",
+    )
+    resolved_email = models.EmailField(
+        null=True, blank=True, default=None, editable=False,
+        help_text="The preferred contact email of the faculty member (derived on save)",
+    )
+    email_hash = models.CharField(
+        max_length=32, null=False, blank=True, default="", editable=False,
+        help_text="The MD5 hash of the resolved email for gravatars (derived on save)",
+    )
+    name_key = models.CharField(
+        max_length=255, null=False, blank=True, default="", editable=False,
+        db_index=True, help_text=(
+            "The normalized first and last name used for lookups (derived on save)"
+        ),
+    )
+
+    # Add a custom manager to annotate faculty lists
+    objects = FacultyManager()
 
     class Meta:
         db_table = "faculty"
         ordering = ("last_name", "first_name")
+        indexes = [models.Index(fields=["modified"])]
         verbose_name = "faculty"
         verbose_name_plural = "faculty members"
 
+    # Fields derived from the name, email, and user of the faculty member
+    DERIVED_FIELDS = ("display_name", "resolved_email", "email_hash", "name_key")
+
     def get_full_name(self):
-        fn = " ".join([self.first_name, self.last_name]).strip()
+        """
+        Returns the stored display name (see update_derived_fields).
+        """
+        if self.display_name:
+            return self.display_name
+        return self.compute_full_name()
+
+    def compute_full_name(self):
+        fn = " ".join(filter(None, [self.first_name, self.last_name])).strip()
         if not fn and self.user is not None:
             fn = self.user.get_full_name()
 
@@ -138,6 +198,14 @@ class Faculty(TimeStampedModel):
         return fn
 
     def get_email(self):
+        """
+        Returns the stored preferred email address (see update_derived_fields).
+        """
+        if self.email_hash:
+            return self.resolved_email
+        return self.compute_email()
+
+    def compute_email(self):
         """
         Determines the email address of the faculty member based on preferences.
         """
@@ -149,20 +217,50 @@ class Faculty(TimeStampedModel):
             return "{}@georgetown.edu".format(self.netid)
         return None
 
+    def update_derived_fields(self):
+        """
+        Recomputes the stored display name, email, email hash, and name key from the
+        faculty member and their user, returning True if any of the fields changed.
+        Called before every save and when the associated user is saved.
+        """
+        email = self.compute_email()
+        email_hash = md5((email or "").strip().lower().encode("utf-8")).hexdigest()
+        derived = {
+            "display_name": self.compute_full_name(),
+            "resolved_email": email,
+            "email_hash": email_hash,
+            "name_key": make_name_key(self.first_name, self.last_name),
+        }
+
+        changed = False
+        for field, value in derived.items():
+            if getattr(self, field) != value:
+                setattr(self, field, value)
+                changed = True
+        return changed
+
     def primary_role(self):
         """
-        Returns the most common assignment this faculty member has had.
+        Returns the most common assignment this faculty member has had. Use
+        Faculty.objects.with_roles() when listing faculty to avoid a query per member.
         """
-        # TODO: this hack is going to lead to poor performance
-        roles = self.assignments.values('role').annotate(count=models.Count("role"))
-        roles = roles.order_by("-count")[0:1]
-        if roles:
-            return FACULTY_ROLES[roles[0]["role"]]
+        if hasattr(self, "top_role"):
+            role = self.top_role
+        else:
+            roles = self.assignments.order_by().values("role")
+            roles = roles.annotate(count=models.Count("id")).order_by("-count", "role")
+            role = roles.values_list("role", flat=True).first()
+
+        if role:
+            return FACULTY_ROLES[role]
         return "No Assignments"
 
     def gravatar(self, size=512):
-        email = self.get_email() or ""
-        email_hash = md5(str(email.strip().lower()).encode('utf-8')).hexdigest()
+        email_hash = self.email_hash
+        if not email_hash:
+            email = self.compute_email() or ""
+            email_hash = md5(str(email.strip().lower()).encode('utf-8')).hexdigest()
+
         url = "//www.gravatar.com/avatar/{0}?s={1}&d=identicon&r=PG"
         return url.format(email_hash, size)
 
@@ -240,6 +338,10 @@ class Assignment(TimeStampedModel):
         db_table = "assignments"
         ordering = ("-cohort__cohort", "start")
         unique_together = ("faculty", "cohort", "course", "role")
+        indexes = [
+            models.Index(fields=["modified"]),
+            GistIndex(date_range(), name="assignments_daterange_gist"),
+        ]
 
     @property
     def is_instructor(self):
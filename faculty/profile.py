@@ -0,0 +1,129 @@
+# faculty.profile
+# Faculty profile statistics computed from a single query of their assignments.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Mon Oct 19 20:31:15 2026 -0400
+#
+# Copyright (C) 2026 Georgetown University
+# For license information, see LICENSE.txt
+#
+# ID: profile.py [] benjamin@bengfort.com $
+
+"""
+Faculty profile statistics computed from a single query of their assignments.
+
+The rendered profile is cached as a template fragment whose key includes the profile
+version of the faculty member, which is replaced by the signals in faculty.signals
+whenever the faculty member, their user, or their assignments change. Changes to
+courses or cohorts replace a global version that applies to every profile.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+from datetime import date
+from django.apps import apps
+from collections import Counter
+from django.utils.functional import cached_property
+
+from webfolio import cache as versions
+from faculty.models import FACULTY_ROLES
+
+
+CACHE_VERSION_KEY = "faculty:profile:version"
+CACHE_FACULTY_KEY = "faculty:profile:{pk}"
+CACHE_TIMEOUT = 60 * 60 * 24
+
+
+##########################################################################
+## Profile
+##########################################################################
+
+class FacultyProfile(object):
+    """
+    Computes the statistics and course schedule shown on the faculty detail page.
+    The assignments are only loaded when a statistic is accessed, so nothing is
+    queried when the rendered profile is served from the cache.
+    """
+
+    def __init__(self, faculty, today=None):
+        self.faculty = faculty
+        self.today = today or date.today()
+
+    @cached_property
+    def version(self):
+        """
+        The cache version of the rendered profile, which changes every day and every
+        time the profile is invalidated.
+        """
+        key = CACHE_FACULTY_KEY.format(pk=self.faculty.pk)
+        current = versions.get_versions(CACHE_VERSION_KEY, key)
+        return "{}:{}:{}".format(
+            self.today.isoformat(), current[CACHE_VERSION_KEY], current[key],
+        )
+
+    @cached_property
+    def assignments(self):
+        Assignment = apps.get_model(app_label="faculty", model_name="Assignment")
+        return list(
+            Assignment.objects.filter(faculty=self.faculty)
+            .select_related("course__cohort")
+            .order_by()
+        )
+
+    @cached_property
+    def courses(self):
+        """
+        The distinct courses the faculty member is assigned to, ordered by start date.
+        """
+        courses = {a.course_id: a.course for a in self.assignments if a.course_id}
+        return sorted(
+            (c for c in courses.values() if c.start is not None),
+            key=lambda c: (c.start, c.pk),
+        )
+
+    @property
+    def num_courses(self):
+        return sum(1 for a in self.assignments if a.course_id is not None)
+
+    @property
+    def num_advising(self):
+        return sum(1 for a in self.assignments if a.course_id is None)
+
+    @property
+    def num_cohorts(self):
+        return len({a.cohort_id for a in self.assignments if a.cohort_id is not None})
+
+    @property
+    def primary_role(self):
+        """
+        The most common role of the faculty member with the same tie-breaking as
+        Faculty.primary_role.
+        """
+        roles = Counter(a.role for a in self.assignments)
+        if not roles:
+            return "No Assignments"
+
+        role = min(roles, key=lambda role: (-roles[role], role))
+        return FACULTY_ROLES[role]
+
+    @property
+    def current_courses(self):
+        return [
+            c for c in self.courses
+            if c.end is not None and c.start <= self.today <= c.end
+        ]
+
+    @property
+    def upcoming_courses(self):
+        return [c for c in self.courses if c.start > self.today]
+
+
+def invalidate(pk=None):
+    """
+    Invalidates the cached profile of the faculty member with the specified primary
+    key, or the cached profiles of all faculty members if no key is specified.
+    """
+    key = CACHE_VERSION_KEY if pk is None else CACHE_FACULTY_KEY.format(pk=pk)
+    versions.invalidate(key)
@@ -0,0 +1,99 @@
+# faculty.roster
+# The cached roster of faculty members assigned to currently active cohorts.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Mon Oct 19 19:21:43 2026 -0400
+#
+# Copyright (C) 2026 Georgetown University
+# For license information, see LICENSE.txt
+#
+# ID: roster.py [] benjamin@bengfort.com $
+
+"""
+The cached roster of faculty members assigned to currently active cohorts.
+
+The roster only changes when assignments, faculty, or cohorts are modified or when the
+day rolls over, so it is computed once and cached under a key that includes the date
+and a version that is incremented by the signals in faculty.signals.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+from datetime import date
+from django.apps import apps
+from django.db.models import Q, Count
+from email.utils import formataddr
+from django.core.cache import cache
+
+from webfolio import cache as versions
+
+
+CACHE_KEY = "roster:{version}:{date}"
+CACHE_VERSION_KEY = "roster:version"
+CACHE_TIMEOUT = 60 * 60 * 24
+
+
+##########################################################################
+## Roster
+##########################################################################
+
+def get_roster(today=None):
+    """
+    Returns the active faculty roster for the day from the cache, building it if
+    necessary. Each member of the roster is a dict with the faculty id, slug, name,
+    email, full_email (for mailto links), and the number of active assignments.
+    """
+    today = today or date.today()
+    key = CACHE_KEY.format(version=versions.get_version(CACHE_VERSION_KEY), date=today)
+    roster = cache.get(key)
+    if roster is None:
+        roster = build_roster(today)
+        cache.set(key, roster, CACHE_TIMEOUT)
+    return roster
+
+
+def invalidate():
+    """
+    Invalidates all cached rosters, e.g. when assignments are modified.
+    """
+    versions.invalidate(CACHE_VERSION_KEY)
+
+
+def build_roster(today=None):
+    """
+    Computes the faculty members with assignments in cohorts that are active on the
+    day along with the number of those assignments in a single query.
+    """
+    Faculty = apps.get_model(app_label="faculty", model_name="Faculty")
+    today = today or date.today()
+
+    active = Q(
+        assignments__cohort__start__lte=today, assignments__cohort__end__gte=today,
+    )
+    faculty = (
+        Faculty.objects.filter(active)
+        .annotate(num_assignments=Count("assignments", filter=active))
+        .order_by("last_name", "first_name")
+        .values_list("id", "slug", "display_name", "resolved_email", "num_assignments")
+    )
+
+    roster = []
+    for pk, slug, name, email, assignments in faculty:
+        roster.append({
+            "id": pk,
+            "slug": slug,
+            "name": name,
+            "email": email,
+            "full_email": formataddr((name, email)) if email else None,
+            "assignments": assignments,
+        })
+    return roster
+
+
+def mailto(roster):
+    """
+    Returns the comma separated recipients of the roster members with an email.
+    """
+    return ", ".join(row["full_email"] for row in roster if row["email"])
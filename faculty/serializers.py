@@ -0,0 +1,57 @@
+# faculty.serializers
+# REST API serializers for faculty models.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Mon Oct 19 23:02:48 2026 -0400
+#
+# Copyright (C) 2026 Georgetown University
+# For license information, see LICENSE.txt
+#
+# ID: serializers.py [] benjamin@bengfort.com $
+
+"""
+REST API serializers for faculty models.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+from rest_framework import serializers
+from faculty.models import Faculty, Assignment
+from webfolio.serializers import SparseModelSerializer
+
+
+##########################################################################
+## Serializers
+##########################################################################
+
+class FacultySerializer(SparseModelSerializer):
+    """
+    Faculty members without their user or contract information (e.g. hourly rate).
+    """
+
+    name = serializers.CharField(source="get_full_name", read_only=True)
+    email = serializers.EmailField(source="get_email", read_only=True)
+    gravatar = serializers.CharField(read_only=True)
+
+    class Meta:
+        model = Faculty
+        fields = (
+            "id", "slug", "name", "prefix", "first_name", "last_name", "suffix",
+            "netid", "email", "gravatar", "occupation", "organization", "bio", "github",
+            "twitter", "linkedin", "exclude", "created", "modified",
+        )
+
+
+class AssignmentSerializer(SparseModelSerializer):
+
+    faculty_name = serializers.CharField(source="faculty.get_full_name", read_only=True)
+
+    class Meta:
+        model = Assignment
+        fields = (
+            "id", "faculty", "faculty_name", "cohort", "course", "role", "start", "end",
+            "hours", "effort", "primary", "created", "modified",
+        )
+        select_related = {"faculty_name": "faculty"}
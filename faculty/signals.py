@@ -17,26 +17,39 @@ Signals used by faculty models - imported by the apps.py configuration.
 ## Imports
 ##########################################################################
 
-from django.db.models import Q
 from django.dispatch import receiver
-from django.utils.text import slugify
-from django.db.models.signals import pre_save
+from django.core.cache import cache
+from django.db.models.signals import pre_save, post_save, post_delete
 from django.contrib.auth.signals import user_logged_in
 
+from faculty import roster, profile
+from webfolio import cache as versions
+from django.contrib.auth import get_user_model
 from faculty.models import Faculty, Assignment
 
 
+# Users without a matching faculty member are not matched again for a while, unless
+# faculty members are created or changed (which replaces the version of the keys)
+UNMATCHED_CACHE_KEY = "faculty:unmatched:{version}:{pk}"
+UNMATCHED_CACHE_VERSION_KEY = "faculty:unmatched:version"
+UNMATCHED_CACHE_TIMEOUT = 60 * 15
+
+
 @receiver(pre_save, sender=Faculty, dispatch_uid="set_faculty_slug")
 def set_faculty_slug(sender, instance, **kwargs):
     """
-    Ensure a unique fauclty slug is set for the user.
+    Ensure a unique faculty slug is set for the user.
     """
     if not instance.slug:
-        slug = "{} {}".format(instance.first_name, instance.last_name)
-        slug = slugify(slug)
-        if sender.objects.filter(slug=slug).exists():
-            slug = "{}-{}".format(slug, instance.pk)
-        instance.slug = slug
+        sender.objects.allocate_slugs([instance])
+
+
+@receiver(pre_save, sender=Faculty, dispatch_uid="set_faculty_derived_fields")
+def set_faculty_derived_fields(sender, instance, **kwargs):
+    """
+    Store the display name, email, and email hash so that lists can read columns.
+    """
+    instance.update_derived_fields()
 
 
 @receiver(pre_save, sender=Assignment, dispatch_uid="check_assignment_defaults")
@@ -68,21 +81,112 @@ def check_assignment_defaults(sender, instance, **kwargs):
         instance.hours = instance.course.hours
 
 
+@receiver(post_save, sender=Assignment, dispatch_uid="assignment_saved_roster")
+@receiver(post_delete, sender=Assignment, dispatch_uid="assignment_deleted_roster")
+@receiver(post_save, sender=Faculty, dispatch_uid="faculty_saved_roster")
+@receiver(post_delete, sender=Faculty, dispatch_uid="faculty_deleted_roster")
+@receiver(post_save, sender="cohort.Cohort", dispatch_uid="cohort_saved_roster")
+@receiver(post_delete, sender="cohort.Cohort", dispatch_uid="cohort_deleted_roster")
+def invalidate_roster(sender, **kwargs):
+    """
+    Changes to assignments, faculty names or emails, or cohort dates change the roster.
+    """
+    roster.invalidate()
+
+
+@receiver(post_save, sender=Faculty, dispatch_uid="faculty_saved_profile")
+@receiver(post_delete, sender=Faculty, dispatch_uid="faculty_deleted_profile")
+def invalidate_faculty_profile(sender, instance, **kwargs):
+    profile.invalidate(instance.pk)
+
+
+@receiver(post_save, sender=Faculty, dispatch_uid="faculty_saved_unmatched")
+def invalidate_unmatched_users(sender, **kwargs):
+    """
+    New or changed faculty members may match users that previously had no match.
+    """
+    versions.invalidate(UNMATCHED_CACHE_VERSION_KEY)
+
+
+@receiver(pre_save, sender=Assignment, dispatch_uid="assignment_previous_faculty")
+def track_assignment_faculty(sender, instance, update_fields=None, **kwargs):
+    """
+    Store the faculty member the assignment belonged to before the save so that their
+    profile can be invalidated if the assignment is moved to another faculty member.
+    """
+    instance._previous_faculty_id = None
+    if instance._state.adding or instance.pk is None:
+        return
+
+    if update_fields is not None and not {"faculty", "faculty_id"} & set(update_fields):
+        return
+
+    instance._previous_faculty_id = (
+        sender.objects.filter(pk=instance.pk)
+        .values_list("faculty_id", flat=True)
+        .first()
+    )
+
+
+@receiver(post_save, sender=Assignment, dispatch_uid="assignment_saved_profile")
+@receiver(post_delete, sender=Assignment, dispatch_uid="assignment_deleted_profile")
+def invalidate_assignment_profile(sender, instance, **kwargs):
+    profile.invalidate(instance.faculty_id)
+
+    previous = getattr(instance, "_previous_faculty_id", None)
+    if previous is not None and previous != instance.faculty_id:
+        profile.invalidate(previous)
+
+
+@receiver(post_save, sender=get_user_model(), dispatch_uid="user_saved_faculty")
+def update_user_faculty(sender, instance, created, **kwargs):
+    """
+    The name and email of a user are used to derive the fields of their faculty member;
+    saving the faculty member also invalidates their profile and the roster.
+    """
+    update_fields = kwargs.get("update_fields")
+    if created or (update_fields and set(update_fields) <= {"last_login"}):
+        return
+
+    for faculty in Faculty.objects.filter(user=instance).select_related("user"):
+        if faculty.update_derived_fields():
+            faculty.save(update_fields=list(Faculty.DERIVED_FIELDS) + ["modified"])
+
+
+@receiver(post_save, sender="cohort.Course", dispatch_uid="course_saved_profile")
+@receiver(post_delete, sender="cohort.Course", dispatch_uid="course_deleted_profile")
+@receiver(post_save, sender="cohort.Cohort", dispatch_uid="cohort_saved_profile")
+@receiver(post_delete, sender="cohort.Cohort", dispatch_uid="cohort_deleted_profile")
+def invalidate_all_profiles(sender, **kwargs):
+    """
+    Course and cohort names and dates appear on the profiles of all of their faculty.
+    """
+    profile.invalidate()
+
+
 @receiver(user_logged_in)
 def associate_faculty_profile(sender, user, request, **kwargs):
     # Check if user has an associated faculty member
     if not hasattr(user, "faculty") or user.faculty is None:
-        # Search for faculty
-        query = Q(netid=user.username) | (Q(first_name=user.first_name) & Q(last_name=user.last_name))
-        query = Faculty.objects.filter(query)
-        if query.count() == 1:
-            profile = query.first()
-            profile.user = user
+        # Skip users (e.g. staff) that recently had no unique matching faculty member
+        version = versions.get_version(UNMATCHED_CACHE_VERSION_KEY)
+        unmatched = UNMATCHED_CACHE_KEY.format(version=version, pk=user.pk)
+        if cache.get(unmatched):
+            return
+
+        # Search for faculty by netid or normalized name
+        matches = list(Faculty.objects.match_user(user))
+        if len(matches) != 1:
+            cache.set(unmatched, True, UNMATCHED_CACHE_TIMEOUT)
+            return
+
+        profile = matches[0]
+        profile.user = user
 
-            if not profile.netid:
-                profile.netid = user.username
+        if not profile.netid:
+            profile.netid = user.username
 
-            if not profile.email:
-                profile.email = user.email
+        if not profile.email:
+            profile.email = user.email
 
-            profile.save()
+        profile.save()
@@ -30,9 +30,7 @@ register = template.Library()
 @register.filter(name='gravatar')
 def gravatar(user, size=35):
     if hasattr(user, "faculty") and user.faculty is not None:
-        email = user.faculty.get_email()
-    else:
-        email = user.email
+        return user.faculty.gravatar(size)
 
     email = str(user.email.strip().lower()).encode('utf-8')
     email_hash = md5(email).hexdigest()
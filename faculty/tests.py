@@ -17,6 +17,702 @@ Faculty app tests.
 ## Imports
 ##########################################################################
 
+from importlib import import_module
+from email.utils import getaddresses
+from datetime import date, datetime, timezone
+
+from io import StringIO
+from unittest import mock
+
+from django.apps import apps
+from django.core.management import call_command
+from django.urls import reverse
+from django.contrib.auth import get_user_model
 from django.test import TestCase
+from django.core.cache import cache
+
+from faculty import roster
+from faculty.bulk import BulkUpsert, CREATED, UPDATED, UNCHANGED, INVALID
+from faculty.profile import FacultyProfile
+from cohort.models import Cohort, Course, CalendarEvent
+from faculty.models import Faculty, Assignment, FACULTY_ROLES
+from faculty.dedupe import UnionFind, find_duplicates, conflicts, merge
+from faculty.conflicts import Interval, COURSE, SESSION, sweep, find_conflicts
+
+
+##########################################################################
+## Helpers
+##########################################################################
+
+def make_cohort(number=1, start=date(2020, 9, 1), end=date(2021, 6, 1)):
+    return Cohort.objects.create(cohort=number, semester="FA", start=start, end=end)
+
+
+def make_course(cohort, course_id="XBUS-500", section=1, **kwargs):
+    kwargs.setdefault("title", course_id)
+    return Course.objects.create(
+        cohort=cohort, course_id=course_id, section=section, **kwargs
+    )
+
+
+def make_faculty(first_name="Jane", last_name="Doe", **kwargs):
+    return Faculty.objects.create(first_name=first_name, last_name=last_name, **kwargs)
+
+
+##########################################################################
+## Slugs
+##########################################################################
+
+class SlugTests(TestCase):
+
+    def test_allocate_slugs(self):
+        first = make_faculty()
+        self.assertEqual(first.slug, "jane-doe")
+
+        members = [
+            Faculty(first_name="Jane", last_name="Doe"),
+            Faculty(first_name="John", last_name="Smith"),
+            Faculty(),
+        ]
+        Faculty.objects.allocate_slugs(members)
+        slugs = [member.slug for member in members]
+        self.assertEqual(slugs, ["jane-doe-2", "john-smith", "faculty"])
+
+
+##########################################################################
+## Derived Fields
+##########################################################################
+
+class DerivedFieldsTests(TestCase):
+
+    def test_backfill(self):
+        member = make_faculty(prefix="Dr.", netid="jd123")
+        Faculty.objects.update(display_name="", resolved_email=None, email_hash="")
+
+        migration = import_module("faculty.migrations.0010_backfill_derived_fields")
+        migration.backfill_derived_fields(apps, None)
+
+        backfilled = Faculty.objects.get(pk=member.pk)
+        self.assertEqual(backfilled.display_name, "Dr. Jane Doe")
+        self.assertEqual(backfilled.resolved_email, "jd123@georgetown.edu")
+        self.assertEqual(backfilled.email_hash, member.email_hash)
+
+
+##########################################################################
+## Faculty Roles
+##########################################################################
+
+class WithRolesTests(TestCase):
+
+    def setUp(self):
+        self.cohorts = [make_cohort(1), make_cohort(2)]
+        self.courses = [
+            make_course(self.cohorts[0], "XBUS-50{}".format(idx)) for idx in range(4)
+        ]
+        self.member = make_faculty()
+        self.unassigned = make_faculty("John", "Smith")
+
+        roles = [
+            (self.courses[0], FACULTY_ROLES.Instructor),
+            (self.courses[1], FACULTY_ROLES.Instructor),
+            (self.courses[2], FACULTY_ROLES.TA),
+        ]
+        for course, role in roles:
+            Assignment.objects.create(faculty=self.member, course=course, role=role)
+        for cohort in self.cohorts:
+            Assignment.objects.create(
+                faculty=self.member, cohort=cohort, role=FACULTY_ROLES.Advisor
+            )
+
+    def with_roles(self):
+        with self.assertNumQueries(1):
+            return {member.pk: member for member in Faculty.objects.with_roles()}
+
+    def test_mixed_roles(self):
+        members = self.with_roles()
+        member = members[self.member.pk]
+        self.assertEqual(member.num_courses, 3)
+        self.assertEqual(member.num_advising, 2)
+
+        # Ties between the most common roles are broken by the role code
+        self.assertEqual(member.top_role, FACULTY_ROLES.Advisor)
+        with self.assertNumQueries(0):
+            self.assertEqual(member.primary_role(), "Capstone Advisor")
+
+        Assignment.objects.create(
+            faculty=self.member, course=self.courses[3], role=FACULTY_ROLES.Instructor
+        )
+        member = self.with_roles()[self.member.pk]
+        self.assertEqual(member.top_role, FACULTY_ROLES.Instructor)
+        self.assertEqual(member.primary_role(), self.member.primary_role())
+        self.assertEqual((member.num_courses, member.num_advising), (4, 2))
+
+    def test_no_assignments(self):
+        member = self.with_roles()[self.unassigned.pk]
+        self.assertIsNone(member.top_role)
+        self.assertEqual((member.num_courses, member.num_advising), (0, 0))
+        self.assertEqual(member.primary_role(), "No Assignments")
+
+
+##########################################################################
+## Assignment Filters
+##########################################################################
+
+class AssignmentFilterTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.cohorts = [make_cohort(1), make_cohort(2)]
+        cls.faculty = [make_faculty(), make_faculty("John", "Smith")]
+        cls.assignments = [
+            Assignment.objects.create(
+                faculty=cls.faculty[0], role=FACULTY_ROLES.Instructor,
+                course=make_course(cls.cohorts[0], "XBUS-500"),
+            ),
+            Assignment.objects.create(
+                faculty=cls.faculty[1], role=FACULTY_ROLES.TA,
+                course=make_course(cls.cohorts[1], "XBUS-501"),
+            ),
+        ]
+
+    def assertAssignments(self, queryset, *indices):
+        expected = {self.assignments[idx].pk for idx in indices}
+        self.assertEqual(set(queryset.values_list("pk", flat=True)), expected)
+
+    def test_faculty(self):
+        first, second = self.faculty
+        self.assertAssignments(Assignment.objects.faculty(first), 0)
+        self.assertAssignments(Assignment.objects.faculty([first, second.pk]), 0, 1)
+        with self.assertRaises(ValueError):
+            Assignment.objects.faculty([])
+
+    def test_cohort(self):
+        self.assertAssignments(Assignment.objects.cohort(self.cohorts[0]), 0)
+        self.assertAssignments(Assignment.objects.cohort(2), 1)
+        self.assertAssignments(Assignment.objects.cohort([1, self.cohorts[1]]), 0, 1)
+
+    def test_courses(self):
+        course = self.assignments[1].course
+        self.assertAssignments(Assignment.objects.courses("XBUS-500"), 0)
+        self.assertAssignments(Assignment.objects.courses(course.pk), 1)
+        self.assertAssignments(Assignment.objects.courses(["XBUS-500", course]), 0, 1)
+
+    def test_roles(self):
+        self.assertAssignments(Assignment.objects.roles(FACULTY_ROLES.TA), 1)
+        roles = [FACULTY_ROLES.TA, FACULTY_ROLES.Instructor]
+        self.assertAssignments(Assignment.objects.roles(roles), 0, 1)
+        self.assertAssignments(Assignment.objects.roles(FACULTY_ROLES.Advisor))
+
+
+class ApplyDefaultsTests(TestCase):
+
+    def test_unfillable_rows_are_not_touched(self):
+        cohort = make_cohort(3, start=date(2022, 1, 1), end=date(2022, 6, 1))
+        course = make_course(cohort, "XBUS-601", hours=None)
+        Assignment.objects.bulk_create([
+            Assignment(faculty=make_faculty(), course=course, role=FACULTY_ROLES.TA),
+        ])
+
+        # The course has no dates or hours but the cohort is filled in once
+        self.assertEqual(Assignment.objects.apply_defaults(), 1)
+        modified = Assignment.objects.get().modified
+        self.assertEqual(Assignment.objects.apply_defaults(), 0)
+        self.assertEqual(Assignment.objects.get().modified, modified)
+
+    def test_apply_defaults(self):
+        member = make_faculty()
+        cohort = make_cohort(3, start=date(2022, 1, 1), end=date(2022, 6, 1))
+        course = make_course(
+            cohort, "XBUS-601", start=date(2022, 2, 1), end=date(2022, 3, 1), hours=12
+        )
+        Assignment.objects.bulk_create([
+            Assignment(faculty=member, course=course, role=FACULTY_ROLES.TA),
+            Assignment(faculty=member, cohort=cohort, role=FACULTY_ROLES.Advisor),
+        ])
+
+        self.assertEqual(Assignment.objects.apply_defaults(), 2)
+        assigned, advising = Assignment.objects.order_by("pk")
+        self.assertEqual(assigned.cohort_id, cohort.pk)
+        self.assertEqual((assigned.start, assigned.end), (course.start, course.end))
+        self.assertEqual(assigned.hours, 12)
+        self.assertEqual((advising.start, advising.end), (cohort.start, cohort.end))
+
+
+##########################################################################
+## Bulk Upserts
+##########################################################################
+
+class BulkUpsertTests(TestCase):
+
+    def setUp(self):
+        self.cohort = make_cohort(3, start=date(2022, 1, 1), end=date(2022, 6, 1))
+        self.course = make_course(
+            self.cohort, "XBUS-601", start=date(2022, 2, 1), end=date(2022, 3, 1)
+        )
+        self.member = make_faculty(netid="jd123")
+
+    def statuses(self, batch):
+        return {
+            name: [result["status"] for result in results]
+            for name, results in batch.results.items()
+        }
+
+    def test_apply(self):
+        courses = [
+            {"course_id": "XBUS-602", "section": 1, "title": "Data", "cohort": 3,
+             "start": date(2022, 3, 1), "end": date(2022, 4, 1), "hours": 12},
+            {"course_id": "XBUS-601", "section": 1, "hours": 15},
+        ]
+        assignments = [
+            {"faculty": "jd123", "course_id": "XBUS-602", "section": 1},
+            {"faculty": self.member.slug, "cohort": 3, "role": FACULTY_ROLES.Advisor},
+        ]
+
+        batch = BulkUpsert(courses, assignments)
+        self.assertTrue(batch.is_valid)
+        results = batch.apply()
+        self.assertEqual(self.statuses(batch), {
+            "courses": [CREATED, UPDATED], "assignments": [CREATED, CREATED],
+        })
+
+        instructing = Assignment.objects.get(pk=results["assignments"][0]["id"])
+        self.assertEqual(instructing.course_id, results["courses"][0]["id"])
+        self.assertEqual(instructing.cohort_id, self.cohort.pk)
+        self.assertEqual(instructing.start, date(2022, 3, 1))
+        self.assertEqual(instructing.hours, 12)
+
+        batch = BulkUpsert(courses, assignments)
+        batch.apply()
+        self.assertEqual(self.statuses(batch), {
+            "courses": [UNCHANGED, UNCHANGED], "assignments": [UNCHANGED, UNCHANGED],
+        })
+
+    def test_period_only_change(self):
+        period = self.course.period
+        modified = self.course.modified
+        Course.objects.filter(pk=self.course.pk).update(period=None)
+
+        batch = BulkUpsert([{"course_id": "XBUS-601", "section": 1}], [])
+        batch.apply()
+        self.assertEqual(self.statuses(batch)["courses"], [UPDATED])
+
+        self.course.refresh_from_db()
+        self.assertEqual(self.course.period, period)
+        self.assertGreater(self.course.modified, modified)
+
+    def test_unknown_references(self):
+        batch = BulkUpsert(
+            [{"course_id": "XBUS-602", "section": 1, "cohort": 9}],
+            [{"faculty": "nobody", "course_id": "XBUS-999", "section": 1}],
+        )
+        self.assertFalse(batch.is_valid)
+        results = batch.results
+        self.assertEqual(set(results["courses"][0]["errors"]), {"cohort", "title"})
+        self.assertEqual(
+            set(results["assignments"][0]["errors"]), {"faculty", "course_id"}
+        )
+
+        with self.assertRaises(ValueError):
+            batch.apply()
+        self.assertFalse(Course.objects.filter(course_id="XBUS-602").exists())
+
+    def test_duplicates(self):
+        course = {"course_id": "XBUS-601", "section": 1}
+        assignments = [
+            {"faculty": "jd123", "course_id": "XBUS-601", "section": 1},
+            {"faculty": self.member.slug, "course_id": "XBUS-601", "section": 1},
+            {"faculty": "jd123", "course_id": "XBUS-601", "section": 1, "cohort": 3},
+        ]
+
+        batch = BulkUpsert([course, course], assignments)
+        self.assertEqual(self.statuses(batch), {
+            "courses": ["valid", INVALID], "assignments": ["valid", INVALID, INVALID],
+        })
+        self.assertIn("duplicate", str(batch.results["assignments"][1]["errors"]))
+
+    def test_merged_dates(self):
+        Assignment.objects.create(
+            faculty=self.member, course=self.course, role=FACULTY_ROLES.Instructor,
+        )
+
+        batch = BulkUpsert([
+            {"course_id": "XBUS-601", "section": 1, "end": date(2022, 1, 15)},
+        ])
+        self.assertFalse(batch.is_valid)
+
+        batch = BulkUpsert(assignments=[
+            {"faculty": "jd123", "course_id": "XBUS-601", "section": 1,
+             "start": date(2022, 3, 15)},
+        ])
+        self.assertFalse(batch.is_valid)
+
+        # New assignments default to the dates of the course once the batch is applied
+        batch = BulkUpsert(
+            [{"course_id": "XBUS-601", "section": 1, "end": date(2022, 4, 1)}],
+            [{"faculty": "jd123", "course_id": "XBUS-601", "section": 1,
+              "role": FACULTY_ROLES.TA, "start": date(2022, 3, 15)}],
+        )
+        self.assertTrue(batch.is_valid)
+
+
+##########################################################################
+## Conflict Detection
+##########################################################################
+
+class SweepTests(TestCase):
+
+    def course(self, faculty, start, end, course):
+        start, end = date(2021, 1, start), date(2021, 1, end)
+        return Interval(faculty, COURSE, start, end, "", course)
+
+    def session(self, faculty, start, end):
+        return Interval(
+            faculty, SESSION,
+            datetime(2021, 1, 2, start, tzinfo=timezone.utc),
+            datetime(2021, 1, 2, end, tzinfo=timezone.utc), "", None,
+        )
+
+    def test_overlapping_courses(self):
+        first, second = self.course(1, 1, 10, 1), self.course(1, 5, 15, 2)
+        conflicts = list(sweep([second, first]))
+        self.assertEqual(len(conflicts), 1)
+        self.assertEqual((conflicts[0].first, conflicts[0].second), (first, second))
+
+    def test_course_dates_are_inclusive(self):
+        conflicts = list(sweep([self.course(1, 1, 10, 1), self.course(1, 10, 15, 2)]))
+        self.assertEqual(len(conflicts), 1)
+
+    def test_sessions_are_half_open(self):
+        adjacent = [self.session(1, 9, 12), self.session(1, 12, 15)]
+        self.assertEqual(list(sweep(adjacent)), [])
+
+        overlapping = [self.session(1, 9, 12), self.session(1, 11, 15)]
+        self.assertEqual(len(list(sweep(overlapping))), 1)
+
+    def test_same_course_is_not_a_conflict(self):
+        intervals = [self.course(1, 1, 10, 1), self.course(1, 5, 15, 1)]
+        self.assertEqual(list(sweep(intervals)), [])
+
+    def test_faculty_and_kinds_are_separate(self):
+        intervals = [
+            self.course(1, 1, 10, 1), self.course(2, 5, 15, 2),
+            Interval(1, SESSION, date(2021, 1, 5), date(2021, 1, 6), "", None),
+        ]
+        self.assertEqual(list(sweep(intervals)), [])
+
+    def test_every_overlapping_pair(self):
+        intervals = [
+            self.course(1, 1, 30, 1), self.course(1, 2, 3, 2), self.course(1, 4, 5, 3),
+        ]
+        pairs = {(c.first.course, c.second.course) for c in sweep(intervals)}
+        self.assertEqual(pairs, {(1, 2), (1, 3)})
+
+
+class FindConflictsTests(TestCase):
+
+    def test_find_conflicts(self):
+        cohort = make_cohort()
+        first = make_course(
+            cohort, "XBUS-501", start=date(2021, 1, 1), end=date(2021, 1, 31)
+        )
+        second = make_course(
+            cohort, "XBUS-502", start=date(2021, 1, 15), end=date(2021, 2, 15)
+        )
+        member, other = make_faculty(), make_faculty("John", "Smith")
+
+        instructor = FACULTY_ROLES.Instructor
+        for course in (first, second):
+            Assignment.objects.create(faculty=member, course=course, role=instructor)
+        Assignment.objects.create(faculty=other, course=first, role=instructor)
+
+        conflicts = find_conflicts()
+        self.assertEqual(len(conflicts), 1)
+        self.assertEqual(conflicts[0].faculty, member.pk)
+        courses = {conflicts[0].first.course, conflicts[0].second.course}
+        self.assertEqual(courses, {first.pk, second.pk})
+
+        self.assertEqual(find_conflicts(after=date(2021, 3, 1)), [])
+        self.assertEqual(find_conflicts(faculty=[other.pk]), [])
+
+    def test_holidays_are_not_conflicts(self):
+        member = make_faculty()
+        for day, summary in ((1, "New Year"), (2, "Holiday")):
+            event = CalendarEvent.objects.create(
+                summary=summary, is_holiday=True,
+                start=datetime(2021, 1, day, 9 + day, tzinfo=timezone.utc),
+                end=datetime(2021, 1, 2, 17, tzinfo=timezone.utc),
+            )
+            event.attendees.add(member)
+        self.assertEqual(find_conflicts(), [])
+
+
+##########################################################################
+## Duplicate Detection
+##########################################################################
+
+class UnionFindTests(TestCase):
+
+    def test_groups(self):
+        clusters = UnionFind()
+        for a, b in ((3, 1), (1, 2), (5, 4), (6, 6)):
+            clusters.union(a, b)
+        self.assertEqual(sorted(clusters.groups()), [[1, 2, 3], [4, 5]])
+        self.assertEqual(clusters.find(3), 1)
+
+
+class DedupeTests(TestCase):
+
+    def test_find_duplicates(self):
+        primary = make_faculty(netid="jd123")
+        duplicate = make_faculty("Jane", "Doe")
+        make_faculty("John", "Smith")
+        Assignment.objects.create(
+            faculty=primary, course=make_course(make_cohort()),
+            role=FACULTY_ROLES.Instructor,
+        )
+
+        clusters = find_duplicates()
+        self.assertEqual(clusters, [[primary, duplicate]])
+        self.assertEqual(conflicts(clusters[0]), [])
+
+    def test_transitive_clusters_conflict(self):
+        make_faculty(netid="jd123")
+        make_faculty()
+        make_faculty(netid="jd456", email="jane@example.com")
+
+        clusters = find_duplicates()
+        self.assertEqual(len(clusters), 1)
+        self.assertEqual(len(clusters[0]), 3)
+        self.assertEqual(conflicts(clusters[0]), ["netid"])
+
+        with self.assertRaises(ValueError):
+            merge(clusters[0][0], clusters[0][1:])
+        self.assertEqual(Faculty.objects.count(), 3)
+
+        out = StringIO()
+        call_command("dedupefaculty", merge=True, stdout=out)
+        self.assertIn("not merged: the members have different netids", out.getvalue())
+        self.assertEqual(Faculty.objects.count(), 3)
+
+    def test_merge(self):
+        primary, duplicate = make_faculty(netid="jd123"), make_faculty(bio="Bio")
+        first = make_course(make_cohort())
+        second = make_course(make_cohort(2), section=2)
+        role = FACULTY_ROLES.Instructor
+
+        Assignment.objects.create(faculty=primary, course=first, role=role)
+        dropped = Assignment.objects.create(faculty=duplicate, course=first, role=role)
+        Assignment.objects.create(faculty=duplicate, course=second, role=role)
+
+        moved, drops = merge(primary, [duplicate])
+        self.assertEqual(moved, 1)
+        self.assertEqual([row[0] for row in drops], [dropped.pk])
+
+        primary.refresh_from_db()
+        self.assertEqual(primary.bio, "Bio")
+        self.assertEqual(primary.assignments.count(), 2)
+        self.assertFalse(Faculty.objects.filter(pk=duplicate.pk).exists())
+
+    def test_command_reports_dropped_assignments(self):
+        primary, duplicate = make_faculty(netid="jd123"), make_faculty()
+        course, role = make_course(make_cohort()), FACULTY_ROLES.Instructor
+        Assignment.objects.create(faculty=primary, course=course, role=role)
+        dropped = Assignment.objects.create(faculty=duplicate, course=course, role=role)
+
+        out = StringIO()
+        call_command("dedupefaculty", merge=True, stdout=out)
+        self.assertIn("dropped assignment {}".format(dropped.pk), out.getvalue())
+        self.assertEqual(Faculty.objects.count(), 1)
+
+
+##########################################################################
+## Roster
+##########################################################################
+
+class RosterTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.today = date(2021, 1, 15)
+        self.course = make_course(make_cohort())
+        self.member = make_faculty(email="jdoe@example.com")
+        Assignment.objects.create(
+            faculty=self.member, course=self.course, role=FACULTY_ROLES.Instructor
+        )
+
+    def test_build_roster(self):
+        make_faculty("John", "Smith")
+        rows = roster.build_roster(self.today)
+        self.assertEqual([row["id"] for row in rows], [self.member.pk])
+        self.assertEqual(rows[0]["assignments"], 1)
+        self.assertEqual(roster.build_roster(date(2022, 1, 1)), [])
+
+    def test_mailto_quotes_names(self):
+        self.member.suffix = "PhD"
+        self.member.save()
+
+        rows = roster.build_roster(self.today)
+        self.assertEqual(rows[0]["full_email"], '"Jane Doe, PhD" <jdoe@example.com>')
+
+        other = make_faculty("John", "Smith", email="jsmith@example.com")
+        rows.append({
+            "email": other.email, "full_email": "John Smith <jsmith@example.com>",
+        })
+        addresses = getaddresses([roster.mailto(rows)])
+        self.assertEqual(addresses, [
+            ("Jane Doe, PhD", "jdoe@example.com"), ("John Smith", "jsmith@example.com"),
+        ])
+
+    def test_assignments_invalidate_roster(self):
+        self.assertEqual(len(roster.get_roster(self.today)), 1)
+
+        other = make_faculty("John", "Smith")
+        self.assertEqual(len(roster.get_roster(self.today)), 1)
+        Assignment.objects.create(
+            faculty=other, course=self.course, role=FACULTY_ROLES.TA
+        )
+        self.assertEqual(len(roster.get_roster(self.today)), 2)
+
+    def test_lost_version_does_not_restore_stale_entries(self):
+        roster.get_roster(self.today)
+        Assignment.objects.all().delete()
+        self.assertEqual(roster.get_roster(self.today), [])
+
+        # Eviction or expiration of the version must not fall back to an old version
+        cache.delete(roster.CACHE_VERSION_KEY)
+        self.assertEqual(roster.get_roster(self.today), [])
+
+
+##########################################################################
+## Profile
+##########################################################################
+
+class ProfileCacheTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.course = make_course(make_cohort())
+        self.faculty = [make_faculty(), make_faculty("John", "Smith")]
+
+    def version(self, faculty):
+        return FacultyProfile(faculty, today=date(2021, 1, 15)).version
+
+    def test_assignments_invalidate_profile(self):
+        first, second = self.faculty
+        versions = [self.version(first), self.version(second)]
+
+        Assignment.objects.create(
+            faculty=first, course=self.course, role=FACULTY_ROLES.Instructor
+        )
+        self.assertNotEqual(self.version(first), versions[0])
+        self.assertEqual(self.version(second), versions[1])
+
+    def test_moved_assignment_invalidates_both_profiles(self):
+        first, second = self.faculty
+        assignment = Assignment.objects.create(
+            faculty=first, course=self.course, role=FACULTY_ROLES.Instructor
+        )
+        versions = [self.version(first), self.version(second)]
+
+        assignment.faculty = second
+        assignment.save()
+        self.assertNotEqual(self.version(first), versions[0])
+        self.assertNotEqual(self.version(second), versions[1])
+
+    def test_lost_version_does_not_restore_stale_profiles(self):
+        member = self.faculty[0]
+        initial = self.version(member)
+        self.course.save()
+        self.assertNotEqual(self.version(member), initial)
+
+        # Eviction or expiration of a version must not fall back to an old version
+        cache.clear()
+        self.assertNotEqual(self.version(member), initial)
+
+
+##########################################################################
+## Login Matching
+##########################################################################
+
+class MatchUserTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user(
+            "jd123", email="jd123@georgetown.edu", first_name="Jane", last_name="Doe",
+        )
+
+    def matches(self, user=None):
+        return set(Faculty.objects.match_user(user or self.user))
+
+    def test_match_user(self):
+        by_netid = make_faculty("Janet", "Smith", netid="jd123")
+        by_name = make_faculty(" jane ", "DOE")
+        make_faculty("John", "Doe")
+        self.assertEqual(self.matches(), {by_netid, by_name})
+
+        # Linked faculty members are not matched to another user
+        other = get_user_model().objects.create_user("other")
+        by_name.user = other
+        by_name.save()
+        self.assertEqual(self.matches(), {by_netid})
+
+        # A user without a full name is only matched by netid
+        self.user.last_name = ""
+        self.assertEqual(self.matches(), {by_netid})
+
+    def test_login_associates_faculty(self):
+        member = make_faculty()
+        self.client.force_login(self.user)
+
+        member.refresh_from_db()
+        self.assertEqual(member.user, self.user)
+        self.assertEqual(member.netid, "jd123")
+        self.assertEqual(member.email, "jd123@georgetown.edu")
+
+    def test_ambiguous_login_is_not_associated(self):
+        make_faculty(netid="jd123")
+        make_faculty()
+        self.client.force_login(self.user)
+        self.assertFalse(Faculty.objects.filter(user=self.user).exists())
+
+    def test_new_faculty_invalidate_unmatched_users(self):
+        self.client.force_login(self.user)
+
+        # The unmatched user is not matched again until faculty members change
+        with mock.patch.object(Faculty.objects, "match_user") as match_user:
+            self.client.force_login(self.user)
+            match_user.assert_not_called()
+
+        make_faculty()
+        self.client.force_login(self.user)
+        self.assertTrue(Faculty.objects.filter(user=self.user).exists())
+
+    def test_bulk_created_faculty_invalidate_unmatched_users(self):
+        self.client.force_login(self.user)
+        Faculty.objects.bulk_create([Faculty(first_name="Jane", last_name="Doe")])
+        self.client.force_login(self.user)
+        self.assertTrue(Faculty.objects.filter(user=self.user).exists())
+
+
+##########################################################################
+## Views
+##########################################################################
+
+class FacultyViewTests(TestCase):
+
+    def test_login_required(self):
+        member = make_faculty()
+        urls = [
+            reverse(name) for name in (
+                "faculty_list", "assignment_list", "contact_list",
+                "faculty_unassociated",
+            )
+        ]
+        urls.append(reverse("faculty_detail", args=(member.slug,)))
 
-# Create your tests here.
+        for url in urls:
+            response = self.client.get(url, HTTP_HOST="localhost")
+            self.assertRedirects(
+                response, "/login/?next=" + url, fetch_redirect_response=False
+            )
@@ -18,38 +18,58 @@ Faculty app views.
 ##########################################################################
 
 from django.urls import reverse
-from django.db import connection
+from django.db.models import Q
 from django.views.generic import FormView
 from django.views.generic import ListView, DetailView, TemplateView
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
 
+from faculty.profile import FacultyProfile
+from faculty.roster import get_roster, mailto
 from faculty.forms import UploadScheduleForm
-from faculty.models import Faculty, Assignment, Contact
+from cohort.models import Cohort, Course, Semester
+from faculty.bulk import BulkUpsert
+from webfolio.views import ReadOnlyAPIViewSet
+from rest_framework import viewsets, status
+from rest_framework.response import Response
+from rest_framework.exceptions import ParseError
+from rest_framework.permissions import IsAdminUser
+from webfolio.pagination import KeysetPaginationMixin
+from webfolio.conditional import ConditionalListMixin
+from faculty.serializers import FacultySerializer, AssignmentSerializer
+from faculty.models import FACULTY_ROLES, Faculty, Assignment, Contact
 
 
-class FacultyListView(ListView, LoginRequiredMixin):
+class FacultyListView(LoginRequiredMixin, ConditionalListMixin, ListView):
 
     model = Faculty
+    conditional_models = (Faculty, Assignment)
     context_object_name = "faculty"
 
+    def get_queryset(self):
+        return Faculty.objects.with_roles()
+
     def get_context_data(self, **kwargs):
         context = super(FacultyListView, self).get_context_data(**kwargs)
         context["page"] = "faculty/faculty"
         return context
 
 
-class FacultyDetailView(DetailView, LoginRequiredMixin):
+class FacultyDetailView(LoginRequiredMixin, DetailView):
 
     model = Faculty
     context_object_name = "faculty"
 
+    def get_queryset(self):
+        return Faculty.objects.select_related("user")
+
     def get_context_data(self, **kwargs):
         context = super(FacultyDetailView, self).get_context_data(**kwargs)
         context["page"] = "faculty/faculty"
+        context["profile"] = FacultyProfile(self.object)
         return context
 
 
-class UnassociatedFacultyView(TemplateView, LoginRequiredMixin):
+class UnassociatedFacultyView(LoginRequiredMixin, TemplateView):
 
     template_name = "faculty/unassociated.html"
 
@@ -59,55 +79,87 @@ class UnassociatedFacultyView(TemplateView, LoginRequiredMixin):
         return context
 
 
-class AssignmentListView(ListView, LoginRequiredMixin):
+class AssignmentListView(
+    LoginRequiredMixin, ConditionalListMixin, KeysetPaginationMixin, ListView,
+):
 
     model = Assignment
+    conditional_models = (Assignment, Faculty, Cohort, Course, Semester)
     template_name = "faculty/assignments_list.html"
     context_object_name = "assignments"
+    fragment_template_name = "faculty/assignment_rows.html"
+
+    def get_queryset(self):
+        queryset = Assignment.objects.select_related(
+            "faculty", "cohort", "course"
+        ).only(
+            "faculty", "cohort", "course", "role", "start", "effort",
+            "faculty__display_name", "cohort__cohort", "course__title",
+        )
+
+        cohorts = self.get_filter_values("cohort")
+        if cohorts:
+            cohorts = [int(c) for c in cohorts if c.isdigit()]
+            if not cohorts:
+                return queryset.none()
+            queryset = queryset.cohort(*cohorts)
+
+        if self.request.GET.get("semester"):
+            semester = Semester.objects.lookup(self.request.GET["semester"])
+            if semester is None:
+                return queryset.none()
+            advising = Q(course__isnull=True, cohort__period=semester)
+            queryset = queryset.filter(Q(course__period=semester) | advising)
+
+        roles = self.get_filter_values("role")
+        if roles:
+            queryset = queryset.roles(*roles)
+        return queryset
+
+    def get_filter_values(self, param):
+        """
+        Returns the comma separated values of the query parameter as a list.
+        """
+        values = self.request.GET.get(param, "")
+        return [v.strip() for v in values.split(",") if v.strip()]
 
     def get_context_data(self, **kwargs):
         context = super(AssignmentListView, self).get_context_data(**kwargs)
         context["page"] = "faculty/assignments"
+        context["filters"] = {
+            "cohorts": Cohort.objects.order_by("-cohort").values_list(
+                "cohort", flat=True
+            ),
+            "semesters": Semester.objects.order_by("-start"),
+            "roles": FACULTY_ROLES,
+            "cohort": self.request.GET.get("cohort", ""),
+            "semester": self.request.GET.get("semester", ""),
+            "role": self.request.GET.get("role", ""),
+        }
         return context
 
 
-class ContactsListView(ListView, LoginRequiredMixin):
+class ContactsListView(LoginRequiredMixin, ListView):
 
     model = Contact
     template_name = "faculty/contact_list.html"
     context_object_name = "contacts"
 
-    def get_active_faculty(self):
-        query = (
-            "SELECT f.first_name, f.last_name, f.email, count(a.id) AS assignments "
-            "  FROM faculty f "
-            "  JOIN assignments a ON a.faculty_id = f.id "
-            "  JOIN cohorts c ON a.cohort_id = c.id "
-            "WHERE c.start <= NOW()::date and c.end >= NOW()::date "
-            "GROUP BY (f.first_name, f.last_name, f.email) "
-            "ORDER BY f.last_name "
-        )
-        results = []
-        with connection.cursor() as cursor:
-            cursor.execute(query)
-            for row in cursor.fetchall():
-                name = "{} {}".format(row[0], row[1])
-                email = row[2]
-                results.append({
-                    "name": name, "email": email,
-                    "full_email": "{} <{}>".format(name, email),
-                    "assignments": int(row[3]),
-                })
-
-        return results
+    def get_queryset(self):
+        return Contact.objects.active()
 
     def get_context_data(self, **kwargs):
         context = super(ContactsListView, self).get_context_data(**kwargs)
         context["page"] = "contacts"
-        context["faculty"] = self.get_active_faculty()
-        context["mailto_all_faculty"] = ", ".join([
-            row["full_email"] for row in context["faculty"] if row["email"]]
-        )
+
+        # Split the primary contacts from the active contacts without another query
+        context["active_contacts"] = list(context["contacts"])
+        context["primary_contacts"] = [
+            c for c in context["active_contacts"] if c.primary
+        ]
+
+        context["faculty"] = get_roster()
+        context["mailto_all_faculty"] = mailto(context["faculty"])
         return context
 
 
@@ -137,3 +189,50 @@ class UploadScheduleView(UserPassesTestMixin, FormView):
         context = super(UploadScheduleView, self).get_context_data(**kwargs)
         context["page"] = "admin/upload-schedule"
         return context
+
+
+##########################################################################
+## API Views
+##########################################################################
+
+class FacultyViewSet(ReadOnlyAPIViewSet):
+    """
+    Faculty members and their contact information.
+    """
+
+    queryset = Faculty.objects.all()
+    serializer_class = FacultySerializer
+
+
+class AssignmentViewSet(ReadOnlyAPIViewSet):
+    """
+    Faculty assignments to courses and advisor roles in cohorts.
+    """
+
+    queryset = Assignment.objects.all()
+    serializer_class = AssignmentSerializer
+
+
+class BulkScheduleViewSet(viewsets.ViewSet):
+    """
+    Staff-only bulk upsert of courses and assignments keyed on their natural keys, e.g.
+    {"courses": [{"course_id": "XBUS-500", "section": 1, ...}], "assignments": [...]}.
+    The batch is applied in a single transaction only if every record is valid.
+    """
+
+    permission_classes = [IsAdminUser]
+
+    def create(self, request):
+        if not isinstance(request.data, dict):
+            raise ParseError("expected an object with courses and assignments lists")
+
+        records = {}
+        for key in ("courses", "assignments"):
+            records[key] = request.data.get(key) or []
+            if not isinstance(records[key], list):
+                raise ParseError("{} must be a list of records".format(key))
+
+        batch = BulkUpsert(**records)
+        if not batch.is_valid:
+            return Response(batch.results, status=status.HTTP_400_BAD_REQUEST)
+        return Response(batch.apply())
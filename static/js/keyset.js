@@ -0,0 +1,50 @@
+/*
+ * keyset.js
+ * Infinite scrolling for DataTables whose rows are keyset paginated by the server.
+ *
+ * The "more" link points to the next page of the list view; when it is clicked or
+ * scrolled into view the rows of the next page are requested as an HTML fragment and
+ * added to the table, and the link is updated from the X-Next-Page response header
+ * (or removed when there are no more pages).
+ */
+
+function keysetScroll(table, more) {
+  var loading = false;
+
+  function load() {
+    if (loading || !more.length) {
+      return;
+    }
+
+    loading = true;
+    $.ajax({
+      url: more.attr("href"),
+      headers: { "X-Requested-With": "XMLHttpRequest" }
+    }).done(function (html, status, xhr) {
+      table.rows.add($($.parseHTML($.trim(html))).filter("tr")).draw(false);
+
+      var next = xhr.getResponseHeader("X-Next-Page");
+      if (next) {
+        more.attr("href", next);
+      } else {
+        more.closest(".keyset-more").remove();
+        more = $();
+      }
+    }).always(function () {
+      loading = false;
+    });
+  }
+
+  more.on("click", function (e) {
+    e.preventDefault();
+    load();
+  });
+
+  if (more.length && "IntersectionObserver" in window) {
+    new IntersectionObserver(function (entries) {
+      if (entries[0].isIntersecting) {
+        load();
+      }
+    }).observe(more[0]);
+  }
+}
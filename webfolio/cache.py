@@ -0,0 +1,63 @@
+# webfolio.cache
+# Versioned cache keys that invalidate groups of cached entries at once.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Tue Oct 20 09:12:44 2026 -0400
+#
+# Copyright (C) 2026 Georgetown University
+# For license information, see LICENSE.txt
+#
+# ID: cache.py [] benjamin@bengfort.com $
+
+"""
+Versioned cache keys that invalidate groups of cached entries at once.
+
+Cached data (e.g. the availability of a year or the roster of a day) is stored under
+keys that include the current value of a version key, so that changing the version
+invalidates every entry built with the previous one without having to find them.
+Versions are random tokens that are stored without a timeout: if a version is evicted
+or expires a new token is generated, so entries built under an older version can never
+be served again.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import uuid
+
+from django.core.cache import cache
+
+
+def new_version():
+    return uuid.uuid4().hex
+
+
+def get_version(key):
+    """
+    Returns the current version stored at the key, creating it if necessary.
+    """
+    return get_versions(key)[key]
+
+
+def get_versions(*keys):
+    """
+    Returns a dict of the current versions stored at the keys with a single cache
+    lookup, creating any versions that are missing.
+    """
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            # Another process may have created the version since the lookup
+            version = new_version()
+            if not cache.add(key, version, None):
+                version = cache.get(key, version)
+            versions[key] = version
+    return versions
+
+
+def invalidate(key):
+    """
+    Replaces the version stored at the key, invalidating all entries built with it.
+    """
+    cache.set(key, new_version(), None)
@@ -0,0 +1,116 @@
+# webfolio.conditional
+# Conditional GET support for list views.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Mon Oct 19 23:57:30 2026 -0400
+#
+# Copyright (C) 2026 Georgetown University
+# For license information, see LICENSE.txt
+#
+# ID: conditional.py [] benjamin@bengfort.com $
+
+"""
+Conditional GET support for list views.
+
+A list page only changes when the models it renders change, so its ETag and
+Last-Modified headers are derived from the latest modified timestamp of those models
+(and the latest deletion of their objects from the change feed tombstones). The
+timestamps are fetched with a single UNION ALL of aggregates over the indexed modified
+columns; if the client already has the current page a 304 is returned without running
+the view's queries or rendering its templates. Pages that are rendered are compressed.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import hashlib
+
+from datetime import date
+from django.apps import apps
+from django.contrib import messages
+from django.utils.decorators import method_decorator
+from django.views.decorators.gzip import gzip_page
+from django.db.models import Max, Value
+from django.utils.http import http_date, quote_etag
+from django.utils.cache import get_conditional_response
+from django.utils.cache import patch_cache_control, patch_vary_headers
+
+from cohort.changes import STREAMS
+
+
+def last_modified(*models):
+    """
+    Returns the latest modified timestamp of the models or of the deletion of one of
+    their objects with a single query, or None if there are no objects.
+    """
+    def latest(queryset, field):
+        queryset = queryset.order_by().values(one=Value(1))
+        return queryset.annotate(ts=Max(field)).values("ts")
+
+    labels = {model._meta.label for model in models}
+    queries = [latest(model.objects.all(), "modified") for model in models]
+
+    streams = [name for name, label, _ in STREAMS if label in labels]
+    if streams:
+        Tombstone = apps.get_model(app_label="cohort", model_name="Tombstone")
+        queries.append(latest(Tombstone.objects.filter(model__in=streams), "deleted"))
+
+    query = queries[0].union(*queries[1:], all=True)
+    return max((ts for ts in query.values_list("ts", flat=True) if ts), default=None)
+
+
+##########################################################################
+## Conditional Views
+##########################################################################
+
+class ConditionalListMixin(object):
+    """
+    Returns 304 Not Modified for GET requests of a list view if none of the
+    conditional_models have changed since the client last fetched the page. The ETag
+    also includes the user, the query string, and the date because the page depends
+    on them as well; pages with pending messages are always rendered.
+    """
+
+    conditional_models = None
+
+    def get_conditional_models(self):
+        if self.conditional_models is None:
+            return (self.model,)
+        return self.conditional_models
+
+    def get_etag(self, modified):
+        user = self.request.user
+        parts = (
+            modified.isoformat() if modified else "",
+            user.pk, user.is_staff, date.today().isoformat(),
+            self.request.get_full_path(),
+            self.request.headers.get("X-Requested-With", ""),
+        )
+        digest = hashlib.md5("|".join(map(str, parts)).encode("utf-8")).hexdigest()
+        return quote_etag(digest)
+
+    @method_decorator(gzip_page)
+    def dispatch(self, request, *args, **kwargs):
+        return super(ConditionalListMixin, self).dispatch(request, *args, **kwargs)
+
+    def get(self, request, *args, **kwargs):
+        if len(messages.get_messages(request)) > 0:
+            return super(ConditionalListMixin, self).get(request, *args, **kwargs)
+
+        modified = last_modified(*self.get_conditional_models())
+        etag = self.get_etag(modified)
+        timestamp = int(modified.timestamp()) if modified else None
+
+        response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+        if response is None:
+            response = super(ConditionalListMixin, self).get(request, *args, **kwargs)
+
+        response.headers.setdefault("ETag", etag)
+        if timestamp is not None:
+            response.headers.setdefault("Last-Modified", http_date(timestamp))
+
+        # The page is per user so it must be revalidated before it is reused
+        patch_cache_control(response, private=True, no_cache=True)
+        patch_vary_headers(response, ("Cookie", "X-Requested-With"))
+        return response
@@ -0,0 +1,244 @@
+# webfolio.pagination
+# Keyset pagination for list views over large tables.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Mon Oct 19 19:48:02 2026 -0400
+#
+# Copyright (C) 2026 Georgetown University
+# For license information, see LICENSE.txt
+#
+# ID: pagination.py [] benjamin@bengfort.com $
+
+"""
+Keyset pagination for list views over large tables.
+
+Rather than skipping rows with OFFSET (which gets slower the further into the list a
+page is), keyset pagination seeks to the position after the last row of the previous
+page using the values of that row's ordering fields. The position is encoded as an
+opaque cursor in the query string so that every page is a single indexed query
+regardless of how large the table grows.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import json
+import base64
+import binascii
+
+from django.http import Http404
+from django.db.models import F, Q
+from django.core.serializers.json import DjangoJSONEncoder
+from rest_framework.pagination import CursorPagination
+
+
+##########################################################################
+## Keyset Paginator
+##########################################################################
+
+class InvalidCursor(ValueError):
+    pass
+
+
+class KeysetPage(object):
+    """
+    A single page of results along with the cursors to the next page.
+    """
+
+    def __init__(self, object_list, cursor, next_cursor):
+        self.object_list = object_list
+        self.cursor = cursor
+        self.next_cursor = next_cursor
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+
+class KeysetPaginator(object):
+    """
+    Paginates a queryset by seeking on its ordering. The ordering is a sequence of
+    field names (with an optional "-" prefix for descending order), and the primary
+    key is appended to ensure that every row has a unique position. Nulls are sorted as
+    if they were larger than any other value (last in ascending order and first in
+    descending order) as they are by default on Postgres, so the order of a list does
+    not change when it is paginated; the ordering is explicit so that the seek works
+    the same way on every database.
+    """
+
+    KEY = "keyset_{}"
+
+    def __init__(self, queryset, ordering, per_page):
+        ordering = list(ordering)
+        if not any(field.lstrip("-") in ("pk", "id") for field in ordering):
+            ordering.append("pk")
+
+        self.per_page = per_page
+        self.keys = [
+            (self.KEY.format(idx), field.lstrip("-"), field.startswith("-"))
+            for idx, field in enumerate(ordering)
+        ]
+
+        self.queryset = queryset.annotate(**{
+            key: F(field) for key, field, _ in self.keys
+        }).order_by(*[
+            F(key).desc(nulls_first=True) if desc else F(key).asc(nulls_last=True)
+            for key, _, desc in self.keys
+        ])
+
+    def page(self, cursor=None):
+        """
+        Returns the page that follows the position encoded by the cursor, or the first
+        page if no cursor is specified.
+        """
+        queryset = self.queryset
+        if cursor:
+            queryset = queryset.filter(self.seek(self.decode(cursor)))
+
+        rows = list(queryset[:self.per_page + 1])
+        next_cursor = None
+        if len(rows) > self.per_page:
+            rows = rows[:self.per_page]
+            next_cursor = self.encode(rows[-1])
+        return KeysetPage(rows, cursor, next_cursor)
+
+    def seek(self, values):
+        """
+        Returns the filter for the rows that are ordered after the specified values,
+        e.g. (a > x) OR (a = x AND b > y) OR (a = x AND b = y AND pk > z).
+        """
+        query, equal = Q(), Q()
+        for (key, _, desc), value in zip(self.keys, values):
+            if value is None:
+                # Nulls are first when descending and last when ascending
+                after = Q(**{f"{key}__isnull": False}) if desc else Q(pk__in=[])
+                same = Q(**{f"{key}__isnull": True})
+            elif desc:
+                after = Q(**{f"{key}__lt": value})
+                same = Q(**{key: value})
+            else:
+                after = Q(**{f"{key}__gt": value}) | Q(**{f"{key}__isnull": True})
+                same = Q(**{key: value})
+
+            query |= equal & after
+            equal &= same
+        return query
+
+    def encode(self, row):
+        values = [getattr(row, key) for key, _, _ in self.keys]
+        data = json.dumps(values, cls=DjangoJSONEncoder, separators=(",", ":"))
+        cursor = base64.urlsafe_b64encode(data.encode("utf-8")).decode("ascii")
+        return cursor.rstrip("=")
+
+    def decode(self, cursor):
+        try:
+            data = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            values = json.loads(data)
+        except (ValueError, TypeError, binascii.Error):
+            raise InvalidCursor("could not decode the pagination cursor")
+
+        if not isinstance(values, list) or len(values) != len(self.keys):
+            raise InvalidCursor("the pagination cursor does not match the ordering")
+
+        annotations = self.queryset.query.annotations
+        try:
+            return [
+                annotations[key].output_field.to_python(value)
+                if value is not None else None
+                for (key, _, _), value in zip(self.keys, values)
+            ]
+        except Exception:
+            raise InvalidCursor("the pagination cursor contains invalid values")
+
+
+##########################################################################
+## List View Mixin
+##########################################################################
+
+class KeysetPaginationMixin(object):
+    """
+    Replaces the OFFSET pagination of a ListView with keyset pagination over the
+    ordering of the view (or of the model if the view has no ordering). The page is
+    selected by the cursor query parameter and the context contains the page_obj and
+    the next_page_query that preserves the other query parameters of the request.
+
+    If a fragment_template_name is specified, AJAX requests for further pages are
+    rendered with the fragment template (e.g. just the table rows) so that they can be
+    appended to the page by static/js/keyset.js. The query string of the next page is
+    returned in the X-Next-Page header of every response.
+    """
+
+    paginate_by = 100
+    cursor_kwarg = "cursor"
+    fragment_template_name = None
+
+    def is_fragment_request(self):
+        return self.request.headers.get("X-Requested-With") == "XMLHttpRequest"
+
+    def get_template_names(self):
+        if self.fragment_template_name and self.is_fragment_request():
+            return [self.fragment_template_name]
+        return super(KeysetPaginationMixin, self).get_template_names()
+
+    def render_to_response(self, context, **response_kwargs):
+        response = super(KeysetPaginationMixin, self).render_to_response(
+            context, **response_kwargs
+        )
+        if context.get("next_page_query"):
+            response["X-Next-Page"] = "?" + context["next_page_query"]
+        return response
+
+    def get_keyset_ordering(self, queryset):
+        return (
+            self.get_ordering() or queryset.query.order_by or self.model._meta.ordering
+        )
+
+    def paginate_queryset(self, queryset, page_size):
+        ordering = self.get_keyset_ordering(queryset)
+        paginator = KeysetPaginator(queryset, ordering, page_size)
+        try:
+            page = paginator.page(self.request.GET.get(self.cursor_kwarg))
+        except InvalidCursor as e:
+            raise Http404(str(e))
+        return (paginator, page, page.object_list, page.has_other_pages())
+
+    def get_next_page_query(self, page):
+        if page is None or not page.has_next():
+            return None
+
+        query = self.request.GET.copy()
+        query[self.cursor_kwarg] = page.next_cursor
+        return query.urlencode()
+
+    def get_context_data(self, **kwargs):
+        context = super(KeysetPaginationMixin, self).get_context_data(**kwargs)
+        context["next_page_query"] = self.get_next_page_query(context.get("page_obj"))
+        return context
+
+
+##########################################################################
+## API Pagination
+##########################################################################
+
+class APICursorPagination(CursorPagination):
+    """
+    The default pagination of the REST API, which seeks on the primary key so that every
+    page is a single indexed query. Clients can request up to max_page_size records per
+    page with the per_page query parameter.
+    """
+
+    ordering = "pk"
+    page_size_query_param = "per_page"
+    max_page_size = 200
@@ -0,0 +1,83 @@
+# webfolio.serializers
+# Shared serializer helpers for the REST API.
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Mon Oct 19 22:41:37 2026 -0400
+#
+# Copyright (C) 2026 Georgetown University
+# For license information, see LICENSE.txt
+#
+# ID: serializers.py [] benjamin@bengfort.com $
+
+"""
+Shared serializer helpers for the REST API.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+from rest_framework import serializers
+
+
+##########################################################################
+## Sparse Fieldsets
+##########################################################################
+
+class SparseFieldsMixin(object):
+    """
+    Limits the serialized fields to those requested in the fields query parameter of
+    the request, e.g. ?fields=id,title,start. Unknown fields are ignored and all fields
+    are serialized if the parameter is not specified.
+
+    Serializers also declare the related objects their fields require with the
+    select_related and prefetch_related dicts on their Meta (field name to lookup) so
+    that optimize_queryset only joins or prefetches what the requested fields need.
+    """
+
+    fields_param = "fields"
+
+    def __init__(self, *args, **kwargs):
+        super(SparseFieldsMixin, self).__init__(*args, **kwargs)
+        requested = self.get_requested_fields(self.context.get("request"))
+        if requested:
+            for name in set(self.fields) - requested:
+                self.fields.pop(name)
+
+    @classmethod
+    def get_requested_fields(cls, request):
+        if request is None:
+            return None
+
+        fields = request.query_params.get(cls.fields_param)
+        if not fields:
+            return None
+        return {field.strip() for field in fields.split(",") if field.strip()}
+
+    @classmethod
+    def optimize_queryset(cls, queryset, request=None):
+        """
+        Applies the select_related and prefetch_related lookups of the requested fields
+        (or of all fields) to the queryset.
+        """
+        requested = cls.get_requested_fields(request)
+
+        def lookups(name):
+            mapping = getattr(cls.Meta, name, {})
+            return [
+                lookup for field, lookup in mapping.items()
+                if requested is None or field in requested
+            ]
+
+        select = lookups("select_related")
+        if select:
+            queryset = queryset.select_related(*select)
+
+        prefetch = lookups("prefetch_related")
+        if prefetch:
+            queryset = queryset.prefetch_related(*prefetch)
+        return queryset
+
+
+class SparseModelSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    pass
@@ -78,6 +78,19 @@ DATABASES['default']['ENGINE'] = 'django.db.backends.postgresql_psycopg2'
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# Cache shared by every worker and replica so that invalidations are seen by all of
+# them; the table is created by the cohort migrations (see createcachetable).
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': 'django_cache',
+        'TIMEOUT': 60 * 60 * 24,
+        'OPTIONS': {
+            'MAX_ENTRIES': 10000,
+        },
+    }
+}
+
 ##########################################################################
 ## Secrets
 ##########################################################################
@@ -264,10 +277,8 @@ REST_FRAMEWORK = {
     ),
 
     ## Pagination in the API
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
-    'PAGINATE_BY': 50,
-    'PAGINATE_BY_PARAM': 'per_page',
-    'MAX_PAGINATE_BY': 200,
+    'DEFAULT_PAGINATION_CLASS': 'webfolio.pagination.APICursorPagination',
+    'PAGE_SIZE': 50,
 }
 
 ##########################################################################
@@ -0,0 +1,194 @@
+# webfolio.tests
+# Webfolio project tests
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Mon Oct 19 17:42:18 2026 -0400
+#
+# Copyright (C) 2026 Georgetown University
+# For license information, see LICENSE.txt
+#
+# ID: tests.py [] benjamin@bengfort.com $
+
+"""
+Webfolio project tests
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+from datetime import date
+from unittest import mock
+
+from django.urls import reverse
+from django.test import TestCase, SimpleTestCase
+from django.db import connection, DatabaseError
+from django.contrib.auth import get_user_model
+
+import webfolio
+from webfolio.version import get_revision
+from webfolio.conditional import last_modified
+from cohort.models import Cohort, Course
+
+
+##########################################################################
+## API
+##########################################################################
+
+class HeartbeatTests(TestCase):
+
+    def get(self, path=""):
+        return self.client.get("/api/status/" + path, HTTP_HOST="localhost")
+
+    def test_status(self):
+        response = self.get()
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["status"], "ok")
+        self.assertEqual(data["version"], webfolio.__version__)
+        self.assertEqual(data["revision"], webfolio.get_revision(short=True))
+
+    def test_live(self):
+        with self.assertNumQueries(0):
+            response = self.get("live/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"status": "ok"})
+
+    def test_ready(self):
+        with self.assertNumQueries(1):
+            response = self.get("ready/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["status"], "ok")
+        self.assertGreaterEqual(response.json()["database_ms"], 0)
+
+    def test_not_ready(self):
+        with mock.patch.object(connection, "cursor", side_effect=DatabaseError):
+            response = self.get("ready/")
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.json(), {"status": "unavailable"})
+
+        # Liveness does not depend on the database
+        with mock.patch.object(connection, "cursor", side_effect=DatabaseError):
+            self.assertEqual(self.get("live/").status_code, 200)
+
+
+class AvailabilityViewTests(TestCase):
+
+    def setUp(self):
+        user = get_user_model().objects.create_user("staff", password="supersecret")
+        self.client.force_login(user)
+
+    def get(self, **params):
+        return self.client.get("/api/availability/", params, HTTP_HOST="localhost")
+
+    def test_year(self):
+        response = self.get(year=2021)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["year"], 2021)
+
+        for year in (2, 9998):
+            self.assertEqual(self.get(year=year).status_code, 200, year)
+
+    def test_invalid_year(self):
+        for year in ("0", "1", "9999", "10000", "-1", "twenty"):
+            self.assertEqual(self.get(year=year).status_code, 400, year)
+
+
+class APITests(TestCase):
+
+    def setUp(self):
+        user = get_user_model().objects.create_user("staff", password="supersecret")
+        self.client.force_login(user)
+
+    def test_sparse_fields(self):
+        cohort = Cohort.objects.create(
+            cohort=1, semester="FA", start=date(2021, 1, 1), end=date(2021, 12, 31)
+        )
+        Course.objects.create(
+            cohort=cohort, course_id="XBUS-501", section=1, title="Foundations"
+        )
+
+        response = self.client.get(
+            "/api/courses/", {"fields": "course_id,cohort_number,unknown"},
+            HTTP_HOST="localhost",
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json()["results"], [{"course_id": "XBUS-501", "cohort_number": 1}]
+        )
+
+
+##########################################################################
+## Conditional Views
+##########################################################################
+
+class ConditionalListTests(TestCase):
+
+    def setUp(self):
+        user = get_user_model().objects.create_user("staff", password="supersecret")
+        self.client.force_login(user)
+        self.cohort = Cohort.objects.create(
+            cohort=1, semester="FA", start=date(2021, 1, 1), end=date(2021, 12, 31)
+        )
+
+    def get(self, etag=None):
+        headers = {"HTTP_HOST": "localhost"}
+        if etag:
+            headers["HTTP_IF_NONE_MATCH"] = etag
+        return self.client.get(reverse("cohort_list"), **headers)
+
+    def test_last_modified(self):
+        self.assertEqual(last_modified(Cohort), self.cohort.modified)
+        self.assertEqual(last_modified(Course), None)
+
+        course = Course.objects.create(
+            cohort=self.cohort, course_id="XBUS-501", section=1, title="Foundations"
+        )
+        self.assertEqual(last_modified(Cohort, Course), course.modified)
+
+        course.delete()
+        self.assertGreater(last_modified(Course), course.modified)
+
+    def test_not_modified(self):
+        response = self.get()
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("Last-Modified", response)
+        etag = response["ETag"]
+
+        response = self.get(etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+
+        self.cohort.save()
+        response = self.get(etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_deletes_modify_the_list(self):
+        etag = self.get()["ETag"]
+        self.cohort.delete()
+        self.assertEqual(self.get(etag).status_code, 200)
+
+
+##########################################################################
+## Version
+##########################################################################
+
+class RevisionTests(SimpleTestCase):
+
+    def setUp(self):
+        get_revision.cache_clear()
+        self.addCleanup(get_revision.cache_clear)
+
+    def test_environment(self):
+        environ = {"GIT_REVISION": "", "HEROKU_SLUG_COMMIT": "0123456789abcdef"}
+        with mock.patch.dict("os.environ", environ):
+            self.assertEqual(get_revision(short=True), "0123456")
+            self.assertEqual(get_revision(), "0123456789abcdef")
+
+    @mock.patch("webfolio.version.subprocess.check_output", return_value=b"abc1234\n")
+    def test_empty_environment(self, check_output):
+        environ = {"GIT_REVISION": "", "HEROKU_SLUG_COMMIT": "", "SLUG_COMMIT": ""}
+        with mock.patch.dict("os.environ", environ):
+            self.assertEqual(get_revision(short=True), "abc1234")
+        check_output.assert_called_once()
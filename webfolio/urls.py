@@ -37,8 +37,12 @@ from faculty.views import UploadScheduleView
 from cohort.views import CalendarEventsView, HolidayView
 from faculty.views import UnassociatedFacultyView, ContactsListView
 from webfolio.views import HeartbeatViewSet, Overview, SchedulingView
+from webfolio.views import AvailabilityViewSet, RosterViewSet
 from cohort.views import CohortListView, CourseListView, CapstoneListView
 from faculty.views import FacultyListView, AssignmentListView, FacultyDetailView
+from faculty.views import FacultyViewSet, AssignmentViewSet, BulkScheduleViewSet
+from cohort.views import CohortViewSet, CourseViewSet, CapstoneViewSet
+from cohort.views import CalendarEventViewSet, ChangesViewSet
 
 ##########################################################################
 ## Endpoint Discovery
@@ -47,6 +51,16 @@ from faculty.views import FacultyListView, AssignmentListView, FacultyDetailView
 # Top level router
 router = routers.DefaultRouter()
 router.register(r'status', HeartbeatViewSet, "status")
+router.register(r'availability', AvailabilityViewSet, "availability")
+router.register(r'roster', RosterViewSet, "roster")
+router.register(r'cohorts', CohortViewSet, "cohort")
+router.register(r'courses', CourseViewSet, "course")
+router.register(r'capstones', CapstoneViewSet, "capstone")
+router.register(r'faculty', FacultyViewSet, "faculty")
+router.register(r'assignments', AssignmentViewSet, "assignment")
+router.register(r'events', CalendarEventViewSet, "event")
+router.register(r'schedule', BulkScheduleViewSet, "schedule")
+router.register(r'changes', ChangesViewSet, "changes")
 
 
 ##########################################################################
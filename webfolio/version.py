@@ -13,6 +13,8 @@ Helper module for managing versioning information
 import os
 import subprocess
 
+from functools import lru_cache
+
 
 ## Commit environment variables
 SLUG_COMMIT_ENV = [
@@ -56,16 +58,19 @@ def get_version(short=False):
     return ''.join(vers)
 
 
+@lru_cache(maxsize=None)
 def get_revision(short=False, env=True):
     """
-    Returns the latest git revision (sha1 hash).
+    Returns the latest git revision (sha1 hash) or None if it cannot be determined,
+    e.g. in a container without git. The revision is resolved once per process.
     """
 
-    # First look up the revision from the environment
+    # First look up the revision from the environment (ignoring empty variables, e.g.
+    # from a container built without a revision)
     if env:
         for envvar in SLUG_COMMIT_ENV:
-            if envvar in os.environ:
-                slug = os.environ[envvar]
+            slug = os.environ.get(envvar)
+            if slug:
                 if short:
                     return slug[:7]
                 return slug
@@ -75,4 +80,8 @@ def get_revision(short=False, env=True):
     if short:
         cmd.insert(2, '--short')
 
-    return subprocess.check_output(cmd).decode('utf-8').strip()
+    try:
+        output = subprocess.check_output(cmd, stderr=subprocess.DEVNULL)
+        return output.decode('utf-8').strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
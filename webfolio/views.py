@@ -17,19 +17,26 @@ Default application views for the application
 ## Imports
 ##########################################################################
 
+import time
 import webfolio
 
-from datetime import datetime, date, timedelta
-from cohort.managers import scheduled_semesters
-from cohort.models import SEMESTER, Cohort, Course, CalendarEvent
+from datetime import datetime, date, timedelta, MINYEAR, MAXYEAR
+from cohort.availability import get_availability
+from cohort.dashboard import get_snapshot
+from faculty.roster import get_roster, mailto
+from faculty.conflicts import find_conflicts, group_by_faculty
+from cohort.models import Cohort, CalendarEvent
 
 from django.db.models import Q
+from django.db import connection, DatabaseError
 from django.shortcuts import render
 from django.views.generic import TemplateView
 from django.contrib.auth.mixins import LoginRequiredMixin
 
-from rest_framework import viewsets
+from rest_framework import viewsets, status
+from rest_framework.decorators import action
 from rest_framework.response import Response
+from rest_framework.exceptions import ParseError
 from rest_framework.permissions import AllowAny
 
 
@@ -41,39 +48,10 @@ class Overview(LoginRequiredMixin, TemplateView):
 
     template_name = "site/overview.html"
 
-    def get_next_capstone_presentations(self):
-        applied = Course.objects.filter(title__startswith="Applied")
-        applied = applied.ends_after(date.today()).order_by("end").first()
-        if applied:
-            return applied.end
-        return None
-
-    def get_cohort_progress(self):
-        cohort = Cohort.objects.current().first()
-        if not cohort:
-            return None
-        return {
-            "pcent": cohort.percent_complete(),
-            "cohort": cohort.cohort,
-        }
-
-    def scheduled_semesters(self):
-        for semester, year in scheduled_semesters():
-            courses = Course.objects.non_cohort_courses(semester, year)
-            yield f"{SEMESTER[semester]} {year:0.0f}", courses
-
-    def current_cohorts(self):
-        return Cohort.objects.order_by("end").ends_after(date.today())[0:3]
-
     def get_context_data(self, **kwargs):
         context = super(Overview, self).get_context_data(**kwargs)
         context["page"] = "overview"
-        context["next_capstone_presentations"] = self.get_next_capstone_presentations()
-        context["num_active_courses"] = Course.objects.current().count()
-        context["num_upcoming_courses"] = Course.objects.upcoming().count()
-        context["cohort_progress"] = self.get_cohort_progress()
-        context["current_cohorts"] = self.current_cohorts()
-        context["scheduled_semesters"] = list(self.scheduled_semesters())
+        context.update(get_snapshot())
         return context
 
 
@@ -127,9 +105,8 @@ class SchedulingView(LoginRequiredMixin, TemplateView):
         # TODO: how do we add advanced data science/reboot here?
         year = self.get_years()[0]
         table = {}
-        cohorts = Cohort.objects.filter(
-            Q(start__year=year) | Q(end__year=year)
-        ).order_by("start")
+        cohorts = Cohort.objects.overlaps(date(year, 1, 1), date(year, 12, 31))
+        cohorts = cohorts.order_by("start")
         for cohort in cohorts:
             dates = {}
             for course in cohort.courses.all():
@@ -149,6 +126,14 @@ class SchedulingView(LoginRequiredMixin, TemplateView):
         events = events.order_by("start").values_list("start", "summary")
         return {s[0].date(): s[1] for s in events}
 
+    def get_conflicts(self):
+        """
+        Returns the faculty members who are double-booked during the year.
+        """
+        year = self.get_years()[0]
+        conflicts = find_conflicts(date(year, 1, 1), date(year, 12, 31))
+        return group_by_faculty(conflicts)
+
     def get_context_data(self, **kwargs):
         context = super(SchedulingView, self).get_context_data(**kwargs)
         context["page"] = "scheduling"
@@ -156,6 +141,7 @@ class SchedulingView(LoginRequiredMixin, TemplateView):
         context["days"] = self.get_days()
         context["cohorts"] = self.get_cohorts()
         context["holidays"] = self.get_holidays()
+        context["conflicts"] = self.get_conflicts()
         return context
 
 
@@ -163,21 +149,113 @@ class SchedulingView(LoginRequiredMixin, TemplateView):
 ## API Views
 ##########################################################################
 
+class ReadOnlyAPIViewSet(viewsets.ReadOnlyModelViewSet):
+    """
+    Base viewset for read-only model endpoints whose serializer is a sparse model
+    serializer: only the related objects needed by the requested fields are fetched,
+    so every page is served in a fixed number of queries.
+    """
+
+    def get_queryset(self):
+        queryset = super(ReadOnlyAPIViewSet, self).get_queryset()
+        return self.get_serializer_class().optimize_queryset(queryset, self.request)
+
+
 class HeartbeatViewSet(viewsets.ViewSet):
     """
-    Endpoint for heartbeat checking, includes status and version.
+    Endpoint for heartbeat checking, includes status and version. The live and ready
+    endpoints are for liveness and readiness probes; only ready touches the database.
     """
 
     permission_classes = [AllowAny]
 
+    # Probes are anonymous so skip the session lookup
+    authentication_classes = []
+
     def list(self, request):
         return Response({
             "status": "ok",
-            "version": webfolio.get_version(),
+            "version": webfolio.__version__,
             "revision": webfolio.get_revision(short=True),
             "timestamp": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
         })
 
+    @action(detail=False)
+    def live(self, request):
+        return Response({"status": "ok"})
+
+    @action(detail=False)
+    def ready(self, request):
+        start = time.perf_counter()
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+                cursor.fetchone()
+        except DatabaseError:
+            return Response(
+                {"status": "unavailable"}, status=status.HTTP_503_SERVICE_UNAVAILABLE
+            )
+
+        return Response({
+            "status": "ok",
+            "database_ms": round((time.perf_counter() - start) * 1000, 3),
+        })
+
+
+class AvailabilityViewSet(viewsets.ViewSet):
+    """
+    Free/busy Saturdays in a year for the specified faculty members and cohorts, e.g.
+    ?year=2021&faculty=1,2&cohort=3 (holidays are busy unless holidays=false).
+    """
+
+    def list(self, request):
+        try:
+            year = int(request.query_params.get("year", date.today().year))
+            faculty = self.parse_ids(request.query_params.get("faculty"))
+            cohorts = self.parse_ids(request.query_params.get("cohort"))
+        except ValueError:
+            raise ParseError("year, faculty, and cohort must be integers")
+
+        # Leave room for the Saturdays that pad the first and last weeks of the year
+        if not MINYEAR < year < MAXYEAR:
+            raise ParseError(
+                "year must be between {} and {}".format(MINYEAR + 1, MAXYEAR - 1)
+            )
+
+        holidays = request.query_params.get("holidays", "true").lower()
+        holidays = not holidays.startswith("f")
+
+        availability = get_availability(year)
+        free = availability.free(faculty, cohorts, holidays)
+        return Response({
+            "year": year,
+            "faculty": faculty,
+            "cohorts": cohorts,
+            "free": availability.days(free),
+            "busy": availability.days(availability.full & ~free),
+            "holidays": availability.days(availability.holidays),
+        })
+
+    def parse_ids(self, value):
+        if not value:
+            return []
+        return [int(pk) for pk in value.split(",") if pk.strip()]
+
+
+class RosterViewSet(viewsets.ViewSet):
+    """
+    The faculty members assigned to currently active cohorts, e.g. for mailing lists.
+    """
+
+    def list(self, request):
+        roster = get_roster()
+        return Response({
+            "date": date.today(),
+            "count": len(roster),
+            "mailto": mailto(roster),
+            "faculty": roster,
+        })
+
 
 ##########################################################################
 ## Error Views
@@ -24,6 +24,7 @@ https://docs.djangoproject.com/en/3.0/howto/deployment/wsgi/
 
 import os
 import dotenv
+import webfolio
 
 from django.core.wsgi import get_wsgi_application
 
@@ -38,5 +39,8 @@ dotenv.load_dotenv(dotenv.find_dotenv())
 # set default environment variables
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "webfolio.settings.development")
 
+# resolve the revision at startup rather than on the first heartbeat
+webfolio.get_revision(short=True)
+
 # export the wsgi application for import
 application = get_wsgi_application()